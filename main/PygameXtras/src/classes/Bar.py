@@ -267,6 +267,20 @@ class Bar:
                 self.__borderradius,
             )
 
+    def __get_draw_state__(self) -> tuple:
+        # everything that affects the look of the widget (used by WidgetGroup)
+        return (
+            self.__backgroundcolor,
+            self.__fillcolor,
+            self.__bordercolor,
+            self.__borderwidth,
+            tuple(self.__r_background),
+            tuple(self.__r_filling),
+        )
+
+    def __get_draw_rect__(self) -> pygame.Rect:
+        return self.__r_background.copy()
+
     def update_colors(self, backgroundcolor=None, fillcolor=None, bordercolor=None):
         if backgroundcolor is not None:
             assert isinstance(self.__backgroundcolor, (tuple, list)), (
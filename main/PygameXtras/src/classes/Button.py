@@ -1,4 +1,5 @@
 import pygame
+from .EventRouter import EventRouter
 from .Label import Label
 
 
@@ -31,6 +32,7 @@ class Button(Label):
     def update(self, event_list, button: int = 1, offset: tuple = (0, 0)) -> bool:
         """
         Checks if button has been pressed and returns True if so.
+        <event_list> can also be an EventRouter.
         <button> can specify a certain button (1-3).
         <offset> will be subtracted from the current mouse position.
         """
@@ -47,6 +49,9 @@ class Button(Label):
             self.__is_touching__ = False
             return False
 
+        if isinstance(event_list, EventRouter):
+            event_list = event_list.mouse_up
+
         # managing the actual clicks
         for event in event_list:
             if event.type == pygame.MOUSEBUTTONUP:
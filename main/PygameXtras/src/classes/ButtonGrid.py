@@ -0,0 +1,139 @@
+import pygame
+
+from .Button import Button
+from .Entry import Entry
+from .EventRouter import EventRouter
+
+
+class ButtonGrid:
+    def __init__(self, cell_size: int = 64):
+        """
+        Updates many buttons at once. The buttons are stored in a uniform
+        grid (based on their background_rect), so clicks and hovering are
+        only checked for the buttons below the cursor instead of all of them.
+
+        Example (simplified):
+            grid = ButtonGrid()
+            grid.add(*buttons)
+            while True:
+                events = pygame.event.get()
+                for button in grid.update(events):
+                    ...  # button has been clicked
+
+        The result is the same as calling 'Button.update' on all buttons in
+        the order they were added (including the behaviour of
+        OneClickManagers and active areas).
+
+        IMPORTANT: after moving buttons, call self.refresh(...) with the
+        moved buttons, otherwise the grid will still use their old position.
+        Entries can not be added, since they also react to clicks elsewhere.
+        """
+        assert type(cell_size) == int, f"invalid argument for 'cell_size': {cell_size}"
+        assert cell_size > 0, f"invalid argument for 'cell_size': {cell_size}"
+        self.__cell_size = cell_size
+
+        self.__cells: dict[tuple[int, int], list[Button]] = {}
+        self.__order: dict[Button, int] = {}  # button -> order of registration
+        self.__indexed: dict[Button, list[tuple[int, int]]] = {}
+        self.__count = 0
+        self.__candidates: set[Button] = set()
+
+    def add(self, *buttons: Button):
+        """
+        Adds buttons to the grid.
+        """
+        for button in buttons:
+            assert isinstance(button, Button) and not isinstance(button, Entry), (
+                f"invalid argument for 'button': {button}"
+            )
+            if button in self.__order:
+                continue
+            self.__order[button] = self.__count
+            self.__count += 1
+            self.__insert(button)
+
+    def remove(self, *buttons: Button):
+        """
+        Removes buttons from the grid.
+        """
+        for button in buttons:
+            if button in self.__order:
+                self.__discard(button)
+                del self.__order[button]
+                self.__candidates.discard(button)
+
+    def refresh(self, *buttons: Button):
+        """
+        Updates the position of the given buttons within the grid. If no
+        buttons are given, all buttons are updated.
+        """
+        if len(buttons) == 0:
+            buttons = tuple(self.__order.keys())
+        for button in buttons:
+            if button in self.__order:
+                self.__discard(button)
+                self.__insert(button)
+
+    def get_buttons(self) -> list[Button]:
+        return list(self.__order.keys())
+
+    def update(
+        self, event_list, button: int = 1, offset: tuple = (0, 0)
+    ) -> list[Button]:
+        """
+        Updates all buttons and returns a list of the buttons that have been
+        clicked (in the order they were added).
+        <event_list> can also be an EventRouter.
+        <button> and <offset> work like in 'Button.update'.
+        """
+        assert type(offset) in [tuple, list], f"invalid argument for 'offset': {offset}"
+        assert len(offset) == 2, f"invalid argument for 'offset: {offset}"
+
+        if isinstance(event_list, EventRouter):
+            mouse_events = event_list.mouse_up
+        else:
+            mouse_events = [e for e in event_list if e.type == pygame.MOUSEBUTTONUP]
+
+        candidates: set[Button] = set()
+        for event in mouse_events:
+            candidates.update(self.__get_buttons_at(event.pos, offset))
+        candidates.update(self.__get_buttons_at(pygame.mouse.get_pos(), offset))
+
+        clicked = []
+        for b in sorted(candidates, key=self.__order.__getitem__):
+            if b.update(mouse_events, button, offset):
+                clicked.append(b)
+
+        # buttons that are not below the cursor anymore stop being highlighted
+        for b in self.__candidates - candidates:
+            b.__is_touching__ = False
+        self.__candidates = candidates
+
+        return clicked
+
+    def __get_cells(self, rect: pygame.Rect) -> list[tuple[int, int]]:
+        cs = self.__cell_size
+        return [
+            (x, y)
+            for x in range(rect.left // cs, rect.right // cs + 1)
+            for y in range(rect.top // cs, rect.bottom // cs + 1)
+        ]
+
+    def __get_buttons_at(self, pos, offset) -> list[Button]:
+        cell = (
+            int(pos[0] - offset[0]) // self.__cell_size,
+            int(pos[1] - offset[1]) // self.__cell_size,
+        )
+        return self.__cells.get(cell, [])
+
+    def __insert(self, button: Button):
+        cells = self.__get_cells(button.background_rect)
+        for cell in cells:
+            self.__cells.setdefault(cell, []).append(button)
+        self.__indexed[button] = cells
+
+    def __discard(self, button: Button):
+        for cell in self.__indexed.pop(button):
+            self.__cells[cell].remove(button)
+            if len(self.__cells[cell]) == 0:
+                del self.__cells[cell]
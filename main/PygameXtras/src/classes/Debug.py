@@ -27,7 +27,7 @@ class Debug:
     @staticmethod
     def render(screen: pygame.Surface) -> None:
         for i, message in enumerate(Debug.messages, 1):
-            Debug.label.update_pos((5, 5 + i * Debug.y_distance))
+            Debug.label.move_to((5, 5 + i * Debug.y_distance))
             Debug.label.update_text(f"{message}")
             Debug.label.draw_to(screen)
         Debug.messages.clear()
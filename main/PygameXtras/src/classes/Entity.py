@@ -1,5 +1,12 @@
-import pygame
+import ast
+import functools
 import math
+from typing import Callable
+
+import pygame
+
+from .RotationCache import RotationCache
+from .TileMap import TileMap
 
 
 class Entity(pygame.sprite.Sprite):
@@ -17,7 +24,10 @@ class Entity(pygame.sprite.Sprite):
 
         use PygameXtras.Spritesheet for images (in self.add_action(...))
         """
+        # pygame-ce resets image and rect in Sprite.__init__
+        image, rect = self.image, self.rect
         super().__init__()
+        self.image, self.rect = image, rect
 
         self.__entity_pos__ = [0, 0]
         self.rect = pygame.Rect(0, 0, self.rect.width, self.rect.height)
@@ -27,6 +37,7 @@ class Entity(pygame.sprite.Sprite):
         self.__hitbox_rect__ = pygame.Rect(0, 0, self.rect.width, self.rect.height)
 
         self.__game_map_tiles__ = None
+        self.__tile_map__ = None  # built from __game_map_tiles__ when needed
         self.__do_tile_collision__ = False
         self.__tile_sidelength__ = None
         self.__is_platformer__ = False
@@ -67,8 +78,11 @@ class Entity(pygame.sprite.Sprite):
         }
         self.__init_check_success__ = False
 
-        # contains the images, that are blitted next
-        self.__animation_sequence__ = []
+        # the action that is being played (None if it has ended), the index of its
+        # current image and how many frames that image has been shown for
+        self.__animation__ = None
+        self.__animation_index__ = 0
+        self.__animation_step__ = 0
 
         # current 'action', change with self.__set_action__()
         self.__action__ = None
@@ -89,9 +103,11 @@ class Entity(pygame.sprite.Sprite):
         self.__automatic_direction_control__ = True
         self.__direction_factor__ = 1  # -1 == left; 1 == right
         self.__rotation__ = 0
+        self.__rotation_step__ = 1  # rotations are rounded to multiples of this
         self.__rotation_point_right__ = (0, 0)
         self.__rotation_point_left__ = (0, 0)
         self.__temp_collision_rects__ = []
+        self.__world__ = None  # the EntityWorld updating this entity
 
     def __get_distance__(self, xy1, xy2, digits_after_comma=None):
         x1, y1 = xy1[0], xy1[1]
@@ -130,118 +146,61 @@ class Entity(pygame.sprite.Sprite):
         return math.floor(n * multiplier + 0.5) / multiplier
 
     def __reset_constant_movement_vector__(self):
-        self.__constant_movement_vector__ = self.__constant_movement_initial_vector__[:]
+        self.__constant_movement_vector__[:] = self.__constant_movement_initial_vector__
 
     def __move__(self):
-        # x movement ##########################################################################################
-
-        if self.__knockback_vector__[0] != 0:
-            self.__movement_vector__[0] += self.__knockback_vector__[0]
-            self.__knockback_vector__[0] = int(
-                self.__knockback_vector__[0] / self.__knockback_resistance__
+        self.__update_movement_vector__(0)
+        self.__update_movement_vector__(1)
+        self.__apply_movement__()
+
+    def __update_movement_vector__(self, axis: int):
+        """adds knockback and constant movement to the movement vector"""
+        if self.__knockback_vector__[axis] != 0:
+            self.__movement_vector__[axis] += self.__knockback_vector__[axis]
+            self.__knockback_vector__[axis] = int(
+                self.__knockback_vector__[axis] / self.__knockback_resistance__
             )
 
         if self.__constant_movement_affection__:
-            self.__movement_vector__[0] += self.__constant_movement_vector__[0]
+            self.__movement_vector__[axis] += self.__constant_movement_vector__[axis]
 
             if (
-                self.__movement_vector__[0] > 0
-                and self.__constant_movement_vector__[0] > 0
+                self.__movement_vector__[axis] > 0
+                and self.__constant_movement_vector__[axis] > 0
             ) or (
-                self.__movement_vector__[0] < 0
-                and self.__constant_movement_vector__[0] < 0
+                self.__movement_vector__[axis] < 0
+                and self.__constant_movement_vector__[axis] < 0
             ):
-                self.__constant_movement_vector__[0] += (
-                    self.__constant_movement_initial_vector__[0]
+                self.__constant_movement_vector__[axis] += (
+                    self.__constant_movement_initial_vector__[axis]
                 )
             else:
-                self.__constant_movement_vector__[0] = (
-                    self.__constant_movement_initial_vector__[0]
+                self.__constant_movement_vector__[axis] = (
+                    self.__constant_movement_initial_vector__[axis]
                 )
 
             # limits the vector to its maximum value
-            if self.__constant_movement_max_vector__[0] > 0:
+            if self.__constant_movement_max_vector__[axis] > 0:
                 if (
-                    self.__constant_movement_vector__[0]
-                    > self.__constant_movement_max_vector__[0]
+                    self.__constant_movement_vector__[axis]
+                    > self.__constant_movement_max_vector__[axis]
                 ):
-                    self.__constant_movement_vector__[0] = (
-                        self.__constant_movement_max_vector__[0]
+                    self.__constant_movement_vector__[axis] = (
+                        self.__constant_movement_max_vector__[axis]
                     )
-            elif self.__constant_movement_max_vector__[0] < 0:
+            elif self.__constant_movement_max_vector__[axis] < 0:
                 if (
-                    self.__constant_movement_vector__[0]
-                    < self.__constant_movement_max_vector__[0]
+                    self.__constant_movement_vector__[axis]
+                    < self.__constant_movement_max_vector__[axis]
                 ):
-                    self.__constant_movement_vector__[0] = (
-                        self.__constant_movement_max_vector__[0]
+                    self.__constant_movement_vector__[axis] = (
+                        self.__constant_movement_max_vector__[axis]
                     )
 
-        self.rect.x += self.__movement_vector__[0]
+    def __apply_movement__(self):
+        """moves the entity by its movement vector (x first, then y)"""
         self.__adjust_hitbox_position__()
-        if self.__do_tile_collision__:
-            surrounding_tiles = self.__get_tiles_within_radius__(
-                self.__game_map_tiles__,
-                self.get_pos_factor(1 / self.__tile_sidelength__),
-            )
-            if len(self.__temp_collision_rects__) > 0:
-                surrounding_tiles += self.__temp_collision_rects__
-            collided_tiles = self.__tile_collision_test__(surrounding_tiles)
-            for tile in collided_tiles:
-                if self.__movement_vector__[0] > 0:
-                    self.__hitbox_rect__.right = tile.left
-                elif self.__movement_vector__[0] < 0:
-                    self.__hitbox_rect__.left = tile.right
-                self.__adjust_rect_position__()
-                self.__constant_movement_vector__[0] = (
-                    self.__constant_movement_initial_vector__[0]
-                )
-                self.__knockback_vector__[0] = 0
-        self.__movement_vector__[0] = 0
-
-        # y movement ##########################################################################################
-
-        if self.__knockback_vector__[1] != 0:
-            self.__movement_vector__[1] += self.__knockback_vector__[1]
-            self.__knockback_vector__[1] = int(
-                self.__knockback_vector__[1] / self.__knockback_resistance__
-            )
-
-        if self.__constant_movement_affection__:
-            self.__movement_vector__[1] += self.__constant_movement_vector__[1]
-
-            if (
-                self.__movement_vector__[1] > 0
-                and self.__constant_movement_vector__[1] > 0
-            ) or (
-                self.__movement_vector__[1] < 0
-                and self.__constant_movement_vector__[1] < 0
-            ):
-                self.__constant_movement_vector__[1] += (
-                    self.__constant_movement_initial_vector__[1]
-                )
-            else:
-                self.__constant_movement_vector__[1] = (
-                    self.__constant_movement_initial_vector__[1]
-                )
-
-            # limits the vector to its maximum value
-            if self.__constant_movement_max_vector__[1] > 0:
-                if (
-                    self.__constant_movement_vector__[1]
-                    > self.__constant_movement_max_vector__[1]
-                ):
-                    self.__constant_movement_vector__[1] = (
-                        self.__constant_movement_max_vector__[1]
-                    )
-            elif self.__constant_movement_max_vector__[1] < 0:
-                if (
-                    self.__constant_movement_vector__[1]
-                    < self.__constant_movement_max_vector__[1]
-                ):
-                    self.__constant_movement_vector__[1] = (
-                        self.__constant_movement_max_vector__[1]
-                    )
+        self.__move_along_axis__(0)
 
         if self.__is_platformer__:
             # moving the list by one
@@ -252,34 +211,40 @@ class Entity(pygame.sprite.Sprite):
 
             self.__data__["is_touching_ground_list"][0] = False
             old_y = self.rect.y
-        self.rect.y += self.__movement_vector__[1]
-        self.__adjust_hitbox_position__()
-        if self.__do_tile_collision__:
-            surrounding_tiles = self.__get_tiles_within_radius__(
-                self.__game_map_tiles__,
-                self.get_pos_factor(1 / self.__tile_sidelength__),
-            )
-            if len(self.__temp_collision_rects__) > 0:
-                surrounding_tiles += self.__temp_collision_rects__
-            collided_tiles = self.__tile_collision_test__(surrounding_tiles)
-            for tile in collided_tiles:
-                if self.__movement_vector__[1] > 0:
-                    self.__hitbox_rect__.bottom = tile.top
-                elif self.__movement_vector__[1] < 0:
-                    self.__hitbox_rect__.top = tile.bottom
-                self.__adjust_rect_position__()
-                self.__constant_movement_vector__[1] = (
-                    self.__constant_movement_initial_vector__[1]
-                )
-                self.__knockback_vector__[1] = 0
-
+        self.__move_along_axis__(1)
         if self.__is_platformer__:
             if old_y == self.rect.y:
                 self.__data__["is_touching_ground_list"][0] = True
-        self.__movement_vector__[1] = 0
 
         self.__temp_collision_rects__ = []
 
+    def __move_along_axis__(self, axis: int):
+        old_hitbox = self.__hitbox_rect__.copy()
+        if axis == 0:
+            self.rect.x += self.__movement_vector__[0]
+        else:
+            self.rect.y += self.__movement_vector__[1]
+        self.__adjust_hitbox_position__()
+        if self.__do_tile_collision__:
+            tile = self.__get_blocking_tile__(old_hitbox, axis)
+            if tile is not None:
+                if axis == 0:
+                    if self.__movement_vector__[0] > 0:
+                        self.__hitbox_rect__.right = tile.left
+                    elif self.__movement_vector__[0] < 0:
+                        self.__hitbox_rect__.left = tile.right
+                else:
+                    if self.__movement_vector__[1] > 0:
+                        self.__hitbox_rect__.bottom = tile.top
+                    elif self.__movement_vector__[1] < 0:
+                        self.__hitbox_rect__.top = tile.bottom
+                self.__adjust_rect_position__()
+                self.__constant_movement_vector__[axis] = (
+                    self.__constant_movement_initial_vector__[axis]
+                )
+                self.__knockback_vector__[axis] = 0
+        self.__movement_vector__[axis] = 0
+
     def __update_data__(self):
         self.__data__["old_center"] = self.__data__["center"]
         self.__data__["center"] = self.get_pos()
@@ -316,22 +281,19 @@ class Entity(pygame.sprite.Sprite):
         self.__action_run_timer__ += 1
 
         static_image = False  # ! not tested (15.2.2022, 11:57)
-        if self.__animation_sequence__ == []:
-            if len(self.__actions__[self.__looping_action__]["frames"]) == 1:
+        if self.__animation__ is None:
+            looping_action = self.__actions__[self.__looping_action__]
+            if looping_action["frame_count"] == 1:
                 static_image = True
-                next_image = self.__actions__[self.__looping_action__]["frames"][0][
-                    self.__data__["direction"]
-                ]
+                next_image = looping_action["images"][0][self.__data__["direction"]]
             else:
-                self.__animation_sequence__ += self.__actions__[
-                    self.__looping_action__
-                ]["frames"]
-                self.__action_run_timer__ = 0
-                self.__current_action__ = self.__looping_action__
+                self.__start_animation__(self.__looping_action__)
 
         if not static_image:
             try:
-                next_image = self.__animation_sequence__[0][self.__data__["direction"]]
+                next_image = self.__animation__["images"][self.__animation_index__][
+                    self.__data__["direction"]
+                ]
             except TypeError:
                 raise Exception(
                     "At least some elements of the action '"
@@ -339,7 +301,11 @@ class Entity(pygame.sprite.Sprite):
                     + "' are not formatted correctly. Make sure that all elements are in the form of a dict: \n{'left': <image_left>, 'right': <image_right>}"
                 )
 
-        if self.__rotation__ != 0:  # ! not tested (15.2.2022, 11:47)
+        step = self.__rotation_step__
+        rotation = 0
+        if self.__rotation__ != 0:
+            rotation = int(self.__rhu__(self.__rotation__ / step)) * step
+        if rotation % 360 != 0:  # ! not tested (15.2.2022, 11:47)
             blue_vect = pygame.Vector2(
                 self.__rotation_point_right__[0] * self.get_direction_factor(),
                 self.__rotation_point_right__[1],
@@ -348,13 +314,11 @@ class Entity(pygame.sprite.Sprite):
                 self.__rotation_point_right__[0] * self.get_direction_factor(),
                 self.__rotation_point_right__[1],
             )
-            new_vect = blue_vect.rotate(
-                -self.__rotation__ * self.get_direction_factor()
-            )
-            next_image = pygame.transform.rotate(
-                next_image, self.__rotation__ * self.get_direction_factor()
+            new_vect = blue_vect.rotate(-rotation * self.get_direction_factor())
+            next_image = RotationCache.rotate(
+                next_image, rotation * self.get_direction_factor()
             )
-            self.rect = self.image.get_rect(center=saved_center - new_vect)
+            self.rect = next_image.get_rect(center=saved_center - new_vect)
 
         # ? check hitbox stuff
         # ? check pygame.mask
@@ -362,50 +326,87 @@ class Entity(pygame.sprite.Sprite):
         self.image = next_image
 
         if not static_image:
-            del self.__animation_sequence__[0]
+            self.__advance_animation__()
 
-    def __execute_action_methods__(self):
+    def __start_animation__(self, action: str):
+        self.__animation__ = self.__actions__[action]
+        self.__animation_index__ = 0
+        self.__animation_step__ = 0
+        self.__action_run_timer__ = 0
+        self.__current_action__ = action
+
+    def __advance_animation__(self):
+        self.__animation_step__ += 1
         if (
-            self.__action_run_timer__
-            in self.__actions__[self.__current_action__]["methods_to_execute"].keys()
+            self.__animation_step__
+            == self.__animation__["durations"][self.__animation_index__]
         ):
-            string = (
-                "self."
-                + self.__actions__[self.__current_action__]["methods_to_execute"][
-                    self.__action_run_timer__
-                ]
-            )
+            self.__animation_step__ = 0
+            self.__animation_index__ += 1
+            if self.__animation_index__ == len(self.__animation__["images"]):
+                self.__animation__ = None
+
+    def __execute_action_methods__(self):
+        callback = self.__actions__[self.__current_action__]["callbacks"].get(
+            self.__action_run_timer__, None
+        )
+        if callback is not None:
             try:
-                exec(string)
+                callback()
             except Exception as e:
                 raise Exception(
                     f"An error occurred while executing a method from the action '{self.__current_action__}':\n\n{e}"
                 )
 
-    def __tile_collision_test__(self, tiles: list) -> list:
+    def __tile_collision_test__(self, tiles: list, rect: pygame.Rect = None) -> list:
         """not very precise, should only be used for movement"""
-        collisions = []
+        if rect is None:
+            rect = self.__hitbox_rect__
+        return [tiles[i] for i in rect.collidelistall(tiles)]
+
+    def __get_tile_map__(self) -> TileMap | None:
+        if self.__tile_map__ is None and self.__game_map_tiles__ is not None:
+            self.__tile_map__ = TileMap(
+                self.__game_map_tiles__, self.__tile_sidelength__
+            )
+        return self.__tile_map__
+
+    def __get_blocking_tile__(self, old_hitbox: pygame.Rect, axis: int):
+        """returns the first tile hit while moving from <old_hitbox> to the current
+        hitbox along <axis> (0 = x, 1 = y), also for movements of several tiles"""
+        hitbox = self.__hitbox_rect__
+        swept = hitbox.union(old_hitbox)
+        tile_map = self.__get_tile_map__()
+        tiles = tile_map.get_tiles(swept) if tile_map is not None else []
+        if len(self.__temp_collision_rects__) > 0:
+            tiles += self.__tile_collision_test__(self.__temp_collision_rects__, swept)
+
+        movement = self.__movement_vector__[axis]
+        blocking = None
         for tile in tiles:
-            if self.__hitbox_rect__.colliderect(tile):
-                collisions.append(tile)
-        return collisions
-
-    def __get_tiles_within_radius__(
-        self, tiles_in_2d: list[list], xy: tuple, radius: int = 2
-    ) -> list:
-        """gets awfully inefficient with increasing radius, but 2 should be sufficient for everything"""
-        # automatically avoids crossing game borders
-        tiles = []
-        for x in range(
-            max(int(xy[0]) - radius, 0), min(int(xy[0]) + radius, len(tiles_in_2d))
-        ):
-            for y in range(
-                max(int(xy[1]) - radius, 0),
-                min(int(xy[1]) + radius, len(tiles_in_2d[0])),
-            ):
-                if tiles_in_2d[x][y] != 0:
-                    tiles.append(tiles_in_2d[x][y])
-        return tiles
+            if axis == 0:
+                low, high = tile.left, tile.right
+                old_low, old_high = old_hitbox.left, old_hitbox.right
+            else:
+                low, high = tile.top, tile.bottom
+                old_low, old_high = old_hitbox.top, old_hitbox.bottom
+            if movement > 0:
+                # tiles in front of the old hitbox or touching the new one
+                if low >= old_high or hitbox.colliderect(tile):
+                    if blocking is None or low < blocking[0]:
+                        blocking = (low, tile)
+            elif movement < 0:
+                if high <= old_low or hitbox.colliderect(tile):
+                    if blocking is None or high > blocking[0]:
+                        blocking = (high, tile)
+            elif hitbox.colliderect(tile):
+                return tile
+        return blocking[1] if blocking is not None else None
+
+    def __refresh_world__(self):
+        # tells the EntityWorld (if any) that a setting has changed
+        if self.__world__ is not None:
+            self.__world__.__refresh__(self)
 
     def __adjust_hitbox_position__(self):
         self.__hitbox_rect__.topleft = (
@@ -428,6 +429,9 @@ class Entity(pygame.sprite.Sprite):
     def internal_update(self):
         """needs to be called at the end of the entities .move method \n
         methods can also be called individually"""
+        assert self.__world__ is None, (
+            "entity belongs to an EntityWorld (use EntityWorld.update instead)"
+        )
         if self.__init_check_success__ == False:
             self.__init_check_func__()
             self.__init_check_success__ = True
@@ -442,17 +446,24 @@ class Entity(pygame.sprite.Sprite):
         name: str,
         image_dicts: list,
         frames_per_image: list[int],
-        methods_to_execute: dict[str:str] = None,
+        methods_to_execute: dict[int, str | Callable] = None,
     ):
         """
         image_dicts: dicts of image ("left":..., "right":...)
         frames_per_image can be either a list or an int \n
+        methods_to_execute: {<frame>: "method(*args)" or a callable (without arguments)} \n
         adds an action to self.__actions__ in the following form:
         {
             "<action_name>": {
-                "frames": ["<frame0>", "<frame1>", "<frame2>", ...],
+                "images": ["<image_dict0>", "<image_dict1>", ...],
+                "durations": [<frames0>, <frames1>, ...],
+                "frame_count": <sum of durations>,
                 "methods_to_execute": {
-                    "<frame>": "self.method(*args)",
+                    "<frame>": "method(*args)",
+                    ...
+                },
+                "callbacks": {
+                    "<frame>": <callable>,
                     ...
                 }
             }
@@ -463,68 +474,105 @@ class Entity(pygame.sprite.Sprite):
                 "received lists of different lengths"
             )
 
-        # creating list
-        frame_sequence = []
-        if type(frames_per_image) == list:
-            for image, count in zip(image_dicts, frames_per_image):
-                for i in range(count):
-                    frame_sequence.append(image)
-        elif type(frames_per_image) == int:
-            for image in image_dicts:
-                for i in range(frames_per_image):
-                    frame_sequence.append(image)
+        # every image is shown for a number of frames (images shown for 0 frames
+        # are left out)
+        if type(frames_per_image) == int:
+            frames_per_image = [frames_per_image] * len(image_dicts)
+        images = []
+        durations = []
+        for image, count in zip(image_dicts, frames_per_image):
+            if count > 0:
+                images.append(image)
+                durations.append(count)
+        assert sum(durations) > 0, (
+            f"action '{name}' has no frames (all images are shown for 0 frames)"
+        )
 
         # adding "methods_to_execute" functionality
-        self._layer = None  # dont ask why this is here, but it crashes if it isnt
+        callbacks = {}
         if methods_to_execute != None:
-            method_list = [
-                func
-                for func in dir(self)
-                if callable(getattr(self, func)) and not func.startswith("__")
-            ]  # "set_action", ...
             for k, v in methods_to_execute.items():
                 if type(k) != int:
                     raise ValueError(
                         f"Error in 'methods_to_execute': '{k}' is not a number"
                     )
-                if (
-                    v.split("(")[0] not in method_list
-                ):  # ) avoid brackets changing colors
-                    # ! not sure if this works as intended
-                    raise Exception(
-                        f"Error in 'methods_to_execute': '{v.split('(')[0]}' is not a valid method"
-                    )  # )
+                callbacks[k] = self.__compile_action_method__(v)
         else:
             methods_to_execute = {}
 
         self.__actions__[name] = {
-            "frames": frame_sequence,
+            "images": images,
+            "durations": durations,
+            "frame_count": sum(durations),
             "methods_to_execute": methods_to_execute,
+            "callbacks": callbacks,
         }
         self.__init_check__["self.add_action"] = True
 
+    def __compile_action_method__(self, method: str | Callable) -> Callable:
+        """turns "method(*args)" into a callable (once, when the action is added)"""
+        if callable(method):
+            return method
+        name = method.split("(")[0]  # ) avoid brackets changing colors
+        if name.startswith("__") or not callable(getattr(self, name, None)):
+            raise Exception(
+                f"Error in 'methods_to_execute': '{name}' is not a valid method"
+            )
+        try:
+            code = compile("self." + method, f"<action method '{method}'>", "eval")
+        except SyntaxError:
+            raise Exception(f"Error in 'methods_to_execute': invalid call '{method}'")
+
+        expression = ast.parse(method, mode="eval").body
+        if (
+            isinstance(expression, ast.Call)
+            and isinstance(expression.func, ast.Name)
+            and all(self.__is_immutable_literal__(arg) for arg in expression.args)
+            and all(
+                kw.arg is not None and self.__is_immutable_literal__(kw.value)
+                for kw in expression.keywords
+            )
+        ):
+            # constant arguments are bound directly (mutable ones like lists
+            # would be shared between calls, so they are evaluated every time)
+            args = [ast.literal_eval(arg) for arg in expression.args]
+            kwargs = {kw.arg: ast.literal_eval(kw.value) for kw in expression.keywords}
+            return functools.partial(getattr(self, name), *args, **kwargs)
+
+        # any other expression is evaluated on every call (compiled only once)
+        scope = {"self": self}
+        return lambda: eval(code, globals(), scope)
+
+    def __is_immutable_literal__(self, node: ast.expr) -> bool:
+        """numbers, strings, bytes, booleans, None and tuples of them"""
+        if isinstance(node, ast.Constant):
+            return True
+        if isinstance(node, ast.UnaryOp) and isinstance(node.op, (ast.USub, ast.UAdd)):
+            return isinstance(node.operand, ast.Constant) and type(
+                node.operand.value
+            ) in (int, float, complex)
+        if isinstance(node, ast.Tuple):
+            return all(self.__is_immutable_literal__(element) for element in node.elts)
+        return False
+
     def set_looping_action(self, action: str, cancel_other_action: bool = True) -> None:
         assert action in self.__actions__.keys(), f"unknown action: '{action}'"
         if cancel_other_action and self.__looping_action__ != action:
-            self.__animation_sequence__ = []
-            self.__animation_sequence__ += self.__actions__[action]["frames"]
-            self.__action_run_timer__ = 0
-            self.__current_action__ = action
+            self.__start_animation__(action)
         self.__looping_action__ = action
         self.__init_check__["self.set_looping_action"] = True
 
     def set_action(self, action: str, cancel_other_action: bool = True) -> None:
         assert action in self.__actions__.keys(), f"unknown action: '{action}'"
         if cancel_other_action and self.__current_action__ != action:
-            self.__animation_sequence__ = []
-            self.__animation_sequence__ += self.__actions__[action]["frames"]
-            self.__action_run_timer__ = 0
-            self.__current_action__ = action
+            self.__start_animation__(action)
         self.__action__ = action
 
     def get_data(self, name: str):
         """access useful data like "has_moved", "last_movement", etc."""
         assert name in self.__data__.keys(), f"no entry in __data__ for '{name}'"
+        if self.__world__ is not None:
+            self.__world__.__sync__(self)
         return self.__data__[name]
 
     def set_speed(self, speed: float):
@@ -796,17 +844,29 @@ class Entity(pygame.sprite.Sprite):
         """same as self.set_pos()"""
         self.set_pos(xy, reference_point)
 
-    def set_game_map_tiles(self, tiles: list[list], do_tile_collision: bool = True):
-        """<tiles> must be a 2d list of pygame.Rect objects"""
-        assert type(tiles) == list, "failed to load map tiles"
-        assert type(tiles[0]) == list, "failed to load map tiles"
+    def set_game_map_tiles(
+        self, tiles: list[list] | TileMap, do_tile_collision: bool = True
+    ):
+        """<tiles> must be a 2d list of pygame.Rect objects (0 for empty tiles) or a
+        TileMap \n
+        a 2d list is turned into a TileMap once, call this method again after changing
+        it; entities sharing a map should share a TileMap"""
         assert type(do_tile_collision) == bool
-        self.__game_map_tiles__ = tiles
+        if isinstance(tiles, TileMap):
+            self.__game_map_tiles__ = None
+            self.__tile_map__ = tiles
+        else:
+            assert type(tiles) == list, "failed to load map tiles"
+            assert type(tiles[0]) == list, "failed to load map tiles"
+            self.__game_map_tiles__ = tiles
+            self.__tile_map__ = None
         self.__do_tile_collision__ = do_tile_collision
+        self.__refresh_world__()
 
     def set_tile_collision(self, boolean: bool, tile_sidelength: int = None):
         assert type(boolean) == bool
         self.__do_tile_collision__ = boolean
+        self.__refresh_world__()
         if boolean == True:
             assert tile_sidelength != None, (
                 "if tile_collision should be done, tile_sidelength needs to be set"
@@ -839,17 +899,21 @@ class Entity(pygame.sprite.Sprite):
         assert len(max_vector2) == 2, f"invalid vector ({max_vector2})"
         assert type(set_constant_movement_affection) == bool
 
-        self.__constant_movement_vector__ = list(vector2)
-        self.__constant_movement_max_vector__ = list(max_vector2)
-        self.__constant_movement_initial_vector__ = list(vector2)
+        # assigned in place, the vectors might be shared with an EntityWorld
+        self.__constant_movement_vector__[:] = vector2[0], vector2[1]
+        self.__constant_movement_max_vector__[:] = max_vector2[0], max_vector2[1]
+        self.__constant_movement_initial_vector__[:] = vector2[0], vector2[1]
         self.set_constant_movement_affection(set_constant_movement_affection)
 
     def get_constant_movement(self):
-        return self.__constant_movement_vector__
+        if self.__world__ is not None:
+            return self.__world__.__to_list__(self.__constant_movement_vector__)
+        return list(self.__constant_movement_vector__)
 
     def set_constant_movement_affection(self, boolean):
         assert type(boolean) == bool
         self.__constant_movement_affection__ = boolean
+        self.__refresh_world__()
 
     def get_constant_movement_affection(self):
         return self.__constant_movement_affection__
@@ -878,6 +942,7 @@ class Entity(pygame.sprite.Sprite):
             "knockback_resistance must be between 1 and 1.2"
         )
         self.__knockback_resistance__ = knockback_resistance
+        self.__refresh_world__()
 
     def get_knockback_resistance(self):
         """returns the number the knockback vector gets divided by"""
@@ -895,7 +960,7 @@ class Entity(pygame.sprite.Sprite):
             "knockback_resistance must be between 1 and 1.2"
         )
 
-        self.__knockback_vector__ = list(vector2)
+        self.__knockback_vector__[:] = vector2[0], vector2[1]
         if reset_constant_movement:
             self.__reset_constant_movement_vector__()
 
@@ -911,10 +976,8 @@ class Entity(pygame.sprite.Sprite):
             "knockback_resistance must be between 1 and 1.2 "
         )
 
-        self.__knockback_vector__ = [
-            self.__knockback_vector__[0] + vector2[0],
-            self.__knockback_vector__[1] + vector2[1],
-        ]
+        self.__knockback_vector__[0] += vector2[0]
+        self.__knockback_vector__[1] += vector2[1]
 
     def move_at_angle(self, angle, custom_speed=None):
         """0 degrees = right | then clockwise"""
@@ -930,6 +993,8 @@ class Entity(pygame.sprite.Sprite):
     def set_tile_sidelength(self, tile_sidelength: int):
         assert type(tile_sidelength) == int
         self.__tile_sidelength__ = tile_sidelength
+        if self.__game_map_tiles__ is not None:
+            self.__tile_map__ = None  # rebuilt with the new sidelength
 
     def set_platformer_status(
         self, is_platformer: bool, set_touching_ground_precision: int = 3
@@ -953,11 +1018,13 @@ class Entity(pygame.sprite.Sprite):
         self.__data__["is_touching_ground_list"] = [
             False for i in range(self.__is_touching_ground_precision__)
         ]  # [new, old, older, ...]
+        self.__refresh_world__()
 
     def set_automatic_direction_control(self, boolean: bool):
         """automatically sets the direction of the entity based on its movement"""
         assert type(boolean) == bool
         self.__automatic_direction_control__ = boolean
+        self.__refresh_world__()
 
     def set_direction(self, direction):
         """<direction> can be either "left" and "right" or -1 and 1"""
@@ -968,6 +1035,7 @@ class Entity(pygame.sprite.Sprite):
         elif direction in ["right", 1]:
             self.__data__["direction"] = "right"
             self.__direction_factor__ = 1
+        self.__refresh_world__()
 
     def get_direction(self):
         return self.get_data("direction")
@@ -999,6 +1067,17 @@ class Entity(pygame.sprite.Sprite):
         """returns the current rotation"""
         return self.__rotation__
 
+    def set_rotation_step(self, step: int):
+        """rotations are rounded to multiples of <step> degrees when the image is
+        rotated; larger steps mean less rotated images (see RotationCache)"""
+        assert type(step) == int and 1 <= step <= 180, (
+            f"invalid argument for 'step': {step}"
+        )
+        self.__rotation_step__ = step
+
+    def get_rotation_step(self):
+        return self.__rotation_step__
+
     def do_platformer_jump(self, factor: float):
         self.__constant_movement_vector__[1] = factor
 
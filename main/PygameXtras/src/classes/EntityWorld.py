@@ -0,0 +1,286 @@
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+from .Entity import Entity
+
+
+class EntityWorld:
+    """
+    Updates many entities at once.
+
+    The movement, knockback and constant movement vectors, the positions
+    and the movement data ("center", "old_center", "last_movement",
+    "has_moved", ...) of all added entities are stored in numpy arrays, so
+    they are advanced in one vectorized step instead of one entity at a
+    time. Only entities with tile collision (or platformer features) are
+    moved one by one, all others are moved with a single array operation
+    and their rects are written back in one pass. The movement data is
+    copied into an entity only when it is requested with get_data.
+
+    Call EntityWorld.update once per frame instead of calling
+    Entity.internal_update for every entity (calling internal_update on an
+    entity of a world is not supported, remove it from the world first).
+    All other methods of the entities can be used as usual. Animations and action methods are still updated
+    per entity, so the world is fastest for entities without tile
+    collision (see test/benchmark_entity_world.py).
+
+    Requires numpy (pip install PygameXtras[numpy]).
+    """
+
+    def __init__(self, capacity: int = 64):
+        if np is None:
+            raise ImportError("EntityWorld requires numpy (pip install numpy)")
+        assert type(capacity) == int and capacity > 0, (
+            f"invalid argument for 'capacity': {capacity}"
+        )
+        self.__entities: list[Entity] = []
+        self.__rows: dict[int, int] = {}  # id(entity) -> row
+        self.__unchecked: list[Entity] = []  # added or changed since the last update
+        self.__arrays: dict[str, np.ndarray] = {}
+        self.__allocate(capacity)
+
+    def __allocate(self, capacity: int):
+        arrays = {
+            # vectors (the entities use views of their rows)
+            "movement": np.zeros((capacity, 2)),
+            "knockback": np.zeros((capacity, 2)),
+            "constant": np.zeros((capacity, 2)),
+            "constant_initial": np.zeros((capacity, 2)),
+            "constant_max": np.zeros((capacity, 2)),
+            # settings
+            "resistance": np.ones(capacity),
+            "affection": np.zeros(capacity, dtype=bool),
+            "collision": np.zeros(capacity, dtype=bool),
+            "automatic_direction": np.zeros(capacity, dtype=bool),
+            # movement data
+            "direction": np.ones(capacity, dtype=np.int8),
+            "center": np.zeros((capacity, 2)),
+            "old_center": np.zeros((capacity, 2)),
+            "synced": np.ones(capacity, dtype=bool),  # data copied into the entity
+        }
+        count = len(self.__entities)
+        for name, array in self.__arrays.items():
+            arrays[name][:count] = array[:count]
+        self.__arrays = arrays
+        for row, entity in enumerate(self.__entities):
+            self.__bind(entity, row)
+
+    def __bind(self, entity: Entity, row: int):
+        # the entity keeps working on its vectors, which are now rows of the arrays
+        arrays = self.__arrays
+        entity.__movement_vector__ = arrays["movement"][row]
+        entity.__knockback_vector__ = arrays["knockback"][row]
+        entity.__constant_movement_vector__ = arrays["constant"][row]
+        entity.__constant_movement_initial_vector__ = arrays["constant_initial"][row]
+        entity.__constant_movement_max_vector__ = arrays["constant_max"][row]
+
+    @staticmethod
+    def __to_list__(vector) -> list:
+        # numpy stores every value as a float, whole numbers become ints again
+        return [int(v) if v.is_integer() else v for v in vector.tolist()]
+
+    def __refresh__(self, entity: Entity):
+        # called by the entity when one of its settings has changed
+        row = self.__rows[id(entity)]
+        arrays = self.__arrays
+        arrays["resistance"][row] = entity.__knockback_resistance__
+        arrays["affection"][row] = entity.__constant_movement_affection__
+        arrays["collision"][row] = (
+            entity.__do_tile_collision__ or entity.__is_platformer__
+        )
+        arrays["automatic_direction"][row] = entity.__automatic_direction_control__
+        arrays["direction"][row] = entity.__direction_factor__
+        if entity not in self.__unchecked:
+            # "is_touching_ground" is updated during the next update
+            self.__unchecked.append(entity)
+
+    def __sync__(self, entity: Entity):
+        # copies the movement data into the entity (see Entity.get_data)
+        row = self.__rows[id(entity)]
+        if self.__arrays["synced"][row]:
+            return
+        self.__arrays["synced"][row] = True
+        center = tuple(int(v) for v in self.__arrays["center"][row].tolist())
+        old_center = tuple(int(v) for v in self.__arrays["old_center"][row].tolist())
+        last_movement = (center[0] - old_center[0], center[1] - old_center[1])
+        data = entity.__data__
+        data["old_center"] = old_center
+        data["center"] = center
+        data["last_movement"] = last_movement
+        data["has_moved_left"] = last_movement[0] < 0
+        data["has_moved_right"] = last_movement[0] > 0
+        data["has_moved_up"] = last_movement[1] < 0
+        data["has_moved_down"] = last_movement[1] > 0
+        data["has_moved"] = last_movement != (0, 0)
+
+    def add(self, entity: Entity):
+        """
+        Adds <entity> to the world.
+        """
+        assert isinstance(entity, Entity), f"invalid argument for 'entity': {entity}"
+        assert entity.__world__ is None, "entity already belongs to a world"
+        row = len(self.__entities)
+        if row == len(self.__arrays["resistance"]):
+            self.__allocate(row * 2)
+
+        arrays = self.__arrays
+        arrays["movement"][row] = entity.__movement_vector__
+        arrays["knockback"][row] = entity.__knockback_vector__
+        arrays["constant"][row] = entity.__constant_movement_vector__
+        arrays["constant_initial"][row] = entity.__constant_movement_initial_vector__
+        arrays["constant_max"][row] = entity.__constant_movement_max_vector__
+        arrays["center"][row] = entity.__data__["center"]
+        arrays["old_center"][row] = entity.__data__["old_center"]
+        arrays["synced"][row] = True
+        self.__entities.append(entity)
+        self.__rows[id(entity)] = row
+        self.__bind(entity, row)
+        entity.__world__ = self
+        self.__refresh__(entity)
+
+    def remove(self, entity: Entity):
+        """
+        Removes <entity> from the world. Its vectors and data are copied
+        back into the entity.
+        """
+        assert entity.__world__ is self, "entity does not belong to this world"
+        self.__sync__(entity)
+        row = self.__rows.pop(id(entity))
+        entity.__movement_vector__ = self.__to_list__(entity.__movement_vector__)
+        entity.__knockback_vector__ = self.__to_list__(entity.__knockback_vector__)
+        entity.__constant_movement_vector__ = self.__to_list__(
+            entity.__constant_movement_vector__
+        )
+        entity.__constant_movement_initial_vector__ = self.__to_list__(
+            entity.__constant_movement_initial_vector__
+        )
+        entity.__constant_movement_max_vector__ = self.__to_list__(
+            entity.__constant_movement_max_vector__
+        )
+        entity.__world__ = None
+        if entity in self.__unchecked:
+            self.__unchecked.remove(entity)
+
+        # the last entity takes the free row
+        last = self.__entities.pop()
+        if last is not entity:
+            for array in self.__arrays.values():
+                array[row] = array[len(self.__entities)]
+            self.__entities[row] = last
+            self.__rows[id(last)] = row
+            self.__bind(last, row)
+
+    def get_entities(self) -> list[Entity]:
+        """
+        Returns all entities of the world.
+        """
+        return self.__entities[:]
+
+    def __len__(self) -> int:
+        return len(self.__entities)
+
+    def __update_movement_vectors(self):
+        # same as Entity.__update_movement_vector__, for all entities and both axes
+        count = len(self.__entities)
+        arrays = self.__arrays
+        movement = arrays["movement"][:count]
+        knockback = arrays["knockback"][:count]
+        constant = arrays["constant"][:count]
+        initial = arrays["constant_initial"][:count]
+        maximum = arrays["constant_max"][:count]
+
+        movement += knockback
+        knockback[:] = np.trunc(knockback / arrays["resistance"][:count, None])
+
+        affection = arrays["affection"][:count, None]
+        if affection.any():
+            movement += np.where(affection, constant, 0)
+            same_direction = ((movement > 0) & (constant > 0)) | (
+                (movement < 0) & (constant < 0)
+            )
+            updated = np.where(same_direction, constant + initial, initial)
+            updated = np.where(maximum > 0, np.minimum(updated, maximum), updated)
+            updated = np.where(maximum < 0, np.maximum(updated, maximum), updated)
+            constant[:] = np.where(affection, updated, constant)
+
+    def __move(self) -> np.ndarray:
+        # same as Entity.__apply_movement__, returns the new rects (x, y, w, h)
+        entities = self.__entities
+        count = len(entities)
+        arrays = self.__arrays
+        entity_rects = [entity.rect for entity in entities]
+        rects = np.array([tuple(rect) for rect in entity_rects], dtype=float)
+        # rects truncate assigned positions towards zero
+        rects[:, :2] = np.trunc(rects[:, :2] + arrays["movement"][:count])
+
+        collision = arrays["collision"][:count]
+        for row in np.flatnonzero(collision).tolist():
+            entity = entities[row]
+            entity.__apply_movement__()
+            rects[row, :2] = entity.rect.topleft
+            if entity.__is_platformer__:
+                entity.__data__["is_touching_ground"] = all(
+                    entity.__data__["is_touching_ground_list"]
+                )
+
+        simple = np.flatnonzero(~collision)
+        for row, (x, y) in zip(simple.tolist(), rects[simple, :2].tolist()):
+            entity = entities[row]
+            entity_rects[row].topleft = (x, y)
+            hitbox_data = entity.__hitbox_data__
+            entity.__hitbox_rect__.topleft = (x + hitbox_data[0], y + hitbox_data[1])
+            if entity.__temp_collision_rects__:
+                entity.__temp_collision_rects__ = []
+        arrays["movement"][:count] = 0
+        return rects
+
+    def __update_data(self, rects: np.ndarray):
+        # same as Entity.__update_data__, the data is copied into the entities lazily
+        entities = self.__entities
+        count = len(entities)
+        arrays = self.__arrays
+        center = arrays["center"][:count]
+        arrays["old_center"][:count] = center
+        last_x = rects[:, 0] + rects[:, 2] // 2 - center[:, 0]
+        center[:, 0] = rects[:, 0] + rects[:, 2] // 2
+        center[:, 1] = rects[:, 1] + rects[:, 3] // 2
+        # the arrays hold the latest data (entities of a world are only moved by
+        # the world, see Entity.internal_update), get_data copies it on request
+        arrays["synced"][:count] = False
+
+        direction = arrays["direction"][:count]
+        automatic = arrays["automatic_direction"][:count]
+        updated = np.where(automatic & (last_x < 0), -1, direction)
+        updated = np.where(automatic & (last_x > 0), 1, updated)
+        for row in np.flatnonzero(updated != direction).tolist():
+            entity = entities[row]
+            entity.__direction_factor__ = int(updated[row])
+            entity.__data__["direction"] = "left" if updated[row] < 0 else "right"
+        direction[:] = updated
+
+    def update(self):
+        """
+        Updates all entities (like Entity.internal_update).
+        """
+        for entity in self.__unchecked[:]:
+            if entity.__init_check_success__ == False:
+                entity.__init_check_func__()
+                entity.__init_check_success__ = True
+            entity.__data__["is_touching_ground"] = all(
+                entity.__data__["is_touching_ground_list"]
+            )
+            self.__unchecked.remove(entity)
+        if len(self.__entities) == 0:
+            return
+
+        self.__update_movement_vectors()
+        rects = self.__move()
+        self.__update_data(rects)
+
+        centers = self.__arrays["center"][: len(self.__entities)].astype(int).tolist()
+        for entity, center in zip(self.__entities, centers):
+            entity.__entity_pos__ = center
+            entity.__update_image__()
+            entity.__execute_action_methods__()
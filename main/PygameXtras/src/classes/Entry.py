@@ -1,9 +1,21 @@
 import pygame
 from .Button import Button
+from .EventRouter import EventRouter
+from .GapBuffer import GapBuffer
 from .Keyboard import Keyboard
 
 
 class Entry(Button):
+    ABBREVIATIONS = Button.ABBREVIATIONS | {
+        "max_chars": "max",
+        "min_chars": "min",
+        "text_when_empty": "twe",
+        "auto_style": "ast",
+        "strict_input": "si",
+        "show_cursor": "sc",
+        "text_input": "ti",
+    }
+
     def __init__(self, surface, text, size, xy: tuple, anchor="center", **kwargs):
         """
         Click to activate, click somewhere else to deactivate.
@@ -17,9 +29,12 @@ class Entry(Button):
             - Entries (unlike buttons) should NOT be updated in an if-statement!
 
         Additional keywords:
-            max_chars / mc
+            max_chars / max
                 maximum number of characters
                 Type: int
+            min_chars / min
+                minimum number of characters (backspace stops working below it)
+                Type: int
             text_when_empty / twe
                 text that appears when there is currently no other content
                 Type: str
@@ -32,9 +47,15 @@ class Entry(Button):
             strict_input / si
                 only allow numeric ("int", "float", 0 - +inf by using "int+" / "float+") or alphabetic ("str") input
                 Type: str
-            show_cursor
+            show_cursor / sc
                 show a moveable (left and right) cursor, that makes it possible
-                to edit text in the middle without deleting everything to its right
+                to edit text in the middle without deleting everything to its right;
+                the cursor is drawn on top of the text, so moving it does not
+                render the text again
+                Type: bool
+            text_input / ti
+                take the typed text from TEXTINPUT events (supports all keyboard
+                layouts and input methods) instead of translating key presses
                 Type: bool
         """
 
@@ -104,15 +125,24 @@ class Entry(Button):
             0  # 0 means "at the end", while 2 means "2 characters from the end", ...
         )
         self.__old_cursor_pos = 0
+        self.__cursor_index__ = 0  # position of the cursor within the value
+        self.__cursor_x__ = (None, 0, 0)  # text_surface, index, x (cached)
 
         self.__state__ = False
         self.__old_state__ = False
         self.__force__ = False  # used to set state even before the update method
         self.__permanent_state__ = None
-        self.__value__ = str(text)
+        self.__buffer__ = GapBuffer(str(text))
         self.__old_value__ = str(text)
 
-        self.__keyboard__ = Keyboard()
+        # text_input
+        text_input = kwargs.get("text_input", None)
+        if text_input == None:
+            text_input = kwargs.get("ti", False)
+        # assertion
+        text_input = bool(text_input)
+
+        self.__keyboard__ = Keyboard(text_input)
         self.__keyboard__.set_forbidden_characters(["\t", "\n"])
 
         super().__init__(surface, text, size, xy, anchor, **kwargs)
@@ -125,7 +155,7 @@ class Entry(Button):
     def update(self, event_list, button: int = 1, offset: tuple = (0, 0)) -> bool:
         """
         Checks if entry has been clicked on and activates widget if so.
-        Should be used with a regular event_list.
+        Should be used with a regular event_list or an EventRouter.
         <button> can specify a certain button (1-3).
         Also updates the text, if input is detected.
         """
@@ -142,8 +172,14 @@ class Entry(Button):
             self.__is_touching__ = False
             return False
 
+        if isinstance(event_list, EventRouter):
+            mouse_events = event_list.mouse_up
+            key_events = event_list.keys
+        else:
+            mouse_events = key_events = event_list
+
         # managing the actual clicks
-        for event in event_list:
+        for event in mouse_events:
             if event.type == pygame.MOUSEBUTTONUP:
                 pos = list(event.pos)
                 if self.active_area != None and not self.active_area.collidepoint(pos):
@@ -202,21 +238,19 @@ class Entry(Button):
 
         if self.__state__:
             # deleting chars
-            for event in event_list:
+            for event in key_events:
                 if event.type == pygame.KEYDOWN and event.key == pygame.K_BACKSPACE:
                     if (
                         self.min_chars == None
-                        or len(self.__value__) - 1 >= self.min_chars
+                        or len(self.__buffer__) - 1 >= self.min_chars
                     ):
                         if self.show_cursor:
-                            if self.__cursor_pos != len(self.__value__):
-                                val_list = list(self.__value__)
-                                del val_list[
-                                    len(self.__value__) - 1 - self.__cursor_pos
-                                ]
-                                self.__value__ = "".join(val_list)
+                            self.__buffer__.move(
+                                len(self.__buffer__) - self.__cursor_pos
+                            )
                         else:
-                            self.__value__ = self.__value__[:-1]
+                            self.__buffer__.move(len(self.__buffer__))
+                        self.__buffer__.delete(1)
 
                 # managing cursor
                 if self.show_cursor and event.type == pygame.KEYUP:
@@ -225,55 +259,25 @@ class Entry(Button):
                     elif event.key == pygame.K_RIGHT:
                         self.__cursor_pos -= 1
                     elif event.key == 1073741898:  # key "pos1"
-                        self.__cursor_pos = len(self.__value__)
+                        self.__cursor_pos = len(self.__buffer__)
                     elif event.key == 1073741901:  # key "ende"
                         self.__cursor_pos = 0
 
-            # adding chars
-            val = self.__keyboard__.get(event_list)
-            new_val_list: list = list(self.__value__)
-            new_val_list.insert(len(self.__value__) - self.__cursor_pos, val)
-            new_val: str = "".join(new_val_list)
-
-            # checks for self.strict_input and sets val to "" if condition does not apply
-            if self.strict_input is not None and val != "":
-                if new_val == "-":
-                    if not (
-                        self.strict_input == "int+" or self.strict_input == "float+"
-                    ):
-                        self.__value__ = new_val
-                elif new_val.startswith("-"):
-                    if (
-                        (self.strict_input == "int" and new_val[1:].isnumeric())
-                        or (
-                            self.strict_input == "float"
-                            and "".join(new_val[1:].split(".", 1)).isnumeric()
+            # adding chars (ctrl + v pastes the clipboard)
+            if any(self.__is_paste__(event) for event in key_events):
+                # the text typed before and after a paste is inserted around it
+                events = list(event_list)
+                start = 0
+                for i, event in enumerate(events):
+                    if self.__is_paste__(event):
+                        self.__insert__(self.__keyboard__.get(events[start:i]))
+                        self.__insert__(
+                            self.__keyboard__.filter(self.__get_clipboard__())
                         )
-                        or (self.strict_input == "str" and new_val[1:].isalpha())
-                    ):
-                        self.__value__ = new_val
-                else:
-                    if (
-                        (self.strict_input == "int" and new_val.isnumeric())
-                        or (
-                            self.strict_input == "float"
-                            and "".join(new_val.split(".", 1)).isnumeric()
-                        )
-                        or (self.strict_input == "str" and new_val.isalpha())
-                        or (self.strict_input == "int+" and new_val.isnumeric())
-                        or (
-                            self.strict_input == "float+"
-                            and "".join(new_val.split(".", 1)).isnumeric()
-                        )
-                    ):
-                        self.__value__ = new_val
-
+                        start = i + 1
+                self.__insert__(self.__keyboard__.get(events[start:]))
             else:
-                self.__value__ = new_val
-
-            # dealing with self.max_chars
-            if self.max_chars is not None:
-                self.__value__ = self.__value__[: self.max_chars]
+                self.__insert__(self.__keyboard__.get(event_list))
 
         if (
             self.__value__ != self.__old_value__
@@ -287,10 +291,75 @@ class Entry(Button):
                     self.__clamp_cursor()
                 self.__old_cursor_pos = self.__cursor_pos
             self.__old_state__ = self.__state__
+            # the text and the style are changed together, so the widget is only
+            # rebuilt once
+            self.begin_update()
             self.__refresh_text()
 
             # maybe the following line has to be unindented once, I am not sure
             self.__manage_twe()
+            self.end_update()
+
+    @property
+    def __value__(self) -> str:
+        return str(self.__buffer__)
+
+    @__value__.setter
+    def __value__(self, value):
+        self.__buffer__.set(value)
+
+    def __insert__(self, text: str):
+        # inserts text at the cursor (if it matches self.strict_input), text
+        # exceeding self.max_chars is cut off first
+        if self.max_chars is not None:
+            text = text[: max(self.max_chars - len(self.__buffer__), 0)]
+        if text == "":
+            return
+        index = len(self.__buffer__) - self.__cursor_pos
+        if self.strict_input is not None:
+            value = self.__value__
+            if not self.__is_valid__(value[:index] + text + value[index:]):
+                return
+        self.__buffer__.move(index)
+        self.__buffer__.insert(text)
+
+    @staticmethod
+    def __is_paste__(event: pygame.event.Event) -> bool:
+        # ctrl + v
+        return (
+            event.type == pygame.KEYDOWN
+            and event.key == pygame.K_v
+            and (getattr(event, "mod", 0) & pygame.KMOD_CTRL) != 0
+        )
+
+    def __get_clipboard__(self) -> str:
+        try:
+            return pygame.scrap.get_text().replace("\r\n", "\n")
+        except pygame.error:
+            return ""
+
+    def __is_valid__(self, value: str) -> bool:
+        # checks if the value matches self.strict_input
+        if value == "-":
+            return not (self.strict_input == "int+" or self.strict_input == "float+")
+        elif value.startswith("-"):
+            return (
+                (self.strict_input == "int" and value[1:].isnumeric())
+                or (
+                    self.strict_input == "float"
+                    and "".join(value[1:].split(".", 1)).isnumeric()
+                )
+                or (self.strict_input == "str" and value[1:].isalpha())
+            )
+        else:
+            return (
+                (self.strict_input in ("int", "int+") and value.isnumeric())
+                or (
+                    self.strict_input in ("float", "float+")
+                    and "".join(value.split(".", 1)).isnumeric()
+                )
+                or (self.strict_input == "str" and value.isalpha())
+            )
 
     def get_state(self):
         """
@@ -309,7 +378,30 @@ class Entry(Button):
         Sets the value of the Entry.
         """
         self.__value__ = str(value)
+        self.begin_update()
         self.__refresh_text()
+        self.__manage_twe()
+        self.end_update()
+
+    def insert(self, text: str):
+        """
+        Inserts <text> at the cursor, as if it had been typed. Forbidden
+        characters are removed and the whole text is checked at once
+        (strict_input, max_chars), so the widget is only rendered once.
+        """
+        self.__insert__(self.__keyboard__.filter(str(text)))
+        if self.__value__ != self.__old_value__:
+            self.begin_update()
+            self.__refresh_text()
+            self.__manage_twe()
+            self.end_update()
+
+    def paste(self):
+        """
+        Inserts the text of the clipboard at the cursor (see self.insert).
+        Pressing ctrl + v while the entry is active does the same.
+        """
+        self.insert(self.__get_clipboard__())
 
     def set_forbidden_characters(self, characters: list):
         """
@@ -326,7 +418,10 @@ class Entry(Button):
         Clears the text.
         """
         self.__value__ = ""
+        self.begin_update()
         self.__refresh_text()
+        self.__manage_twe()
+        self.end_update()
 
     def set_state(self, state: bool):
         """
@@ -347,13 +442,53 @@ class Entry(Button):
         self.__permanent_state__ = None
 
     def __refresh_text(self):
-        if self.show_cursor and self.__state__:
-            chars = list(self.__value__)
-            chars.insert(len(self.__value__) - self.__cursor_pos, "|")
-            self.update_text("".join(chars))
+        value = self.__value__
+        self.__cursor_index__ = max(len(value) - self.__cursor_pos, 0)
+        if self.show_cursor and self.__state__ and self.__is_wrapped__(value):
+            # the position of the cursor within wrapped lines is unknown,
+            # so it becomes part of the text
+            index = self.__cursor_index__
+            self.update_text(value[:index] + "|" + value[index:])
         else:
-            self.update_text(self.__value__)
-        self.__old_value__ = self.__value__
+            self.update_text(value)
+        self.__old_value__ = value
+
+    def __is_wrapped__(self, value: str) -> bool:
+        # whether the value would be rendered on multiple lines
+        if self.force_width is None:
+            return False
+        wrap_limit = self.force_width - self.x_axis_addition * 2
+        return self.__font__.size(value)[0] > wrap_limit
+
+    def __get_cursor_x__(self) -> int:
+        # position of the cursor relative to the text_rect (cached until the
+        # text is rendered again or the cursor moves)
+        surface, index, x = self.__cursor_x__
+        if surface is not self.text_surface or index != self.__cursor_index__:
+            index = self.__cursor_index__
+            x = self.__font__.size(self.__value__[:index])[0]
+            self.__cursor_x__ = (self.text_surface, index, x)
+        return x
+
+    def __draw_to__(self, surface: pygame.Surface):
+        super().__draw_to__(surface)
+        if self.show_cursor and self.__state__ and self.text == self.__value__:
+            x = self.text_rect.x + self.__get_cursor_x__()
+            inset = self.text_rect.height // 8
+            pygame.draw.line(
+                surface,
+                self.textcolor,
+                (x, self.text_rect.top + inset),
+                (x, self.text_rect.bottom - inset - 1),
+                max(1, self.size // 16),
+            )
+
+    def __get_draw_state__(self) -> tuple:
+        # everything that affects the look of the widget (used by WidgetGroup)
+        return super().__get_draw_state__() + (
+            self.show_cursor and self.__state__,
+            self.__cursor_index__,
+        )
 
     def __manage_twe(self):
         if self.text_when_empty != None and len(self.__value__) == 0:
@@ -0,0 +1,79 @@
+import pygame
+
+
+class EventRouter:
+    def __init__(self):
+        """
+        Sorts the events of a frame by type, so widgets do not have to
+        search through the complete event list on their own.
+
+        Button, Entry, Keyboard, ScrollableButtonList and ButtonGrid accept
+        an EventRouter wherever they take an event list and only look at
+        the events they need. Iterating over the router yields all events
+        of the frame, so it can be passed anywhere an event list is expected.
+
+        Example (simplified):
+            router = EventRouter()
+            while True:
+                for event in router.update():
+                    if event.type == pygame.QUIT:
+                        ...
+                if button.update(router):
+                    ...
+                entry.update(router)
+
+        Available lists (updated by self.update):
+            events       all events
+            mouse_up     MOUSEBUTTONUP
+            mouse_wheel  MOUSEWHEEL
+            key_down     KEYDOWN
+            key_up       KEYUP
+            keys         KEYDOWN and KEYUP (in their original order)
+            text_input   TEXTINPUT
+        """
+        self.events: list[pygame.event.Event] = []
+        self.mouse_up: list[pygame.event.Event] = []
+        self.mouse_wheel: list[pygame.event.Event] = []
+        self.key_down: list[pygame.event.Event] = []
+        self.key_up: list[pygame.event.Event] = []
+        self.keys: list[pygame.event.Event] = []
+        self.text_input: list[pygame.event.Event] = []
+
+    def update(self, event_list: list | None = None) -> list[pygame.event.Event]:
+        """
+        Sorts the given events (or 'pygame.event.get()' if no events are
+        given) and returns the list of all events.
+        Has to be called exactly once per frame.
+        """
+        if event_list is None:
+            event_list = pygame.event.get()
+        self.events = list(event_list)
+        self.mouse_up = []
+        self.mouse_wheel = []
+        self.key_down = []
+        self.key_up = []
+        self.keys = []
+        self.text_input = []
+
+        for event in self.events:
+            t = event.type
+            if t == pygame.MOUSEBUTTONUP:
+                self.mouse_up.append(event)
+            elif t == pygame.MOUSEWHEEL:
+                self.mouse_wheel.append(event)
+            elif t == pygame.KEYDOWN:
+                self.key_down.append(event)
+                self.keys.append(event)
+            elif t == pygame.KEYUP:
+                self.key_up.append(event)
+                self.keys.append(event)
+            elif t == pygame.TEXTINPUT:
+                self.text_input.append(event)
+
+        return self.events
+
+    def __iter__(self):
+        return iter(self.events)
+
+    def __len__(self):
+        return len(self.events)
@@ -0,0 +1,102 @@
+from collections import OrderedDict
+
+import pygame
+
+ALIGNMENTS = {
+    "left": pygame.FONT_LEFT,
+    "center": pygame.FONT_CENTER,
+    "right": pygame.FONT_RIGHT,
+}
+
+
+class FontCache:
+    """
+    Process-wide cache for pygame.font.Font objects.
+
+    Loading a font means opening and parsing the font file, which is
+    far more expensive than rendering a short string. Widgets therefore
+    request their fonts from this cache instead of creating a new
+    pygame.font.Font every time their text or style changes.
+
+    Fonts are keyed by (path, size, bold, italic, underline, align) and
+    evicted in least-recently-used order once more than 'max_size'
+    fonts are stored.
+
+    IMPORTANT: the returned fonts are shared between all widgets using
+    the same key, so they must not be restyled (set_bold, align, ...)
+    by the caller.
+    """
+
+    max_size: int = 64
+    hits: int = 0
+    misses: int = 0
+    __fonts: OrderedDict = OrderedDict()
+
+    @staticmethod
+    def get(
+        path: str | None,
+        size: int,
+        bold: bool = False,
+        italic: bool = False,
+        underline: bool = False,
+        align: str = "left",
+    ) -> pygame.font.Font:
+        """
+        Returns a (possibly cached) font with the given properties.
+        <align> has to be one of "left", "center" or "right".
+        """
+        key = (path, size, bool(bold), bool(italic), bool(underline), align)
+        font = FontCache.__fonts.get(key, None)
+        if font is not None:
+            FontCache.__fonts.move_to_end(key)
+            FontCache.hits += 1
+            return font
+
+        assert align in ALIGNMENTS, f"invalid argument for 'align': {align}"
+
+        FontCache.misses += 1
+        font = pygame.font.Font(path, size)
+        font.set_bold(bold)
+        font.set_italic(italic)
+        font.set_underline(underline)
+        font.align = ALIGNMENTS[align]
+
+        FontCache.__fonts[key] = font
+        while len(FontCache.__fonts) > FontCache.max_size:
+            FontCache.__fonts.popitem(last=False)
+        return font
+
+    @staticmethod
+    def set_max_size(max_size: int) -> None:
+        """
+        Sets the maximum number of cached fonts, evicting the least
+        recently used fonts if necessary.
+        """
+        assert type(max_size) == int, f"invalid argument for 'max_size': {max_size}"
+        assert max_size > 0, f"invalid argument for 'max_size': {max_size}"
+        FontCache.max_size = max_size
+        while len(FontCache.__fonts) > FontCache.max_size:
+            FontCache.__fonts.popitem(last=False)
+
+    @staticmethod
+    def clear() -> None:
+        """
+        Removes all cached fonts and resets the counters.
+        Has to be called if pygame.font is re-initialized.
+        """
+        FontCache.__fonts.clear()
+        FontCache.hits = 0
+        FontCache.misses = 0
+
+    @staticmethod
+    def get_stats() -> dict:
+        """
+        Returns a dict containing the number of hits and misses,
+        the current size and the maximum size of the cache.
+        """
+        return {
+            "hits": FontCache.hits,
+            "misses": FontCache.misses,
+            "size": len(FontCache.__fonts),
+            "max_size": FontCache.max_size,
+        }
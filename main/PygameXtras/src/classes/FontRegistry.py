@@ -0,0 +1,61 @@
+import os
+
+import pygame
+
+FONTS_DIR = os.path.join(os.path.dirname(__file__), "..", "fonts")
+
+
+class FontRegistry:
+    """
+    Resolves font names to font file paths.
+
+    The bundled fonts (found in 'PygameXtras/src/fonts') are indexed once,
+    the first time they are needed. Names which are not bundled are looked
+    up using pygame.font.match_font, which can be slow, so every result is
+    memoized.
+    """
+
+    __bundled: dict[str, str] | None = None
+    __resolved: dict[str, str | None] = {}
+
+    @staticmethod
+    def __index() -> dict[str, str]:
+        if FontRegistry.__bundled is None:
+            FontRegistry.__bundled = {
+                f.removesuffix(".ttf"): os.path.join(FONTS_DIR, f)
+                for f in sorted(os.listdir(FONTS_DIR))
+                if f.endswith(".ttf")
+            }
+        return FontRegistry.__bundled
+
+    @staticmethod
+    def get_bundled_fonts() -> list[str]:
+        """
+        Returns the names of all fonts shipped with PygameXtras.
+        """
+        return list(FontRegistry.__index().keys())
+
+    @staticmethod
+    def resolve(font: str) -> str | None:
+        """
+        Returns the path of the given font. Bundled fonts are preferred
+        over system fonts. Returns None if no matching font was found,
+        which makes pygame fall back to its default font.
+        """
+        name = font.lower()
+        if name in FontRegistry.__resolved:
+            return FontRegistry.__resolved[name]
+        path = FontRegistry.__index().get(name, None)
+        if path is None:
+            path = pygame.font.match_font(font)
+        FontRegistry.__resolved[name] = path
+        return path
+
+    @staticmethod
+    def clear() -> None:
+        """
+        Forgets all indexed and resolved fonts (useful if fonts have been
+        installed while the program is running).
+        """
+        FontRegistry.__bundled = None
+        FontRegistry.__resolved.clear()
@@ -3,6 +3,8 @@ import os
 
 import pygame
 
+from .FontRegistry import FontRegistry
+
 
 def win_higher_resolution(boolean: bool = True):
     """
@@ -99,7 +101,4 @@ def ask_directory():
 
 
 def get_fonts():
-    return [
-        f.removesuffix(".ttf")
-        for f in os.listdir(os.path.join(os.path.dirname(__file__), "..", "fonts"))
-    ]
+    return FontRegistry.get_bundled_fonts()
@@ -0,0 +1,83 @@
+class GapBuffer:
+    def __init__(self, text: str = ""):
+        """
+        Stores a text as a list of characters with a gap at the cursor, so
+        inserting and deleting at the cursor does not copy the whole text
+        (used by Entry).
+
+        The cursor is an index within the text (0 = before the first char).
+        """
+        self.__chars: list = []
+        self.__gap_start = 0  # == cursor
+        self.__gap_end = 0
+        self.__text: str | None = None  # cached result of str(self)
+        self.set(text)
+
+    def set(self, text: str):
+        """
+        Replaces the text and moves the cursor to its end.
+        """
+        text = str(text)
+        gap = max(16, len(text) // 2)
+        self.__chars = list(text) + [""] * gap
+        self.__gap_start = len(text)
+        self.__gap_end = len(self.__chars)
+        self.__text = text
+
+    def __len__(self) -> int:
+        return len(self.__chars) - (self.__gap_end - self.__gap_start)
+
+    def __str__(self) -> str:
+        if self.__text is None:
+            self.__text = "".join(self.__chars[: self.__gap_start]) + "".join(
+                self.__chars[self.__gap_end :]
+            )
+        return self.__text
+
+    def get_cursor(self) -> int:
+        return self.__gap_start
+
+    def move(self, index: int):
+        """
+        Moves the cursor to <index> (only the characters in between are moved).
+        """
+        index = max(0, min(index, len(self)))
+        chars = self.__chars
+        if index < self.__gap_start:
+            count = self.__gap_start - index
+            chars[self.__gap_end - count : self.__gap_end] = chars[
+                index : self.__gap_start
+            ]
+            self.__gap_start -= count
+            self.__gap_end -= count
+        elif index > self.__gap_start:
+            count = index - self.__gap_start
+            chars[self.__gap_start : index] = chars[
+                self.__gap_end : self.__gap_end + count
+            ]
+            self.__gap_start += count
+            self.__gap_end += count
+
+    def insert(self, text: str):
+        """
+        Inserts <text> at the cursor and moves the cursor behind it.
+        """
+        if len(text) == 0:
+            return
+        if self.__gap_end - self.__gap_start < len(text):
+            # growing the gap relative to the length, so inserting stays cheap
+            gap = max(16, len(self) // 2, len(text))
+            self.__chars[self.__gap_end : self.__gap_end] = [""] * gap
+            self.__gap_end += gap
+        self.__chars[self.__gap_start : self.__gap_start + len(text)] = text
+        self.__gap_start += len(text)
+        self.__text = None
+
+    def delete(self, count: int = 1):
+        """
+        Deletes up to <count> characters in front of the cursor (backspace).
+        """
+        count = min(count, self.__gap_start)
+        if count > 0:
+            self.__gap_start -= count
+            self.__text = None
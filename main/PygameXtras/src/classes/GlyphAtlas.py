@@ -0,0 +1,137 @@
+from collections import OrderedDict
+
+import pygame
+
+
+class GlyphAtlas:
+    """
+    Renders single-line text by copying pre-rendered glyphs.
+
+    Every glyph is rendered once per (font, color, antialias) and stored
+    in an atlas surface together with its advance. Strings are composed
+    by blitting the glyphs next to each other (including kerning), which
+    is much cheaper than rendering the whole string with the font. Used by
+    Labels created with 'glyph_atlas=True', intended for texts that change
+    every frame (counters, timers, fps displays, ...).
+
+    Glyphs are placed on whole pixels, so with some fonts the spacing can
+    differ slightly from regular rendering.
+    """
+
+    ATLAS_WIDTH = 512
+    max_atlases: int = 32
+    __atlases: OrderedDict = OrderedDict()
+
+    @staticmethod
+    def get(
+        font: pygame.font.Font, font_key: tuple, color: tuple, antialias: bool
+    ) -> "GlyphAtlas":
+        """
+        Returns the (shared) atlas for the given font, color and antialias.
+        <font_key> has to identify <font> (see FontCache.get).
+        """
+        key = (font_key, tuple(color), bool(antialias))
+        atlas = GlyphAtlas.__atlases.get(key, None)
+        if atlas is None:
+            atlas = GlyphAtlas(font, color, antialias)
+            GlyphAtlas.__atlases[key] = atlas
+            while len(GlyphAtlas.__atlases) > GlyphAtlas.max_atlases:
+                GlyphAtlas.__atlases.popitem(last=False)
+        else:
+            GlyphAtlas.__atlases.move_to_end(key)
+        return atlas
+
+    @staticmethod
+    def clear() -> None:
+        """
+        Removes all atlases.
+        """
+        GlyphAtlas.__atlases.clear()
+
+    def __init__(self, font: pygame.font.Font, color: tuple, antialias: bool):
+        self.__font = font
+        self.__color = color
+        self.__antialias = antialias
+
+        # rendered text is as high as a line, an empty text only as high as the font
+        self.__height = font.get_linesize()
+        self.__empty_height = font.get_height()
+        self.__surface = pygame.Surface(
+            (GlyphAtlas.ATLAS_WIDTH, self.__height), pygame.SRCALPHA
+        )
+        self.__cursor = [0, 0]  # where the next glyph will be placed
+
+        self.__glyphs: dict[str, tuple[pygame.Rect, int]] = {}  # area, advance
+        self.__kerning: dict[tuple[str, str], int] = {}
+
+    def __get_glyph(self, char: str) -> tuple[pygame.Rect, int]:
+        glyph = self.__glyphs.get(char, None)
+        if glyph is not None:
+            return glyph
+
+        image = self.__font.render(char, self.__antialias, self.__color)
+        width = image.get_width()
+        if self.__cursor[0] + width > self.__surface.get_width():
+            self.__cursor = [0, self.__cursor[1] + self.__height]
+        if self.__cursor[1] + self.__height > self.__surface.get_height():
+            # adding another row
+            surface = pygame.Surface(
+                (
+                    max(self.__surface.get_width(), width),
+                    self.__cursor[1] + self.__height,
+                ),
+                pygame.SRCALPHA,
+            )
+            surface.blit(self.__surface, (0, 0))
+            self.__surface = surface
+
+        area = pygame.Rect(self.__cursor, (width, self.__height))
+        self.__surface.blit(image, area)
+        self.__cursor[0] += width
+
+        glyph = (area, self.__font.size(char)[0])
+        self.__glyphs[char] = glyph
+        return glyph
+
+    def __get_kerning(self, first: str, second: str) -> int:
+        pair = (first, second)
+        kerning = self.__kerning.get(pair, None)
+        if kerning is None:
+            kerning = (
+                self.__font.size(first + second)[0]
+                - self.__get_glyph(first)[1]
+                - self.__get_glyph(second)[1]
+            )
+            self.__kerning[pair] = kerning
+        return kerning
+
+    def render(self, text: str, buffer: pygame.Surface | None = None) -> pygame.Surface:
+        """
+        Returns a surface containing <text> (single line only).
+
+        If <buffer> is given and large enough, the text is drawn into it
+        and a subsurface of it is returned instead of allocating a new
+        surface. The parent of the returned surface can be used as the
+        buffer for the next call.
+        """
+        positions = []
+        x = 0
+        for i, char in enumerate(text):
+            positions.append(x)
+            x += self.__get_glyph(char)[1]
+            if i + 1 < len(text):
+                x += self.__get_kerning(char, text[i + 1])
+        width = max(x, 0)
+        height = self.__height if len(text) > 0 else self.__empty_height
+
+        if buffer is None or buffer.get_width() < width or buffer.get_height() < height:
+            # some spare room, so the buffer can be reused for longer texts
+            buffer = pygame.Surface(
+                (width + 32, max(self.__height, self.__empty_height)), pygame.SRCALPHA
+            )
+        surface = buffer.subsurface((0, 0, width, height))
+        surface.fill((0, 0, 0, 0))
+
+        for char, x in zip(text, positions):
+            surface.blit(self.__surface, (x, 0), self.__glyphs[char][0])
+        return surface
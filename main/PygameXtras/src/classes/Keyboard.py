@@ -1,11 +1,22 @@
 import pygame
 
+from .EventRouter import EventRouter
+
 
 class Keyboard:
-    def __init__(self):
+    def __init__(self, text_input: bool = False):
         """
         Makes it easier to take user input (via the keyboard)
+
+        If <text_input> is True, the typed text is taken from TEXTINPUT
+        events instead of translating KEYDOWN events, which supports all
+        keyboard layouts and input methods (IME). Text input is enabled by
+        default in pygame (see pygame.key.start_text_input).
         """
+        assert type(text_input) == bool, (
+            f"invalid argument for 'text_input': {text_input}"
+        )
+        self.text_input = text_input
         self.keys = {
             pygame.K_a: "a",
             pygame.K_b: "b",
@@ -112,7 +123,8 @@ class Keyboard:
             pygame.K_LESS: ">",
             pygame.K_COMMA: ";",
         }
-        self.__forbidden_chars__ = []
+        self.__forbidden_chars__: set[str] = set()
+        self.__translation__ = {}  # removes the forbidden characters (str.translate)
 
     def set_custom_value(self, custom_values: dict):
         """
@@ -133,26 +145,42 @@ class Keyboard:
         for char in characters:
             assert type(char) == str, f"invalid character '{char}'"
             assert len(char) == 1, f"invalid character '{char}'"
-            if char not in self.__forbidden_chars__:
-                self.__forbidden_chars__.append(char)
+            self.__forbidden_chars__.add(char)
+        self.__translation__ = dict.fromkeys(map(ord, self.__forbidden_chars__))
+
+    def filter(self, text: str) -> str:
+        """
+        Returns <text> without the forbidden characters.
+        """
+        return text.translate(self.__translation__)
 
     def get(self, event_list):
         """
         Returns a string of all keys pressed.
+        <event_list> can also be an EventRouter.
+        Keys pressed together with ctrl are ignored (shortcuts).
         """
-        string = ""
+        if self.text_input:
+            if isinstance(event_list, EventRouter):
+                event_list = event_list.text_input
+            return self.filter(
+                "".join(e.text for e in event_list if e.type == pygame.TEXTINPUT)
+            )
+
+        if isinstance(event_list, EventRouter):
+            event_list = event_list.key_down
+
         keys = pygame.key.get_pressed()
         # if keys[pygame.locals.K_LSHIFT] or keys[pygame.locals.K_RSHIFT]:
         if keys[pygame.K_LSHIFT] or keys[pygame.K_RSHIFT]:
-            for e in event_list:
-                if e.type == pygame.KEYDOWN and e.key:
-                    char = self.shift_keys.get(e.key, "")
-                    if char not in self.__forbidden_chars__:
-                        string += char
+            mapping = self.shift_keys
         else:
-            for e in event_list:
-                if e.type == pygame.KEYDOWN and e.key:
-                    char = self.keys.get(e.key, "")
-                    if char not in self.__forbidden_chars__:
-                        string += char
-        return string
+            mapping = self.keys
+        chars = []
+        for e in event_list:
+            if e.type == pygame.KEYDOWN and e.key:
+                mod = getattr(e, "mod", 0)
+                if mod & pygame.KMOD_CTRL and not mod & pygame.KMOD_ALT:
+                    continue
+                chars.append(mapping.get(e.key, ""))
+        return self.filter("".join(chars))
@@ -1,5 +1,3 @@
-import os
-
 import pygame
 
 from ..parsers.color import Color
@@ -8,10 +6,75 @@ from ..parsers.positive_float import PositiveFloat
 from ..parsers.positive_int import PositiveInt
 from ..parsers.size2 import Size2
 from ..parsers.size4 import Size4
+from .FontCache import FontCache
+from .FontRegistry import FontRegistry
+from .GlyphAtlas import GlyphAtlas
 from .OneClickManager import OneClickManager
+from .TextCache import TextCache
+
+ANCHORS = frozenset(
+    (
+        "topleft",
+        "midtop",
+        "topright",
+        "midleft",
+        "center",
+        "midright",
+        "bottomleft",
+        "midbottom",
+        "bottomright",
+    )
+)
 
 
 class Label:
+    ABBREVIATIONS = {
+        "textcolor": "tc",
+        "backgroundcolor": "bgc",
+        "antialias": "aa",
+        "font": "f",
+        "x_axis_addition": "xad",
+        "y_axis_addition": "yad",
+        "borderwidth": "bw",
+        "bordercolor": "bc",
+        "force_width": "fw",
+        "force_height": "fh",
+        "force_dim": "fd",
+        "borderradius": "br",
+        "text_offset": "to",
+        "image": "img",
+        "info": "info",
+        "text_binding": "tb",
+        "highlight": "hl",
+        "active_area": "aA",
+        "bold": "bo",
+        "italic": "it",
+        "underline": "ul",
+        "one_click_manager": "ocm",
+        "template": "t",
+        "margin": "m",
+        "font_file": "ff",
+        "text_align": "ta",
+        "cache_text": "ct",
+        "baked": "bk",
+        "glyph_atlas": "ga",
+    }
+
+    # maps the long and the short form of every keyword to its long form
+    __ALIASES__ = {name: name for name in ABBREVIATIONS} | {
+        short: name for name, short in ABBREVIATIONS.items()
+    }
+
+    # templates which have already been parsed: id -> (template, copy, result)
+    __TEMPLATES__: dict[tuple, tuple[dict, dict, dict]] = {}
+
+    def __init_subclass__(cls, **kwargs):
+        # subclasses may add keywords by extending ABBREVIATIONS
+        super().__init_subclass__(**kwargs)
+        cls.__ALIASES__ = {name: name for name in cls.ABBREVIATIONS} | {
+            short: name for name, short in cls.ABBREVIATIONS.items()
+        }
+
     def __init__(
         self,
         surface: pygame.Surface | None,
@@ -68,7 +131,7 @@ class Label:
                 Type: bool
             font
                 The font used for the text. Tries to match a font of PygameXtras first, then checks sysfonts.
-                To get a list of all available PygameXtras fonts, run 'PygameXtras.list_fonts()'. To get a list
+                To get a list of all available PygameXtras fonts, run 'PygameXtras.get_fonts()'. To get a list
                 of all sysfonts, run 'pygame.font.get_fonts()'.
                 Type: str
             x_axis_addition
@@ -139,58 +202,28 @@ class Label:
             text_align
                 if force_width is used, aligns the text to the left, center or right
                 Type: str
+            cache_text
+                keeps rendered texts in a shared cache (see PygameXtras.TextCache), so switching
+                back to a previously displayed text does not render it again
+                Type: bool
+            baked
+                composes background, border, image and text into one surface whenever the look of
+                the widget changes, so drawing only takes a single blit; recommended for widgets
+                that rarely change but are drawn every frame (only takes effect if an opaque
+                backgroundcolor covers the text and the image and no translucent pixel of them
+                lies on a rounded corner)
+                Type: bool
+            glyph_atlas
+                composes single-line texts from pre-rendered glyphs (see PygameXtras.GlyphAtlas)
+                instead of rendering them; recommended for texts that change every frame, like
+                counters or timers (spacing may differ slightly from regular rendering)
+                Type: bool
 
         All custom arguments can also be used in their short form (eg. "aa" instead of "antialias").
         To see what all the short forms look like, inspect the self.ABBREVIATIONS attribute.
         """
 
-        self.ABBREVIATIONS = {
-            "textcolor": "tc",
-            "backgroundcolor": "bgc",
-            "antialias": "aa",
-            "font": "f",
-            "x_axis_addition": "xad",
-            "y_axis_addition": "yad",
-            "borderwidth": "bw",
-            "bordercolor": "bc",
-            "force_width": "fw",
-            "force_height": "fh",
-            "force_dim": "fd",
-            "borderradius": "br",
-            "text_offset": "to",
-            "image": "img",
-            "info": "info",
-            "text_binding": "tb",
-            "highlight": "hl",
-            "active_area": "aA",
-            "bold": "bo",
-            "italic": "it",
-            "underline": "ul",
-            "one_click_manager": "ocm",
-            "template": "t",
-            "margin": "m",
-            "font_file": "ff",
-            "text_align": "ta",
-        }
-
-        for k in kwargs.keys():
-            if (
-                k not in self.ABBREVIATIONS.keys()
-                and k not in self.ABBREVIATIONS.values()
-            ):
-                raise ValueError(f"Unrecognized keyword argument: {k}")
-
-        # inserting template (if exists)
-        template = kwargs.get("template", None)
-        if template is None:
-            template = kwargs.get(self.ABBREVIATIONS["template"], None)
-        if template is not None:
-            assert isinstance(template, dict), (
-                f"invalid argument for 'template': {template}"
-            )
-            for k in template.keys():
-                if k not in kwargs.keys():
-                    kwargs[k] = template[k]
+        options = self.__parse_kwargs__(kwargs)
 
         self.__is_touching__ = False  # if cursor is touching the rect, only for buttons
         self.__has_hl_image__ = False
@@ -209,37 +242,16 @@ class Label:
         self.xy = Coordinate.parse(xy)
 
         self.anchor = anchor
-        if "anchor" in kwargs.keys():
-            self.anchor = kwargs["anchor"]
-
-        assert self.anchor in (
-            "topleft",
-            "midtop",
-            "topright",
-            "midleft",
-            "center",
-            "midright",
-            "bottomleft",
-            "midbottom",
-            "bottomright",
-        ), f"invalid argument for 'anchor': {self.anchor}"
-
-        kw = kwargs
+        assert self.anchor in ANCHORS, f"invalid argument for 'anchor': {self.anchor}"
 
         # textcolor
-        self.textcolor = kw.get("textcolor", None)
-        if self.textcolor == None:
-            self.textcolor = kw.get(self.ABBREVIATIONS["textcolor"], None)
-        if self.textcolor == None:
-            self.textcolor = (0, 0, 0)
+        self.textcolor = options.get("textcolor", (0, 0, 0))
         # assertion
         if self.textcolor != None:
             self.textcolor = Color.parse(self.textcolor)
 
         # backgroundcolor
-        self.backgroundcolor = kw.get("backgroundcolor", None)
-        if self.backgroundcolor == None:
-            self.backgroundcolor = kw.get(self.ABBREVIATIONS["backgroundcolor"], None)
+        self.backgroundcolor = options.get("backgroundcolor", None)
         # assertion
         if self.backgroundcolor != None:
             self.backgroundcolor = Color.parse(self.backgroundcolor)
@@ -249,20 +261,12 @@ class Label:
         # assertion completed by previous assertion
 
         # antialias
-        self.antialias = kw.get("antialias", None)
-        if self.antialias == None:
-            self.antialias = kw.get(self.ABBREVIATIONS["antialias"], None)
-        if self.antialias == None:
-            self.antialias = True
+        self.antialias = options.get("antialias", True)
         # assertion
         self.antialias = bool(self.antialias)
 
         # font
-        self.font = kw.get("font", None)
-        if self.font == None:
-            self.font = kw.get(self.ABBREVIATIONS["font"], None)
-        if self.font == None:
-            self.font = "verdana"
+        self.font = options.get("font", "verdana")
         # assertion
         if self.font != None:
             assert isinstance(self.font, str), (
@@ -270,9 +274,7 @@ class Label:
             )
 
         # font_file
-        self.font_file = kw.get("font_file", None)
-        if self.font_file == None:
-            self.font_file = kw.get(self.ABBREVIATIONS["font_file"], None)
+        self.font_file = options.get("font_file", None)
         # assertion
         if self.font_file != None:
             assert isinstance(self.font_file, str), (
@@ -280,65 +282,43 @@ class Label:
             )
 
         # x_axis_addition
-        self.x_axis_addition = kw.get("x_axis_addition", None)
-        if self.x_axis_addition == None:
-            self.x_axis_addition = kw.get(self.ABBREVIATIONS["x_axis_addition"], None)
-        if self.x_axis_addition == None:
-            self.x_axis_addition = 0
+        self.x_axis_addition = options.get("x_axis_addition", 0)
         # assertion
         if self.x_axis_addition != None:
             self.x_axis_addition = PositiveInt.parse(self.x_axis_addition)
 
         # y_axis_addition
-        self.y_axis_addition = kw.get("y_axis_addition", None)
-        if self.y_axis_addition == None:
-            self.y_axis_addition = kw.get(self.ABBREVIATIONS["y_axis_addition"], None)
-        if self.y_axis_addition == None:
-            self.y_axis_addition = 0
+        self.y_axis_addition = options.get("y_axis_addition", 0)
         # assertion
         if self.y_axis_addition != None:
             self.y_axis_addition = PositiveInt.parse(self.y_axis_addition)
 
         # borderwidth
-        self.borderwidth = kw.get("borderwidth", None)
-        if self.borderwidth == None:
-            self.borderwidth = kw.get(self.ABBREVIATIONS["borderwidth"], None)
-        if self.borderwidth == None:
-            self.borderwidth = 0
+        self.borderwidth = options.get("borderwidth", 0)
         # assertion
         if self.borderwidth != None:
             self.borderwidth = PositiveInt.parse(self.borderwidth)
 
         # bordercolor
-        self.bordercolor = kw.get("bordercolor", None)
-        if self.bordercolor == None:
-            self.bordercolor = kw.get(self.ABBREVIATIONS["bordercolor"], None)
-        if self.bordercolor == None:
-            self.bordercolor = (0, 0, 0)
+        self.bordercolor = options.get("bordercolor", (0, 0, 0))
         # assertion
         if self.bordercolor != None:
             self.bordercolor = Color.parse(self.bordercolor)
 
         # force_width
-        self.force_width = kw.get("force_width", None)
-        if self.force_width == None:
-            self.force_width = kw.get(self.ABBREVIATIONS["force_width"], None)
+        self.force_width = options.get("force_width", None)
         # assertion
         if self.force_width != None:
             self.force_width = PositiveInt.parse(self.force_width)
 
         # force_height
-        self.force_height = kw.get("force_height", None)
-        if self.force_height == None:
-            self.force_height = kw.get(self.ABBREVIATIONS["force_height"], None)
+        self.force_height = options.get("force_height", None)
         # assertion
         if self.force_height != None:
             self.force_height = PositiveInt.parse(self.force_height)
 
         # force_dim
-        force_dim = kw.get("force_dim", None)
-        if force_dim == None:
-            force_dim = kw.get(self.ABBREVIATIONS["force_dim"], None)
+        force_dim = options.get("force_dim", None)
         # assertion
         if force_dim != None:
             self.force_dim = Size2.parse(force_dim)
@@ -346,9 +326,7 @@ class Label:
             self.force_height = force_dim[1]
 
         # borderradius
-        self.borderradius = kw.get("borderradius", None)
-        if self.borderradius == None:
-            self.borderradius = kw.get(self.ABBREVIATIONS["borderradius"], None)
+        self.borderradius = options.get("borderradius", None)
         if self.borderradius == None:
             self.borderradius = (1, 1, 1, 1)
         # assertion
@@ -368,19 +346,13 @@ class Label:
             )
 
         # text_offset
-        self.text_offset = kw.get("text_offset", None)
-        if self.text_offset == None:
-            self.text_offset = kw.get(self.ABBREVIATIONS["text_offset"], None)
-        if self.text_offset == None:
-            self.text_offset = (0, 0)
+        self.text_offset = options.get("text_offset", (0, 0))
         # assertion
         if self.text_offset != None:
             self.text_offset = Size2.parse(self.text_offset)
 
         # image
-        self.image = kw.get("image", None)
-        if self.image == None:
-            self.image = kw.get(self.ABBREVIATIONS["image"], None)
+        self.image = options.get("image", None)
         # assertion
         if self.image != None:
             assert isinstance(self.image, pygame.Surface), (
@@ -395,35 +367,19 @@ class Label:
             )
 
         # info
-        self.info = kw.get("info", None)
-        if self.info == None:
-            self.info = kw.get(self.ABBREVIATIONS["info"], None)
+        self.info = options.get("info", None)
         # no assertion needed
 
         # text_binding
-        self.text_binding = kw.get("text_binding", None)
-        if self.text_binding == None:
-            self.text_binding = kw.get(self.ABBREVIATIONS["text_binding"], None)
-        if self.text_binding == None:
-            self.text_binding = "center"
+        self.text_binding = options.get("text_binding", "center")
         # assertion
         if self.text_binding != None:
-            assert self.text_binding in [
-                "topleft",
-                "midtop",
-                "topright",
-                "midleft",
-                "center",
-                "midright",
-                "bottomleft",
-                "midbottom",
-                "bottomright",
-            ]
+            assert self.text_binding in ANCHORS, (
+                f"invalid argument for 'text_binding': {self.text_binding}"
+            )
 
         # highlight
-        self.highlight = kw.get("highlight", None)
-        if self.highlight == None:
-            self.highlight = kw.get(self.ABBREVIATIONS["highlight"], None)
+        self.highlight = options.get("highlight", None)
         # assertion
         if self.highlight != None:
             if type(self.highlight) in [tuple, list]:
@@ -470,9 +426,7 @@ class Label:
                 )
 
         # active_area
-        self.active_area = kw.get("active_area", None)
-        if self.active_area == None:
-            self.active_area = kw.get(self.ABBREVIATIONS["active_area"], None)
+        self.active_area = options.get("active_area", None)
         # assertion
         if self.active_area != None:
             if isinstance(self.active_area, (tuple, list)):
@@ -486,38 +440,22 @@ class Label:
                 )
 
         # bold
-        self.bold = kw.get("bold", None)
-        if self.bold == None:
-            self.bold = kw.get(self.ABBREVIATIONS["bold"], None)
-        if self.bold == None:
-            self.bold = False
+        self.bold = options.get("bold", False)
         # assertion
         self.bold = bool(self.bold)
 
         # italic
-        self.italic = kw.get("italic", None)
-        if self.italic == None:
-            self.italic = kw.get(self.ABBREVIATIONS["italic"], None)
-        if self.italic == None:
-            self.italic = False
+        self.italic = options.get("italic", False)
         # assertion
         self.italic = bool(self.italic)
 
         # underline
-        self.underline = kw.get("underline", None)
-        if self.underline == None:
-            self.underline = kw.get(self.ABBREVIATIONS["underline"], None)
-        if self.underline == None:
-            self.underline = False
+        self.underline = options.get("underline", False)
         # assertion
         self.underline = bool(self.underline)
 
         # one_click_manager
-        self.one_click_manager = kw.get("one_click_manager", None)
-        if self.one_click_manager == None:
-            self.one_click_manager = kw.get(
-                self.ABBREVIATIONS["one_click_manager"], None
-            )
+        self.one_click_manager = options.get("one_click_manager", None)
         # assertion
         if self.one_click_manager != None:
             assert isinstance(self.one_click_manager, OneClickManager), (
@@ -525,21 +463,13 @@ class Label:
             )
 
         # margin
-        self.margin = kw.get("margin", None)
-        if self.margin == None:
-            self.margin = kw.get(self.ABBREVIATIONS["margin"], None)
-        if self.margin == None:
-            self.margin = 0
+        self.margin = options.get("margin", 0)
         # assertion
         if self.margin != None:
             self.margin = PositiveInt.parse(self.margin)
 
         # text_align
-        self.text_align = kw.get("text_align", None)
-        if self.text_align == None:
-            self.text_align = kw.get(self.ABBREVIATIONS["text_align"], None)
-        if self.text_align == None:
-            self.text_align = "left"
+        self.text_align = options.get("text_align", "left")
         # assertion
         if self.text_align != None:
             assert self.text_align in [
@@ -548,41 +478,127 @@ class Label:
                 "right",
             ], f"invalid argument for 'text_align': {self.text_align}"
 
+        # cache_text
+        self.cache_text = options.get("cache_text", False)
+        # assertion
+        self.cache_text = bool(self.cache_text)
+
+        # baked
+        self.baked = options.get("baked", False)
+        # assertion
+        self.baked = bool(self.baked)
+        self.__baked_surface__ = None
+        self.__baked_hl_surface__ = None
+        self.__baked_offset__ = (0, 0)
+
+        # glyph_atlas
+        self.glyph_atlas = options.get("glyph_atlas", False)
+        # assertion
+        self.glyph_atlas = bool(self.glyph_atlas)
+        self.__glyph_buffer__ = None
+
+        # see self.begin_update
+        self.__update_depth__ = 0
+        self.__pending_create__ = False
+        self.__pending_bake__ = False
+
         self.__load_font_path()
         self.__create__()
 
+    @classmethod
+    def __parse_kwargs__(cls, kwargs: dict) -> dict:
+        """
+        Returns the given keywords in their long form, including the keywords
+        of the template (if given). Keywords set to None are left out, so
+        their default value will be used.
+        """
+        options = {}
+        for k, v in kwargs.items():
+            name = cls.__ALIASES__.get(k, None)
+            if name is None:
+                raise ValueError(f"Unrecognized keyword argument: {k}")
+            # the long form is preferred over the short form
+            if v is not None and (k == name or name not in options):
+                options[name] = v
+
+        template = options.pop("template", None)
+        if template is not None:
+            assert isinstance(template, dict), (
+                f"invalid argument for 'template': {template}"
+            )
+            for name, v in cls.__parse_template__(template).items():
+                if name not in options:
+                    options[name] = v
+
+        return options
+
+    @classmethod
+    def __parse_template__(cls, template: dict) -> dict:
+        key = (cls, id(template))
+        cached = Label.__TEMPLATES__.get(key, None)
+        if cached is not None and cached[0] is template and cached[1] == template:
+            return cached[2]
+
+        # unknown keywords are ignored, so templates can be shared between widgets
+        options = {}
+        for k, v in template.items():
+            name = cls.__ALIASES__.get(k, None)
+            if name is None or name == "template" or v is None:
+                continue
+            if k == name or name not in options:
+                options[name] = v
+
+        if len(Label.__TEMPLATES__) >= 64:
+            Label.__TEMPLATES__.clear()
+        Label.__TEMPLATES__[key] = (template, template.copy(), options)
+        return options
+
     def __create__(self):
         # setup temporary variables for forced sizes
         forced_w = self.force_width
         forced_h = self.force_height
 
-        font = pygame.font.Font(self.font_path, self.size)
-        font.set_bold(self.bold)
-        font.set_italic(self.italic)
-        font.set_underline(self.underline)
-
-        # Handle Alignment
-        if self.text_align == "center":
-            font.align = pygame.FONT_CENTER
-        elif self.text_align == "left":
-            font.align = pygame.FONT_LEFT
-        elif self.text_align == "right":
-            font.align = pygame.FONT_RIGHT
+        font_key = (
+            self.font_path,
+            self.size,
+            self.bold,
+            self.italic,
+            self.underline,
+            self.text_align,
+        )
+        font = FontCache.get(*font_key)
+        self.__font__ = font
 
         # Render Text
         # We calculate wrap limit: Force Width - (Padding * 2)
         # This ensures text doesn't touch the edges if padding is used.
+        # A wrap limit of 0 only wraps at newlines.
+        wrap_limit = 0
         if forced_w:
             wrap_limit = forced_w
             if self.x_axis_addition > 0:
                 wrap_limit -= self.x_axis_addition * 2
 
-            self.text_surface = font.render(
-                str(self.text), self.antialias, self.textcolor, wraplength=wrap_limit
+        text = str(self.text)
+        text_surface = None
+        if self.glyph_atlas and not self.underline and "\n" not in text:
+            text_surface = GlyphAtlas.get(
+                font, font_key, self.textcolor, self.antialias
+            ).render(text, self.__glyph_buffer__)
+            self.__glyph_buffer__ = text_surface.get_parent()
+            if wrap_limit > 0 and text_surface.get_width() > wrap_limit:
+                # the text has to be wrapped
+                text_surface = None
+
+        if text_surface is not None:
+            self.text_surface = text_surface
+        elif self.cache_text:
+            self.text_surface = TextCache.render(
+                font, font_key, text, self.antialias, self.textcolor, wrap_limit
             )
         else:
             self.text_surface = font.render(
-                str(self.text), self.antialias, self.textcolor
+                text, self.antialias, self.textcolor, wraplength=wrap_limit
             )
 
         self.text_rect = self.text_surface.get_rect()
@@ -628,20 +644,82 @@ class Label:
         # putting everything in correct position
         self.update_pos(self.xy, self.anchor)
 
+        if self.baked:
+            self.__bake__()
+
+    def __bake__(self):
+        # the baked surface covers the background and the text, which
+        # might stick out of the background (text_offset, forced sizes)
+        bake_rect = self.background_rect.union(self.text_rect)
+        self.__baked_offset__ = (
+            bake_rect.x - self.background_rect.x,
+            bake_rect.y - self.background_rect.y,
+        )
+        background_rect = self.background_rect.move(-bake_rect.x, -bake_rect.y)
+        text_rect = self.text_rect.move(-bake_rect.x, -bake_rect.y)
+
+        # blending translucent layers (antialiased text, images) onto an
+        # intermediate surface gives different pixels than blending them onto
+        # the target one after another, so a state is only baked if an opaque
+        # background covers everything (otherwise it is drawn regularly)
+        self.__baked_surface__ = self.__bake_state__(
+            False,
+            self.backgroundcolor,
+            self.image,
+            bake_rect,
+            background_rect,
+            text_rect,
+        )
+        self.__baked_hl_surface__ = None
+        if self.highlight != None:
+            if self.image == None:
+                backgroundcolor, image = self.highlight, None
+            elif self.__has_hl_image__:
+                backgroundcolor, image = self.backgroundcolor, self.hl_image
+            else:
+                backgroundcolor, image = self.backgroundcolor, self.image
+            self.__baked_hl_surface__ = self.__bake_state__(
+                True, backgroundcolor, image, bake_rect, background_rect, text_rect
+            )
+
+    def __bake_state__(
+        self,
+        is_touching: bool,
+        backgroundcolor,
+        image: pygame.Surface,
+        bake_rect: pygame.Rect,
+        background_rect: pygame.Rect,
+        text_rect: pygame.Rect,
+    ) -> pygame.Surface | None:
+        if backgroundcolor == None or pygame.Color(backgroundcolor).a != 255:
+            return None
+        if not self.background_rect.contains(self.text_rect):
+            return None
+        if image != None and not self.background_rect.contains(
+            image.get_rect(topleft=self.background_rect.topleft)
+        ):
+            return None
+
+        if all(radius <= 1 for radius in self.borderradius):
+            surface = pygame.Surface(bake_rect.size)
+            self.__draw_components__(surface, background_rect, text_rect, is_touching)
+            return surface
+
+        # the rounded corners stay transparent (pygame.draw.rect does not
+        # antialias, so the background itself is either opaque or transparent)
+        surface = pygame.Surface(bake_rect.size, pygame.SRCALPHA)
+        surface.fill((0, 0, 0, 0))
+        self.__draw_components__(surface, background_rect, text_rect, is_touching)
+        # text or image pixels on the transparent corners are only reproduced
+        # exactly if they are opaque as well
+        visible = pygame.mask.from_surface(surface, 0).count()
+        if pygame.mask.from_surface(surface, 254).count() != visible:
+            return None
+        return surface
+
     def __load_font_path(self):
         if self.font_file is None:
-            fonts = [
-                f.removesuffix(".ttf")
-                for f in os.listdir(
-                    os.path.join(os.path.dirname(__file__), "..", "fonts")
-                )
-            ]
-            if self.font.lower() in fonts:
-                self.font_path = os.path.join(
-                    os.path.dirname(__file__), "..", "fonts", self.font.lower() + ".ttf"
-                )
-            else:
-                self.font_path = pygame.font.match_font(self.font)
+            self.font_path = FontRegistry.resolve(self.font)
         else:
             self.font_path = self.font_file
 
@@ -652,47 +730,7 @@ class Label:
         if self.surface is None:
             raise Exception("no surface given to draw to")
 
-        if self.backgroundcolor != None:
-            if self.__is_touching__ and self.image == None:
-                pygame.draw.rect(
-                    self.surface,
-                    self.highlight,
-                    self.background_rect,
-                    0,
-                    border_top_left_radius=self.borderradius[0],
-                    border_top_right_radius=self.borderradius[1],
-                    border_bottom_right_radius=self.borderradius[2],
-                    border_bottom_left_radius=self.borderradius[3],
-                )
-            else:
-                pygame.draw.rect(
-                    self.surface,
-                    self.backgroundcolor,
-                    self.background_rect,
-                    0,
-                    border_top_left_radius=self.borderradius[0],
-                    border_top_right_radius=self.borderradius[1],
-                    border_bottom_right_radius=self.borderradius[2],
-                    border_bottom_left_radius=self.borderradius[3],
-                )
-        if self.image != None:
-            if self.__has_hl_image__ and self.__is_touching__:
-                self.surface.blit(self.hl_image, self.background_rect)
-            else:
-                self.surface.blit(self.image, self.background_rect)
-
-        if self.borderwidth > 0:
-            pygame.draw.rect(
-                self.surface,
-                self.bordercolor,
-                self.background_rect,
-                self.borderwidth,
-                border_top_left_radius=self.borderradius[0],
-                border_top_right_radius=self.borderradius[1],
-                border_bottom_right_radius=self.borderradius[2],
-                border_bottom_left_radius=self.borderradius[3],
-            )
-        self.surface.blit(self.text_surface, self.text_rect)
+        self.__draw_to__(self.surface)
 
     def draw_to(self, surface: pygame.Surface):
         """
@@ -702,12 +740,41 @@ class Label:
             f"invalid argument for 'surface': {surface}"
         )
 
+        self.__draw_to__(surface)
+
+    def __draw_to__(self, surface: pygame.Surface):
+        baked_surface = None
+        if self.baked:
+            if self.__is_touching__ and self.highlight != None:
+                baked_surface = self.__baked_hl_surface__
+            else:
+                baked_surface = self.__baked_surface__
+        if baked_surface != None:
+            surface.blit(
+                baked_surface,
+                (
+                    self.background_rect.x + self.__baked_offset__[0],
+                    self.background_rect.y + self.__baked_offset__[1],
+                ),
+            )
+        else:
+            self.__draw_components__(
+                surface, self.background_rect, self.text_rect, self.__is_touching__
+            )
+
+    def __draw_components__(
+        self,
+        surface: pygame.Surface,
+        background_rect: pygame.Rect,
+        text_rect: pygame.Rect,
+        is_touching: bool,
+    ):
         if self.backgroundcolor != None:
-            if self.__is_touching__ and self.image == None:
+            if is_touching and self.image == None:
                 pygame.draw.rect(
                     surface,
                     self.highlight,
-                    self.background_rect,
+                    background_rect,
                     0,
                     border_top_left_radius=self.borderradius[0],
                     border_top_right_radius=self.borderradius[1],
@@ -718,7 +785,7 @@ class Label:
                 pygame.draw.rect(
                     surface,
                     self.backgroundcolor,
-                    self.background_rect,
+                    background_rect,
                     0,
                     border_top_left_radius=self.borderradius[0],
                     border_top_right_radius=self.borderradius[1],
@@ -726,23 +793,41 @@ class Label:
                     border_bottom_left_radius=self.borderradius[3],
                 )
         if self.image != None:
-            if self.__has_hl_image__ and self.__is_touching__:
-                surface.blit(self.hl_image, self.background_rect)
+            if self.__has_hl_image__ and is_touching:
+                surface.blit(self.hl_image, background_rect)
             else:
-                surface.blit(self.image, self.background_rect)
+                surface.blit(self.image, background_rect)
 
         if self.borderwidth > 0:
             pygame.draw.rect(
                 surface,
                 self.bordercolor,
-                self.background_rect,
+                background_rect,
                 self.borderwidth,
                 border_top_left_radius=self.borderradius[0],
                 border_top_right_radius=self.borderradius[1],
                 border_bottom_right_radius=self.borderradius[2],
                 border_bottom_left_radius=self.borderradius[3],
             )
-        surface.blit(self.text_surface, self.text_rect)
+        surface.blit(self.text_surface, text_rect)
+
+    def __get_draw_state__(self) -> tuple:
+        # everything that affects the look of the widget (used by WidgetGroup)
+        return (
+            self.text_surface,
+            self.image,
+            self.__is_touching__,
+            self.backgroundcolor,
+            self.highlight,
+            self.bordercolor,
+            self.borderwidth,
+            tuple(self.background_rect),
+            tuple(self.text_rect),
+            self.__baked_surface__,
+        )
+
+    def __get_draw_rect__(self) -> pygame.Rect:
+        return self.background_rect.union(self.text_rect)
 
     def update_text(self, text):
         """
@@ -751,7 +836,7 @@ class Label:
         """
         if str(text) != str(self.text):
             self.text = str(text)
-            self.__create__()
+            self.__request_create__()
 
     def update_colors(self, textcolor=None, backgroundcolor=None, bordercolor=None):
         """
@@ -762,7 +847,7 @@ class Label:
         """
         if textcolor != None and textcolor != self.textcolor:
             self.textcolor = Color.parse(textcolor)
-            self.__create__()
+            self.__request_create__()
         if backgroundcolor != None and backgroundcolor != self.backgroundcolor:
             c = Color.parse(backgroundcolor)
             self.backgroundcolor = c
@@ -773,16 +858,20 @@ class Label:
                 min(self.backgroundcolor[1] + val, 255),
                 min(self.backgroundcolor[2] + val, 255),
             )
-            self.__create__()
+            self.__request_create__()
         if bordercolor != None and bordercolor != self.bordercolor:
             self.bordercolor = Color.parse(bordercolor)
+            self.__request_bake__()
 
     def update_borderwidth(self, borderwidth: int):
         """
         Updates the borderwidth of the widget. Call
         this method before drawing to the screen.
         """
-        self.borderwidth = PositiveInt.parse(borderwidth)
+        borderwidth = PositiveInt.parse(borderwidth)
+        if borderwidth != self.borderwidth:
+            self.borderwidth = borderwidth
+            self.__request_bake__()
 
     def update_pos(self, xy, anchor=None):
         """
@@ -790,20 +879,9 @@ class Label:
         method before drawing to the screen.
         """
         self.xy = Coordinate.parse(xy)
-        if anchor not in [
-            "topleft",
-            "topright",
-            "bottomleft",
-            "bottomright",
-            "center",
-            "midtop",
-            "midright",
-            "midbottom",
-            "midleft",
-            None,
-        ]:
-            raise ValueError(f"invalid argument for 'anchor': {anchor}")
         if anchor is not None:
+            if anchor not in ANCHORS:
+                raise ValueError(f"invalid argument for 'anchor': {anchor}")
             self.anchor = anchor
 
         self.positioning_rect.__setattr__(self.anchor, self.xy)
@@ -817,33 +895,43 @@ class Label:
             ),
         )
 
-        # data # should actually be accessed through 'self.rect.' but I
-        # will leave it as it is to not break any programs
-        self.topleft = self.positioning_rect.topleft
-        self.topright = self.positioning_rect.topright
-        self.bottomleft = self.positioning_rect.bottomleft
-        self.bottomright = self.positioning_rect.bottomright
-        self.center = self.positioning_rect.center
-        self.midtop = self.positioning_rect.midtop
-        self.midright = self.positioning_rect.midright
-        self.midbottom = self.positioning_rect.midbottom
-        self.midleft = self.positioning_rect.midleft
-        self.left = self.positioning_rect.left
-        self.right = self.positioning_rect.right
-        self.top = self.positioning_rect.top
-        self.bottom = self.positioning_rect.bottom
-
-        self.rect = self.positioning_rect
-
-        # for buttons:
-        self.x_range = (
-            self.background_rect.x,
-            self.background_rect.x + self.background_rect.width,
-        )
-        self.y_range = (
-            self.background_rect.y,
-            self.background_rect.y + self.background_rect.height,
-        )
+    def move_to(self, xy: tuple, anchor: str = None):
+        """
+        Moves the anchor of the widget to <xy> (a tuple of two numbers).
+        Unlike self.update_pos, the position is not validated and only
+        the rects are moved, which makes this method suitable for
+        widgets that are moved every frame.
+
+        If <anchor> is given, that point of the widget is moved to <xy>
+        instead (the anchor of the widget does not change).
+        """
+        if anchor is not None and anchor != self.anchor:
+            rect = self.positioning_rect.copy()
+            setattr(rect, anchor, xy)
+            xy = getattr(rect, self.anchor)
+        old_x, old_y = self.positioning_rect.topleft
+        self.xy = xy
+        self.positioning_rect.__setattr__(self.anchor, xy)
+        dx = self.positioning_rect.x - old_x
+        dy = self.positioning_rect.y - old_y
+        self.background_rect.move_ip(dx, dy)
+        self.text_rect.move_ip(dx, dy)
+
+    def move_by(self, dx: float, dy: float):
+        """
+        Moves the widget by <dx> and <dy> pixels (see self.move_to).
+        """
+        self.move_to((self.xy[0] + dx, self.xy[1] + dy))
+
+    @staticmethod
+    def move_many(widgets: list, dx: float, dy: float):
+        """
+        Moves all given widgets by <dx> and <dy> pixels, for example to
+        scroll a whole panel. Buttons in a ButtonGrid have to be refreshed
+        afterwards.
+        """
+        for widget in widgets:
+            widget.move_to((widget.xy[0] + dx, widget.xy[1] + dy))
 
     def set_style(self, bold: bool = None, italic: bool = None, underline: bool = None):
         old_bold = self.bold
@@ -860,7 +948,172 @@ class Label:
             or old_italic != self.italic
             or old_underline != self.underline
         ):
+            self.__request_create__()
+
+    def begin_update(self):
+        """
+        Starts collecting changes: methods like self.update_text,
+        self.update_colors or self.set_style do not rebuild the widget
+        until self.end_update is called, so multiple changes within a
+        frame only cause a single rebuild. Calls can be nested.
+
+        IMPORTANT: until then, the rects and surfaces of the widget
+        still show its old state.
+        """
+        self.__update_depth__ += 1
+
+    def end_update(self):
+        """
+        Stops collecting changes (see self.begin_update) and rebuilds the
+        widget once if anything has changed.
+        """
+        assert self.__update_depth__ > 0, "end_update called without begin_update"
+        self.__update_depth__ -= 1
+        if self.__update_depth__ == 0:
+            if self.__pending_create__:
+                self.__create__()
+            elif self.__pending_bake__ and self.baked:
+                self.__bake__()
+            self.__pending_create__ = False
+            self.__pending_bake__ = False
+
+    def __request_create__(self):
+        if self.__update_depth__ > 0:
+            self.__pending_create__ = True
+        else:
             self.__create__()
 
+    def __request_bake__(self):
+        if self.__update_depth__ > 0:
+            self.__pending_bake__ = True
+        elif self.baked:
+            self.__bake__()
+
     def get_rect(self) -> pygame.Rect:
         return self.rect
+
+    # data # should actually be accessed through 'self.rect.' but I
+    # will leave it as it is to not break any programs
+    # (derived from the rects when needed, so moving a widget stays cheap)
+
+    @property
+    def rect(self) -> pygame.Rect:
+        return self.positioning_rect
+
+    @rect.setter
+    def rect(self, value: pygame.Rect):
+        # moves the widget to the position of <value>, its size does not change
+        self.move_to(pygame.Rect(value).topleft, "topleft")
+
+    @property
+    def topleft(self) -> tuple[int, int]:
+        return self.positioning_rect.topleft
+
+    @topleft.setter
+    def topleft(self, value: tuple):
+        self.move_to(value, "topleft")
+
+    @property
+    def topright(self) -> tuple[int, int]:
+        return self.positioning_rect.topright
+
+    @topright.setter
+    def topright(self, value: tuple):
+        self.move_to(value, "topright")
+
+    @property
+    def bottomleft(self) -> tuple[int, int]:
+        return self.positioning_rect.bottomleft
+
+    @bottomleft.setter
+    def bottomleft(self, value: tuple):
+        self.move_to(value, "bottomleft")
+
+    @property
+    def bottomright(self) -> tuple[int, int]:
+        return self.positioning_rect.bottomright
+
+    @bottomright.setter
+    def bottomright(self, value: tuple):
+        self.move_to(value, "bottomright")
+
+    @property
+    def center(self) -> tuple[int, int]:
+        return self.positioning_rect.center
+
+    @center.setter
+    def center(self, value: tuple):
+        self.move_to(value, "center")
+
+    @property
+    def midtop(self) -> tuple[int, int]:
+        return self.positioning_rect.midtop
+
+    @midtop.setter
+    def midtop(self, value: tuple):
+        self.move_to(value, "midtop")
+
+    @property
+    def midright(self) -> tuple[int, int]:
+        return self.positioning_rect.midright
+
+    @midright.setter
+    def midright(self, value: tuple):
+        self.move_to(value, "midright")
+
+    @property
+    def midbottom(self) -> tuple[int, int]:
+        return self.positioning_rect.midbottom
+
+    @midbottom.setter
+    def midbottom(self, value: tuple):
+        self.move_to(value, "midbottom")
+
+    @property
+    def midleft(self) -> tuple[int, int]:
+        return self.positioning_rect.midleft
+
+    @midleft.setter
+    def midleft(self, value: tuple):
+        self.move_to(value, "midleft")
+
+    @property
+    def left(self) -> int:
+        return self.positioning_rect.left
+
+    @left.setter
+    def left(self, value: int):
+        self.move_to((value, self.positioning_rect.centery), "midleft")
+
+    @property
+    def right(self) -> int:
+        return self.positioning_rect.right
+
+    @right.setter
+    def right(self, value: int):
+        self.move_to((value, self.positioning_rect.centery), "midright")
+
+    @property
+    def top(self) -> int:
+        return self.positioning_rect.top
+
+    @top.setter
+    def top(self, value: int):
+        self.move_to((self.positioning_rect.centerx, value), "midtop")
+
+    @property
+    def bottom(self) -> int:
+        return self.positioning_rect.bottom
+
+    @bottom.setter
+    def bottom(self, value: int):
+        self.move_to((self.positioning_rect.centerx, value), "midbottom")
+
+    # for buttons:
+    @property
+    def x_range(self) -> tuple[int, int]:
+        return (self.background_rect.left, self.background_rect.right)
+
+    @property
+    def y_range(self) -> tuple[int, int]:
+        return (self.background_rect.top, self.background_rect.bottom)
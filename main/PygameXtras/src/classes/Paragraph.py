@@ -1,4 +1,6 @@
 import pygame
+
+from .FontCache import FontCache
 from .Label import Label
 
 
@@ -97,6 +99,11 @@ class Paragraph:
                 makes the self.update method only work if the mouse click / hovering is also within the specified rect; useful if
                 buttons are moveable but should not be clickable if they are outside a certain area
                 Type: tuple, list, pygame.Rect
+            composed
+                renders all lines into a single surface using one font instead of creating a
+                Label for every line, so drawing only takes a single blit; recommended for
+                long texts (images are not supported in this mode)
+                Type: bool
 
         All custom arguments can also be used in their short form (eg. "aa" instead of "antialias").
         To see what all the short forms look like, inspect the self.ABBREVIATIONS attribute.
@@ -122,6 +129,7 @@ class Paragraph:
             "text_binding": "tb",
             "highlight": "hl",
             "active_area": "aA",
+            "composed": "cp",
         }
 
         self.surface = surface
@@ -425,43 +433,170 @@ class Paragraph:
                     f"invalid argument for 'active_area': {self.active_area}"
                 )
 
-        self.kwargs = kwargs
+        # composed
+        self.composed = kw.get("composed", None)
+        if self.composed == None:
+            self.composed = kw.get(self.ABBREVIATIONS["composed"], None)
+        if self.composed == None:
+            self.composed = False
+        # assertion
+        self.composed = bool(self.composed)
+
+        # keywords only used by the paragraph itself are not passed to the labels
+        self.kwargs = {
+            k: v
+            for k, v in kwargs.items()
+            if k not in ("binding_rect", "bR", "composed", "cp")
+        }
         self.__create__()
 
     def __create__(self):
-        self.__labels__: list[Label] = []
-        strings = self.text.split("\n")
-        width = 0
-        height = 0
-        for string in strings:
-            l = Label(self.surface, string, self.size, self.xy, **self.kwargs)
-            width = max(width, l.rect.width)
-            height = max(height, l.rect.height)
+        self.__borderwidth__ = self.borderwidth
+        self.__borderradius__ = self.borderradius
+        self.__bordercolor__ = self.bordercolor
 
+        if self.composed:
+            # a single label is used to parse the keywords (the same way they
+            # are parsed for every line when not composed)
+            style = Label(None, "", self.size, self.xy, self.anchor, **self.kwargs)
+            self.__style__ = style
+            self.__font__ = FontCache.get(
+                style.font_path,
+                style.size,
+                style.bold,
+                style.italic,
+                style.underline,
+                style.text_align,
+            )
+            self.__wrap_limit__ = 0
+            if style.force_width:
+                self.__wrap_limit__ = style.force_width - style.x_axis_addition * 2
+
+        self.__lines__: list[str] = []
+        self.__sizes__: list[tuple[int, int]] = []  # natural size of every line
+        self.__items__: list = []  # Label or text surface of every line
+        self.__box__ = (0, 0)  # size of every line (size of the largest line)
+        self.__version__ = 0
+        self.__relayout__(str(self.text).split("\n"))
+
+    @property
+    def text(self) -> str:
+        if self.__text__ is None:
+            self.__text__ = "\n".join(self.__lines__)
+        return self.__text__
+
+    @text.setter
+    def text(self, text):
+        self.__text__ = text
+
+    def __measure__(self, line: str) -> tuple[tuple[int, int], object]:
+        # returns the natural size of the line and its text surface (if composed)
+        if not self.composed:
+            label = Label(self.surface, line, self.size, self.xy, **self.kwargs)
+            return label.rect.size, None
+
+        style = self.__style__
+        text_surface = self.__font__.render(
+            line, style.antialias, style.textcolor, wraplength=self.__wrap_limit__
+        )
+        width = style.force_width
+        if width == None:
+            width = text_surface.get_width() + style.x_axis_addition * 2
+        height = style.force_height
+        if height == None:
+            height = text_surface.get_height() + style.y_axis_addition * 2
+        return (width, height), text_surface
+
+    def __relayout__(self, lines: list[str]):
+        count = len(self.__lines__)
+        if 0 < count <= len(lines) and lines[:count] == self.__lines__:
+            # lines have only been added at the end
+            for line in lines[count:]:
+                self.__append__(line)
+            return
+
+        # everything measured / rendered for lines that did not change is reused
+        reusable: dict[str, list] = {}
+        for line, size, item in zip(self.__lines__, self.__sizes__, self.__items__):
+            reusable.setdefault(line, []).append((size, item))
+        sizes = []
+        items = []
+        for line in lines:
+            if len(reusable.get(line, ())) > 0:
+                size, item = reusable[line].pop()
+            else:
+                size, item = self.__measure__(line)
+            sizes.append(size)
+            items.append(item)
+
+        self.__lines__ = lines
+        self.__sizes__ = sizes
+        self.__items__ = items
+        self.__text__ = None
+        self.__layout__()
+
+    def __layout__(self):
+        box = (
+            max(size[0] for size in self.__sizes__),
+            max(size[1] for size in self.__sizes__),
+        )
+        if box != self.__box__ and not self.composed:
+            # every label is created with the size of the largest line
+            self.__items__ = [None] * len(self.__lines__)
+        self.__box__ = box
+
+        if self.composed:
+            self.__compose__()
+            return
+
+        for index, line in enumerate(self.__lines__):
+            if self.__items__[index] is None:
+                self.__items__[index] = self.__create_label__(index, line)
+            else:
+                self.__items__[index].update_pos(self.__get_line_xy__(index))
+        self.__labels__ = self.__items__
+        self.__update_rect__()
+
+    def __append__(self, line: str):
+        size, item = self.__measure__(line)
+        self.__lines__.append(line)
+        self.__sizes__.append(size)
+        self.__items__.append(item)
+        self.__text__ = None
+
+        if size[0] > self.__box__[0] or size[1] > self.__box__[1]:
+            # the size of every line changes
+            self.__layout__()
+            return
+
+        index = len(self.__lines__) - 1
+        if self.composed:
+            self.__compose_last_line__()
+            return
+        self.__items__[index] = self.__create_label__(index, line)
+        self.__labels__ = self.__items__
+        self.__update_rect__()
+
+    def __get_line_xy__(self, index: int) -> tuple:
+        return (self.xy[0], self.xy[1] + self.__box__[1] * index)
+
+    def __create_label__(self, index: int, line: str) -> Label:
         # removing some arguments by setting them to default
-        # bR, fd
+        # fd, bw, br
         parsed_kwargs = self.kwargs.copy()
-        parsed_kwargs["bR"] = 1
-        parsed_kwargs["fd"] = (width, height)
-        self.__borderwidth__ = self.borderwidth
+        parsed_kwargs["fd"] = self.__box__
         parsed_kwargs["bw"] = 0
-        self.__borderradius__ = self.borderradius
         parsed_kwargs["br"] = (0, 0, 0, 0)
-        self.__bordercolor__ = self.bordercolor
-        # kwargs["bc"] = (0, 0, 0) # not needed
-
-        for count, string in enumerate(strings):
-            self.__labels__.append(
-                Label(
-                    self.surface,
-                    string,
-                    self.size,
-                    (self.xy[0], self.xy[1] + height * count),
-                    self.anchor,
-                    **parsed_kwargs,
-                )
-            )
+        return Label(
+            self.surface,
+            line,
+            self.size,
+            self.__get_line_xy__(index),
+            self.anchor,
+            **parsed_kwargs,
+        )
 
+    def __update_rect__(self):
         fl = self.__labels__[0]  # first label
         ll = self.__labels__[-1]  # last label
         self.rect = pygame.Rect(
@@ -471,7 +606,113 @@ class Paragraph:
             ll.rect.bottom - fl.rect.top,
         )
 
+    def __place_line__(self, index: int) -> tuple[pygame.Rect, pygame.Rect]:
+        # returns the background_rect and the text_rect of a line (relative to self.rect)
+        style = self.__style__
+        width, height = self.__box__
+        background_rect = pygame.Rect(0, height * index, width, height).inflate(
+            -2 * style.margin, -2 * style.margin
+        )
+        text_rect = self.__items__[index].get_rect()
+        coords = getattr(background_rect, style.text_binding)
+        text_rect.__setattr__(
+            style.text_binding,
+            (coords[0] + style.text_offset[0], coords[1] + style.text_offset[1]),
+        )
+        return background_rect, text_rect
+
+    def __draw_line__(self, index: int, background_rect, text_rect):
+        offset = self.__surface_rect__.topleft
+        if self.__style__.backgroundcolor != None:
+            pygame.draw.rect(
+                self.__surface__,
+                self.__style__.backgroundcolor,
+                background_rect.move(-offset[0], -offset[1]),
+            )
+        self.__surface__.blit(
+            self.__items__[index], text_rect.move(-offset[0], -offset[1])
+        )
+
+    def __draw_border__(self):
+        if self.__borderwidth__ > 0:
+            pygame.draw.rect(
+                self.__surface__,
+                self.__bordercolor__,
+                (
+                    -self.__surface_rect__.x,
+                    -self.__surface_rect__.y,
+                    self.rect.width,
+                    self.rect.height,
+                ),
+                self.__borderwidth__,
+                *self.__borderradius__,
+            )
+
+    def __compose__(self):
+        # renders all lines into a single surface
+        self.__labels__ = []
+        width, height = self.__box__
+        self.rect = pygame.Rect(0, 0, width, height)
+        self.rect.__setattr__(self.anchor, self.xy)
+        self.rect.height = height * len(self.__lines__)
+
+        placed = [self.__place_line__(i) for i in range(len(self.__lines__))]
+
+        # the surface covers the paragraph and the texts, which might stick out
+        self.__surface_rect__ = pygame.Rect(0, 0, width, self.rect.height).unionall(
+            [text_rect for _, text_rect in placed]
+        )
+        self.__surface__ = pygame.Surface(self.__surface_rect__.size, pygame.SRCALPHA)
+        for index, (background_rect, text_rect) in enumerate(placed):
+            self.__draw_line__(index, background_rect, text_rect)
+        self.__draw_border__()
+        self.__version__ += 1
+
+    def __compose_last_line__(self):
+        # draws the last line into the existing surface; only possible if
+        # no text sticks out of its line (otherwise lines would overlap) and
+        # the rounded corners of the border do not reach beyond the last line
+        index = len(self.__lines__) - 1
+        width, height = self.__box__
+        background_rect, text_rect = self.__place_line__(index)
+        old_height = height * index
+        if (
+            self.__surface_rect__ != (0, 0, width, old_height)
+            or not pygame.Rect(0, old_height, width, height).contains(text_rect)
+            or (self.__borderwidth__ > 0 and max(self.__borderradius__) > height)
+        ):
+            self.__compose__()
+            return
+
+        self.rect.height = old_height + height
+        self.__surface_rect__.height = self.rect.height
+        if self.__surface__.get_height() < self.rect.height:
+            # growing exponentially, so appending lines stays cheap
+            surface = pygame.Surface(
+                (width, max(self.rect.height, self.__surface__.get_height() * 2)),
+                pygame.SRCALPHA,
+            )
+            surface.blit(self.__surface__, (0, 0))
+            self.__surface__ = surface
+
+        # the previous line is redrawn, since the border was drawn around it
+        area = pygame.Rect(0, old_height - height, width, height * 2)
+        self.__surface__.fill((0, 0, 0, 0), area)
+        self.__draw_line__(index - 1, *self.__place_line__(index - 1))
+        self.__draw_line__(index, background_rect, text_rect)
+        self.__surface__.set_clip(area)
+        self.__draw_border__()
+        self.__surface__.set_clip(None)
+        self.__version__ += 1
+
     def draw(self):
+        if self.composed:
+            self.surface.blit(
+                self.__surface__,
+                self.rect.move(self.__surface_rect__.topleft),
+                ((0, 0), self.__surface_rect__.size),
+            )
+            return
         for label in self.__labels__:
             label.draw()
         if self.__borderwidth__ > 0:
@@ -483,10 +724,41 @@ class Paragraph:
                 *self.__borderradius__,
             )
 
+    def __get_draw_state__(self) -> tuple:
+        # everything that affects the look of the widget (used by WidgetGroup)
+        if self.composed:
+            return (self.__surface__, self.__version__, tuple(self.rect))
+        return (
+            tuple(label.__get_draw_state__() for label in self.__labels__),
+            self.__bordercolor__,
+            self.__borderwidth__,
+            tuple(self.rect),
+        )
+
+    def __get_draw_rect__(self) -> pygame.Rect:
+        if self.composed:
+            return self.__surface_rect__.move(self.rect.topleft)
+        return self.rect.unionall(
+            [label.__get_draw_rect__() for label in self.__labels__]
+        )
+
     def update_text(self, text: str):
+        """
+        Updates the text of the paragraph. Only lines that have changed are
+        rendered again.
+        """
         if str(text) != str(self.text):
-            self.text = str(text)
-            self.__create__()
+            self.__relayout__(str(text).split("\n"))
+
+    def append_line(self, text: str):
+        """
+        Adds a line (or multiple lines, using '\n') to the end of the
+        paragraph. Unless the new line is larger than all previous lines,
+        only the new line is rendered, which makes this method suitable
+        for logs or chats.
+        """
+        for line in str(text).split("\n"):
+            self.__append__(line)
 
     def update_colors(self, textcolor=None, backgroundcolor=None, bordercolor=None):
         if textcolor != None:
@@ -496,6 +768,7 @@ class Paragraph:
             ], f"invalid argument for 'textcolor': {textcolor}"
             assert len(textcolor) == 3, f"invalid argument for 'textcolor': {textcolor}"
             self.textcolor = textcolor
+            self.kwargs["textcolor"] = textcolor
             self.__create__()
         if backgroundcolor != None:
             assert type(backgroundcolor) in [
@@ -507,6 +780,7 @@ class Paragraph:
             )
             self.backgroundcolor = backgroundcolor
             self.backgroundcolor_init = backgroundcolor
+            self.kwargs["backgroundcolor"] = backgroundcolor
             val = 50
             self.highlight = (
                 min(self.backgroundcolor[0] + val, 255),
@@ -523,3 +797,4 @@ class Paragraph:
                 f"invalid argument for 'bordercolor': {bordercolor}"
             )
             self.bordercolor = bordercolor
+            self.__create__()
@@ -55,7 +55,7 @@ class PopupMessage(Label):
         x = abs(self.time - time.time())
         dx = self.__dx * self.__f.get(x)
         dy = self.__dy * self.__f.get(x)
-        self.update_pos((self.__passive_xy[0] + dx, self.__passive_xy[1] + dy))
+        self.move_to((self.__passive_xy[0] + dx, self.__passive_xy[1] + dy))
 
     def show(self, text, seconds=4):
         self.__f.reset()
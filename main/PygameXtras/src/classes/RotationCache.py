@@ -0,0 +1,100 @@
+from collections import OrderedDict
+
+import pygame
+
+
+class RotationCache:
+    """
+    Process-wide cache for rotated images.
+
+    Used by Entities (see Entity.set_rotation). Rotated surfaces are keyed
+    by (image, angle), so entities sharing the same frames (for example
+    from the same Spritesheet) also share their rotated versions and every
+    frame is only rotated once per angle. Angles can be quantized with
+    Entity.set_rotation_step to limit the number of rotated versions.
+
+    The cache is bounded by the total number of bytes of all stored
+    surfaces ('max_bytes') and evicts in least-recently-used order.
+
+    IMPORTANT: the returned surfaces are shared and must not be modified.
+    """
+
+    max_bytes: int = 32 * 1024 * 1024
+    hits: int = 0
+    misses: int = 0
+    __surfaces: OrderedDict = OrderedDict()
+    __bytes: int = 0
+
+    @staticmethod
+    def rotate(image: pygame.Surface, angle: int) -> pygame.Surface:
+        """
+        Returns <image> rotated by <angle> degrees (counterclockwise, like
+        pygame.transform.rotate), rotating it only if it is not cached yet.
+        """
+        angle %= 360
+        if angle == 0:
+            return image
+
+        key = (image, angle)
+        surface = RotationCache.__surfaces.get(key, None)
+        if surface is not None:
+            RotationCache.__surfaces.move_to_end(key)
+            RotationCache.hits += 1
+            return surface
+
+        RotationCache.misses += 1
+        surface = pygame.transform.rotate(image, angle)
+        size = RotationCache.__get_bytes(surface)
+        if size > RotationCache.max_bytes:
+            # would evict everything else and still not fit
+            return surface
+
+        RotationCache.__surfaces[key] = surface
+        RotationCache.__bytes += size
+        RotationCache.__shrink()
+        return surface
+
+    @staticmethod
+    def __get_bytes(surface: pygame.Surface) -> int:
+        return surface.get_pitch() * surface.get_height()
+
+    @staticmethod
+    def __shrink() -> None:
+        while RotationCache.__bytes > RotationCache.max_bytes:
+            _, surface = RotationCache.__surfaces.popitem(last=False)
+            RotationCache.__bytes -= RotationCache.__get_bytes(surface)
+
+    @staticmethod
+    def set_max_bytes(max_bytes: int) -> None:
+        """
+        Sets the maximum number of bytes all cached surfaces may occupy,
+        evicting the least recently used surfaces if necessary.
+        """
+        assert type(max_bytes) == int, f"invalid argument for 'max_bytes': {max_bytes}"
+        assert max_bytes >= 0, f"invalid argument for 'max_bytes': {max_bytes}"
+        RotationCache.max_bytes = max_bytes
+        RotationCache.__shrink()
+
+    @staticmethod
+    def clear() -> None:
+        """
+        Removes all cached surfaces and resets the counters.
+        """
+        RotationCache.__surfaces.clear()
+        RotationCache.__bytes = 0
+        RotationCache.hits = 0
+        RotationCache.misses = 0
+
+    @staticmethod
+    def get_stats() -> dict:
+        """
+        Returns a dict containing the number of hits and misses, the number
+        of cached surfaces and the number of bytes they occupy.
+        """
+        return {
+            "hits": RotationCache.hits,
+            "misses": RotationCache.misses,
+            "size": len(RotationCache.__surfaces),
+            "bytes": RotationCache.__bytes,
+            "max_bytes": RotationCache.max_bytes,
+        }
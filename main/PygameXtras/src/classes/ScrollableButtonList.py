@@ -1,5 +1,6 @@
 import pygame
 from .Button import Button
+from .EventRouter import EventRouter
 
 
 class ScrollableButtonList:
@@ -9,10 +10,17 @@ class ScrollableButtonList:
         target_rect: tuple[int, int, int, int],
         scrolling_speed: int,
         backgroundcolor: tuple = (0, 0, 0),
+        overscan: int = 2,
     ):
         """
         target_rect specifies the area in which buttons will be visible
 
+        only the buttons within the visible area (and <overscan> rows above and
+        below) are created; while scrolling, these buttons are reused for the
+        rows that become visible, so even lists with thousands of entries are
+        cheap. all buttons have the same height (the height of a button with a
+        single line of text).
+
         to update the buttons, use:
             for b in self.get_buttons():
                 if b.update(event_list, offset=self.get_offset()):
@@ -64,38 +72,67 @@ class ScrollableButtonList:
         )
         self.__backgroundcolor__ = backgroundcolor
 
+        assert type(overscan) == int, f"invalid argument for 'overscan': {overscan}"
+        assert overscan >= 0, f"invalid argument for 'overscan': {overscan}"
+        self.__overscan__ = overscan
+
         self.__scroll__ = 0
-        self.__max_scroll__ = (
-            self.__surface__.get_height() - self.__target_rect__.height
-        )  #! has to be reconfigured if anything changes
+        self.__max_scroll__ = 0  #! has to be reconfigured if anything changes
 
         self.__button_names__: list[str] = []
-        self.__old_button_names__: list[str] = []
-        self.__buttons__: list[Button] = []
+        self.__names_changed__ = False
+        self.__buttons__: list[Button] = []  # buttons of the rows in the window
+        self.__rows__: dict[int, Button] = {}  # row -> button
+        self.__spare__: list[Button] = []  # buttons that can be reused
+        self.__painted__: dict[Button, tuple] = {}  # button -> (state, rect) drawn
+        self.__painted_window__ = None  # the window the surface has been drawn for
+        self.__window__ = (0, 0)  # first and last (exclusive) row with a button
+        self.__button_height__ = 0
+        self.__row_height__ = 0  # set by self.set_button_style
 
         self.__int_surf__ = pygame.Surface((10, 10))  # internal surface
 
     def set_button_style(self, size: int, **kwargs):
         """dont forget about the backgroundcolor and the height"""
-        try:
-            Button(
-                self.__int_surf__,
-                "Test",
-                size=size,
-                xy=(0, 0),
-                anchor="topleft",
-                **kwargs,
+        kwargs["fw"] = self.__target_rect__.width
+        kwargs["aA"] = self.__target_rect__
+        button = Button(
+            self.__int_surf__,
+            "Test",
+            size=size,
+            xy=(0, 0),
+            anchor="topleft",
+            **kwargs,
+        )
+        self.__size__ = size
+        self.__style__ = kwargs
+        # the borders of neighbouring buttons overlap
+        self.__button_height__ = button.rect.height
+        self.__row_height__ = button.rect.height - button.borderwidth
+        assert self.__row_height__ > 0, (
+            f"invalid argument for 'borderwidth': {button.borderwidth}"
+        )
+        self.__style__["fh"] = self.__button_height__
+
+        # the surface only has to hold the rows of the window
+        rows = self.__target_rect__.height // self.__row_height__ + 2
+        rows += 2 * self.__overscan__
+        self.__surface__ = pygame.Surface(
+            (
+                self.__target_rect__.width,
+                rows * self.__row_height__ + button.borderwidth,
             )
-            self.__size__ = size
-            kwargs["bR"] = 1  # important !
-            kwargs["fw"] = self.__target_rect__.width
-            kwargs["aA"] = self.__target_rect__
-            self.__style__ = kwargs
-        except Exception as e:
-            raise e
+        )
+        self.__rows__ = {}
+        self.__spare__ = []
+        self.__painted__ = {}
+        self.__painted_window__ = None
+        self.__buttons__ = []
+        self.__names_changed__ = True
 
     def add_button(self, button_name: str):
         self.__button_names__.append(str(button_name))
+        self.__names_changed__ = True
 
     def add_buttons(self, button_names: list[str]):
         for button in button_names:
@@ -104,68 +141,101 @@ class ScrollableButtonList:
     def clear_buttons(self):
         """removes all buttons"""
         self.__button_names__ = []
+        self.__names_changed__ = True
 
     def reset_scroll(self):
         """resets the scroll value"""
         self.__scroll__ = 0
+        self.__update_window__()
 
     def set_buttons(self, button_names: list[str]):
-        self.__button_names__ = []
-        self.add_buttons(button_names)
+        """
+        replaces all buttons; buttons whose name is still visible are kept,
+        so only the buttons for new names have to be rendered
+        """
+        button_names = [str(name) for name in button_names]
+        if button_names != self.__button_names__:
+            self.__button_names__ = button_names
+            self.__names_changed__ = True
 
     def update_surface(self):
         """updates the surface if something has changed"""
 
-        if self.__old_button_names__ != self.__button_names__:
-            self.__old_button_names__ = self.__button_names__[:]
-            self.__buttons__ = []
-            borderwidth = 0
-            for count, name in enumerate(self.__button_names__):
-                if count == 0:
-                    self.__buttons__.append(
-                        Button(
-                            self.__int_surf__,
-                            name,
-                            self.__size__,
-                            (0, 0),
-                            "topleft",
-                            **self.__style__,
-                        )
-                    )
-                    borderwidth = self.__buttons__[0].borderwidth
-                else:
-                    self.__buttons__.append(
-                        Button(
-                            self.__int_surf__,
-                            name,
-                            self.__size__,
-                            (
-                                self.__buttons__[count - 1].left,
-                                self.__buttons__[count - 1].bottom - borderwidth,
-                            ),
-                            "topleft",
-                            **self.__style__,
-                        )
-                    )
-
-            # determining the surface height
-            if len(self.__buttons__) > 0:
-                lowest = self.__buttons__[-1].bottom
+        if self.__names_changed__:
+            # the height of all buttons combined
+            if len(self.__button_names__) > 0:
+                lowest = len(self.__button_names__) * self.__row_height__
+                lowest += self.__button_height__ - self.__row_height__
             else:
                 lowest = 0
-            self.__surface__ = pygame.Surface((self.__target_rect__.width, lowest))
 
-            self.__max_scroll__ = (
-                self.__surface__.get_height() - self.__target_rect__.height
-            )
+            self.__max_scroll__ = lowest - self.__target_rect__.height
             if self.__max_scroll__ > 0 and self.__scroll__ > self.__max_scroll__:
                 self.__scroll__ = self.__max_scroll__
             elif self.__max_scroll__ <= 0:
                 self.__scroll__ = 0
+            self.__update_window__()
+            self.__names_changed__ = False
+
+    def __update_window__(self):
+        # creates / reuses the buttons of all rows within the visible area
+        if self.__row_height__ == 0:
+            return  # no style yet
+        rh = self.__row_height__
+        first = max(self.__scroll__ // rh - self.__overscan__, 0)
+        last = (self.__scroll__ + self.__target_rect__.height) // rh + 1
+        last = min(last + self.__overscan__, len(self.__button_names__))
+        if (first, last) == self.__window__ and not self.__names_changed__:
+            return
+
+        unused = self.__spare__
+        if self.__names_changed__:
+            # buttons keep their text if it is still within the window
+            by_name: dict[str, list[Button]] = {}
+            for button in self.__rows__.values():
+                by_name.setdefault(button.text, []).append(button)
+            current = {}
+            for row in range(first, last):
+                buttons = by_name.get(self.__button_names__[row], None)
+                if buttons:
+                    current[row] = buttons.pop()
+            for buttons in by_name.values():
+                unused.extend(buttons)
+        else:
+            current = self.__rows__
+            unused.extend(b for r, b in current.items() if not first <= r < last)
+
+        rows = {}
+        for row in range(first, last):
+            button = current.get(row, None)
+            if button is None:
+                if len(unused) > 0:
+                    button = unused.pop()
+                    button.__is_touching__ = False
+                else:
+                    button = Button(
+                        self.__int_surf__,
+                        self.__button_names__[row],
+                        self.__size__,
+                        (0, 0),
+                        "topleft",
+                        **self.__style__,
+                    )
+            button.update_text(self.__button_names__[row])
+            # the buttons are positioned relative to the first row of the window
+            button.move_to((0, (row - first) * rh))
+            rows[row] = button
+
+        self.__rows__ = rows
+        self.__buttons__ = list(rows.values())
+        self.__window__ = (first, last)
 
     def update_scroll(self, event_list):
         """updates the scroll value"""
 
+        if isinstance(event_list, EventRouter):
+            event_list = event_list.mouse_wheel
+
         if self.__max_scroll__ > 0:
             for event in event_list:
                 if event.type == pygame.MOUSEWHEEL:
@@ -176,34 +246,89 @@ class ScrollableButtonList:
                         ),
                         0,
                     )
+            self.__update_window__()
 
     def update(self, event_list):
         """updates surface and scroll"""
         self.update_surface()
         self.update_scroll(event_list)
 
+    def __repaint__(self):
+        # brings the surface up to date, only redrawing rows that have changed
+        states = [button.__get_draw_state__() for button in self.__buttons__]
+        if self.__painted_window__ != self.__window__:
+            self.__surface__.fill(self.__backgroundcolor__)
+            for button in self.__buttons__:
+                button.draw_to(self.__surface__)
+            self.__painted__ = {
+                button: (state, button.__get_draw_rect__())
+                for button, state in zip(self.__buttons__, states)
+            }
+            self.__painted_window__ = self.__window__
+            return
+
+        dirty = []
+        for button, state in zip(self.__buttons__, states):
+            painted = self.__painted__.get(button, None)
+            if painted is not None and painted[0] == state:
+                continue
+            rect = button.__get_draw_rect__()
+            self.__painted__[button] = (state, rect)
+            if painted is not None:
+                rect = rect.union(painted[1])  # where the button has been before
+            dirty.append(rect)
+
+        for rect in dirty:
+            # neighbouring buttons are redrawn as well, since their borders overlap
+            self.__surface__.set_clip(rect)
+            self.__surface__.fill(self.__backgroundcolor__)
+            for button in self.__buttons__:
+                if button.__get_draw_rect__().colliderect(rect):
+                    button.draw_to(self.__surface__)
+        self.__surface__.set_clip(None)
+
     def draw(self):
-        self.__surface__.fill(self.__backgroundcolor__)
-        for button in self.__buttons__:
-            button.draw_to(self.__surface__)
+        self.__repaint__()
         tr = self.__target_rect__
-        pygame.draw.rect(self.__main_surface__, self.__backgroundcolor__, tr)
-        if self.__surface__.get_height() > tr.height:
+        # only the part of the window within the visible area
+        height = min(tr.height, self.__max_scroll__ + tr.height - self.__scroll__)
+        if len(self.__buttons__) == 0 or height < tr.height:
+            pygame.draw.rect(self.__main_surface__, self.__backgroundcolor__, tr)
+        if len(self.__buttons__) > 0:
             self.__main_surface__.blit(
-                self.__surface__.subsurface((0, self.__scroll__, tr[2], tr[3])),
-                self.__target_rect__.topleft,
+                self.__surface__,
+                tr.topleft,
+                (0, self.__get_window_scroll__(), tr.width, height),
             )
-        else:
-            self.__main_surface__.blit(self.__surface__, self.__target_rect__.topleft)
+
+    def __get_draw_state__(self) -> tuple:
+        # everything that affects the look of the widget (used by WidgetGroup)
+        return (
+            self.__surface__,
+            self.__scroll__,
+            self.__window__,
+            self.__backgroundcolor__,
+            tuple(button.__get_draw_state__() for button in self.__buttons__),
+        )
+
+    def __get_draw_rect__(self) -> pygame.Rect:
+        return self.__target_rect__.copy()
 
     def get_buttons(self):
         return self.__buttons__
 
     def get_offset(self):
-        return self.__target_rect__[0], self.__target_rect__[1] - self.__get_scroll__()
+        return (
+            self.__target_rect__[0],
+            self.__target_rect__[1] - self.__get_window_scroll__(),
+        )
 
     def __get_scroll__(self):
         return self.__scroll__
 
+    def __get_window_scroll__(self):
+        # the scroll value relative to the first row of the window
+        return self.__scroll__ - self.__window__[0] * self.__row_height__
+
     def get_rect(self):
         return self.__target_rect__
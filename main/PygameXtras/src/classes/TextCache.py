@@ -0,0 +1,101 @@
+from collections import OrderedDict
+
+import pygame
+
+
+class TextCache:
+    """
+    Process-wide cache for rendered text surfaces.
+
+    Used by Labels created with 'cache_text=True'. Surfaces are keyed by
+    (text, font key, color, antialias, wraplength), so a widget switching
+    between a small set of strings only renders each string once.
+
+    The cache is bounded by the total number of bytes of all stored
+    surfaces ('max_bytes') and evicts in least-recently-used order.
+
+    IMPORTANT: the returned surfaces are shared and must not be modified.
+    """
+
+    max_bytes: int = 16 * 1024 * 1024
+    hits: int = 0
+    misses: int = 0
+    __surfaces: OrderedDict = OrderedDict()
+    __bytes: int = 0
+
+    @staticmethod
+    def render(
+        font: pygame.font.Font,
+        font_key: tuple,
+        text: str,
+        antialias: bool,
+        color: tuple,
+        wraplength: int = 0,
+    ) -> pygame.Surface:
+        """
+        Returns the rendered text, rendering it with <font> only if it is not
+        cached yet. <font_key> has to identify <font> (see FontCache.get).
+        """
+        key = (text, font_key, tuple(color), bool(antialias), wraplength)
+        surface = TextCache.__surfaces.get(key, None)
+        if surface is not None:
+            TextCache.__surfaces.move_to_end(key)
+            TextCache.hits += 1
+            return surface
+
+        TextCache.misses += 1
+        surface = font.render(text, antialias, color, wraplength=wraplength)
+        size = TextCache.__get_bytes(surface)
+        if size > TextCache.max_bytes:
+            # would evict everything else and still not fit
+            return surface
+
+        TextCache.__surfaces[key] = surface
+        TextCache.__bytes += size
+        TextCache.__shrink()
+        return surface
+
+    @staticmethod
+    def __get_bytes(surface: pygame.Surface) -> int:
+        return surface.get_pitch() * surface.get_height()
+
+    @staticmethod
+    def __shrink() -> None:
+        while TextCache.__bytes > TextCache.max_bytes:
+            _, surface = TextCache.__surfaces.popitem(last=False)
+            TextCache.__bytes -= TextCache.__get_bytes(surface)
+
+    @staticmethod
+    def set_max_bytes(max_bytes: int) -> None:
+        """
+        Sets the maximum number of bytes all cached surfaces may occupy,
+        evicting the least recently used surfaces if necessary.
+        """
+        assert type(max_bytes) == int, f"invalid argument for 'max_bytes': {max_bytes}"
+        assert max_bytes >= 0, f"invalid argument for 'max_bytes': {max_bytes}"
+        TextCache.max_bytes = max_bytes
+        TextCache.__shrink()
+
+    @staticmethod
+    def clear() -> None:
+        """
+        Removes all cached surfaces and resets the counters.
+        """
+        TextCache.__surfaces.clear()
+        TextCache.__bytes = 0
+        TextCache.hits = 0
+        TextCache.misses = 0
+
+    @staticmethod
+    def get_stats() -> dict:
+        """
+        Returns a dict containing the number of hits and misses, the number
+        of cached surfaces and the number of bytes they occupy.
+        """
+        return {
+            "hits": TextCache.hits,
+            "misses": TextCache.misses,
+            "size": len(TextCache.__surfaces),
+            "bytes": TextCache.__bytes,
+            "max_bytes": TextCache.max_bytes,
+        }
@@ -0,0 +1,69 @@
+import pygame
+
+
+class TileMap:
+    """
+    A uniform grid of solid tiles, used by Entities for tile collision.
+
+    <tiles> is a 2d list (tiles[x][y]) containing a pygame.Rect for
+    every solid tile and 0 for every empty one (see
+    Entity.set_game_map_tiles). The tile at tiles[x][y] has to lie within
+    the cell (x * tile_sidelength, y * tile_sidelength, tile_sidelength,
+    tile_sidelength).
+
+    The tiles are copied into a flat list once, so changes made to <tiles>
+    afterwards are not noticed. Create a new TileMap after changing the
+    map. A TileMap can be shared by all entities of a level.
+    """
+
+    def __init__(self, tiles: list[list], tile_sidelength: int):
+        assert type(tiles) == list and len(tiles) > 0, (
+            f"invalid argument for 'tiles': {tiles}"
+        )
+        assert type(tiles[0]) == list, f"invalid argument for 'tiles': {tiles}"
+        assert type(tile_sidelength) == int and tile_sidelength > 0, (
+            f"invalid argument for 'tile_sidelength': {tile_sidelength}"
+        )
+        self.tile_sidelength = tile_sidelength
+        self.columns = len(tiles)
+        self.rows = len(tiles[0])
+
+        # cells[x * rows + y] is the rect of the tile or None
+        self.__cells: list[pygame.Rect | None] = [None] * (self.columns * self.rows)
+        for x, column in enumerate(tiles):
+            assert len(column) == self.rows, "all columns need to have the same length"
+            for y, tile in enumerate(column):
+                if tile != 0:
+                    self.__cells[x * self.rows + y] = tile
+
+    def get_tile(self, x: int, y: int) -> pygame.Rect | None:
+        """
+        Returns the tile of the cell (<x>, <y>) or None if it is empty
+        (or outside of the map).
+        """
+        if 0 <= x < self.columns and 0 <= y < self.rows:
+            return self.__cells[x * self.rows + y]
+        return None
+
+    def get_tiles(self, rect: pygame.Rect) -> list[pygame.Rect]:
+        """
+        Returns all tiles colliding with <rect>.
+        Only the cells covered by <rect> are checked.
+        """
+        side = self.tile_sidelength
+        x0 = max(rect.left // side, 0)
+        x1 = min((rect.right - 1) // side, self.columns - 1)
+        y0 = max(rect.top // side, 0)
+        y1 = min((rect.bottom - 1) // side, self.rows - 1)
+        if x0 > x1 or y0 > y1:
+            return []
+
+        cells = self.__cells
+        rows = self.rows
+        tiles = []
+        for x in range(x0, x1 + 1):
+            start = x * rows
+            for tile in cells[start + y0 : start + y1 + 1]:
+                if tile is not None and rect.colliderect(tile):
+                    tiles.append(tile)
+        return tiles
@@ -0,0 +1,143 @@
+import pygame
+
+from ..parsers.color import Color
+
+
+class WidgetGroup:
+    def __init__(self, surface: pygame.Surface, background):
+        """
+        Draws widgets using dirty rectangles: only widgets that have
+        changed (position, text, colors, hover state, ...) since the
+        last frame are drawn again.
+
+        Supported widgets: Label, Button, Entry, Bar, Paragraph and
+        ScrollableButtonList. All widgets have to draw to <surface>.
+
+        <background> is either a pygame.Surface with the same size as
+        <surface> or a color. It is used to restore the area behind
+        widgets that moved, shrank or were removed.
+
+        Example (simplified):
+            group = WidgetGroup(screen, (20, 20, 20))
+            group.add(label, button)
+            while True:
+                events = pygame.event.get()
+                if button.update(events):
+                    ...
+                pygame.display.update(group.draw())
+        """
+        assert isinstance(surface, pygame.Surface), (
+            f"invalid argument for 'surface': {surface}"
+        )
+        self.__surface = surface
+        self.set_background(background)
+
+        self.__widgets: list = []
+        self.__states: dict = {}  # widget -> (state, rect) of the last frame
+        self.__pending: list[pygame.Rect] = []  # areas of removed widgets
+
+    def set_background(self, background):
+        """
+        Sets the background and redraws everything on the next call of draw().
+        """
+        if isinstance(background, pygame.Surface):
+            self.__background = background
+        else:
+            self.__background = Color.parse(background)
+        self.repaint()
+
+    def add(self, *widgets):
+        """
+        Adds widgets to the group. Widgets added later are drawn on top.
+        """
+        for widget in widgets:
+            if widget not in self.__states:
+                self.__widgets.append(widget)
+                self.__states[widget] = None
+
+    def remove(self, *widgets):
+        """
+        Removes widgets from the group. Their area will be restored on the
+        next call of draw().
+        """
+        for widget in widgets:
+            if widget in self.__states:
+                last = self.__states.pop(widget)
+                self.__widgets.remove(widget)
+                if last is not None:
+                    self.__pending.append(last[1])
+
+    def empty(self):
+        """
+        Removes all widgets from the group.
+        """
+        self.remove(*self.__widgets)
+
+    def get_widgets(self) -> list:
+        return self.__widgets[:]
+
+    def repaint(self):
+        """
+        Forces a complete redraw on the next call of draw().
+        """
+        self.__full_repaint = True
+
+    def draw(self) -> list[pygame.Rect]:
+        """
+        Draws all changed widgets and returns the areas that have changed.
+        The result can be passed to pygame.display.update().
+        """
+        if self.__full_repaint:
+            self.__full_repaint = False
+            self.__pending = []
+            self.__restore(self.__surface.get_rect())
+            for widget in self.__widgets:
+                self.__states[widget] = self.__get_state(widget)
+                widget.draw()
+            return [self.__surface.get_rect()]
+
+        dirty = self.__pending
+        self.__pending = []
+        for widget in self.__widgets:
+            state, rect = self.__get_state(widget)
+            last = self.__states[widget]
+            if last is None:
+                dirty.append(rect)
+            elif last[0] != state or last[1] != rect:
+                dirty.append(last[1])
+                dirty.append(rect)
+            self.__states[widget] = (state, rect)
+
+        dirty = self.__merge(dirty)
+        for area in dirty:
+            self.__surface.set_clip(area)
+            self.__restore(area)
+            for widget in self.__widgets:
+                if self.__states[widget][1].colliderect(area):
+                    widget.draw()
+        self.__surface.set_clip(None)
+        return dirty
+
+    def __get_state(self, widget) -> tuple:
+        return widget.__get_draw_state__(), widget.__get_draw_rect__()
+
+    def __restore(self, area: pygame.Rect):
+        if isinstance(self.__background, pygame.Surface):
+            self.__surface.blit(self.__background, area, area)
+        else:
+            self.__surface.fill(self.__background, area)
+
+    def __merge(self, rects: list[pygame.Rect]) -> list[pygame.Rect]:
+        # combines overlapping rects, so no area is drawn twice
+        bounds = self.__surface.get_rect()
+        merged: list[pygame.Rect] = []
+        for rect in rects:
+            rect = rect.clip(bounds)
+            if rect.width == 0 or rect.height == 0:
+                continue
+            index = rect.collidelist(merged)
+            while index != -1:
+                rect.union_ip(merged.pop(index))
+                index = rect.collidelist(merged)
+            merged.append(rect)
+        return merged
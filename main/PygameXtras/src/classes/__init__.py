@@ -1,14 +1,20 @@
 from .Bar import Bar
 from .Button import Button
+from .ButtonGrid import ButtonGrid
 from .C import C
 from .Collisions import Collisions
 from .Colors import Colors
 from .CustomTemplate import CustomTemplate
 from .Debug import Debug
 from .Entity import Entity
+from .EntityWorld import EntityWorld
 from .Entry import Entry
+from .EventRouter import EventRouter
+from .FontCache import FontCache
+from .FontRegistry import FontRegistry
 from .Function import Function
 from .Functions import *
+from .GlyphAtlas import GlyphAtlas
 from .Keyboard import Keyboard
 from .Label import Label
 from .Messagebox import Messagebox
@@ -20,21 +26,31 @@ from .PopupMessage import PopupMessage
 from .PSController import PSController
 from .RandomClasses import *
 from .RetroController import RetroController
+from .RotationCache import RotationCache
 from .ScrollableButtonList import ScrollableButtonList
 from .Spritesheet import Spritesheet
 from .Table import Table
+from .TextCache import TextCache
+from .TileMap import TileMap
+from .WidgetGroup import WidgetGroup
 
 __all__ = [
     "Bar",
     "Button",
+    "ButtonGrid",
     "C",
     "Collisions",
     "Colors",
     "CustomTemplate",
     "Debug",
     "Entity",
+    "EntityWorld",
     "Entry",
+    "EventRouter",
+    "FontCache",
+    "FontRegistry",
     "Function",
+    "GlyphAtlas",
     "Keyboard",
     "Label",
     "Messagebox",
@@ -45,7 +61,11 @@ __all__ = [
     "PopupMessage",
     "PSController",
     "RetroController",
+    "RotationCache",
     "ScrollableButtonList",
     "Spritesheet",
     "Table",
+    "TextCache",
+    "TileMap",
+    "WidgetGroup",
 ]
@@ -0,0 +1,47 @@
+"""
+Measures how many widgets can be constructed per second.
+
+Run from 'main/PygameXtras':
+    python -m test.benchmark_construction
+"""
+
+import time
+
+import pygame
+
+pygame.init()  # has to happen before importing the widgets
+
+from src.classes.Button import Button
+from src.classes.Entry import Entry
+from src.classes.Label import Label
+
+N = 2000
+TEMPLATE = {"bgc": (40, 40, 40), "tc": (255, 255, 255), "bw": 2, "br": 5}
+
+
+def benchmark(name: str, factory):
+    factory(0)  # warm up font caches
+    start = time.perf_counter()
+    for i in range(N):
+        factory(i)
+    duration = time.perf_counter() - start
+    print(f"{name:<24}{N / duration:>10.0f} widgets/s")
+
+
+benchmark("Label", lambda i: Label(None, f"Label {i}", 20, (i, i)))
+benchmark(
+    "Label (styled)",
+    lambda i: Label(
+        None, f"Label {i}", 20, (i, i), "topleft", fd=(120, 30), xad=5, t=TEMPLATE
+    ),
+)
+benchmark(
+    "Button",
+    lambda i: Button(
+        None, f"Button {i}", 20, (i, i), fd=(120, 30), hl=True, t=TEMPLATE
+    ),
+)
+benchmark(
+    "Entry",
+    lambda i: Entry(None, "", 20, (i, i), fd=(120, 30), twe="empty", t=TEMPLATE),
+)
@@ -0,0 +1,89 @@
+"""
+Compares Entity.internal_update with EntityWorld.update.
+
+Run from 'main/PygameXtras' (requires numpy):
+    python -m test.benchmark_entity_world
+"""
+
+import time
+
+import pygame
+
+pygame.init()  # has to happen before importing the entities
+
+from src.classes.Entity import Entity
+from src.classes.EntityWorld import EntityWorld
+from src.classes.TileMap import TileMap
+
+N = 2000
+FRAMES = 100
+SIDE = 10
+IMAGE = pygame.Surface((8, 8))
+
+
+class Box(Entity):
+    def __init__(self, index: int, tile_map: TileMap, collision: bool):
+        self.image = IMAGE
+        self.rect = self.image.get_rect()
+        super().__init__()
+        self.index = index
+        self.add_action("idle", [{"left": IMAGE, "right": IMAGE}], 1)
+        self.set_looping_action("idle")
+        self.set_speed(1 + index % 3)
+        self.set_tile_collision(collision, SIDE)
+        self.set_game_map_tiles(tile_map, collision)
+        self.set_knockback_resistance(1.1)
+        self.set_pos((20 + index % 150, 20 + index % 130), "topleft")
+
+    def move(self, frame: int):
+        if (frame + self.index) % 40 < 20:
+            self.move_right()
+        else:
+            self.move_left()
+        if frame % 25 == self.index % 25:
+            self.add_knockback((0, -6))
+
+
+def create_map() -> TileMap:
+    tiles = [[0] * 20 for _ in range(20)]
+    for i in range(20):
+        tiles[i][0] = pygame.Rect(i * SIDE, 0, SIDE, SIDE)
+        tiles[i][19] = pygame.Rect(i * SIDE, 19 * SIDE, SIDE, SIDE)
+        tiles[0][i] = pygame.Rect(0, i * SIDE, SIDE, SIDE)
+        tiles[19][i] = pygame.Rect(19 * SIDE, i * SIDE, SIDE, SIDE)
+    return TileMap(tiles, SIDE)
+
+
+def benchmark(name: str, colliding: float):
+    tile_map = create_map()
+    count = int(N * colliding)
+    entities = [Box(i, tile_map, i < count) for i in range(N)]
+    world_entities = [Box(i, tile_map, i < count) for i in range(N)]
+    world = EntityWorld(N)
+    for entity in world_entities:
+        world.add(entity)
+
+    start = time.perf_counter()
+    for frame in range(FRAMES):
+        for entity in entities:
+            entity.move(frame)
+            entity.internal_update()
+    single = time.perf_counter() - start
+
+    start = time.perf_counter()
+    for frame in range(FRAMES):
+        for entity in world_entities:
+            entity.move(frame)
+        world.update()
+    batched = time.perf_counter() - start
+
+    print(
+        f"{name:<28}{single * 1000 / FRAMES:>8.2f} ms/frame"
+        f"{batched * 1000 / FRAMES:>8.2f} ms/frame{single / batched:>8.2f}x"
+    )
+
+
+print(f"{N} entities{'internal_update':>33}{'EntityWorld':>17}")
+benchmark("no tile collision", 0)
+benchmark("25% tile collision", 0.25)
+benchmark("all with tile collision", 1)
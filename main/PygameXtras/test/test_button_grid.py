@@ -0,0 +1,67 @@
+import unittest
+from unittest import mock
+
+import pygame
+
+from ..src.classes.Button import Button
+from ..src.classes.ButtonGrid import ButtonGrid
+from ..src.classes.Entry import Entry
+from ..src.classes.OneClickManager import OneClickManager
+
+
+def click(pos, button=1):
+    return pygame.event.Event(pygame.MOUSEBUTTONUP, pos=pos, button=button)
+
+
+class TestButtonGrid(unittest.TestCase):
+    def setUp(self):
+        self.buttons = [
+            Button(None, str(i), 20, (20 + 50 * i, 20 + 30 * (i % 3)), fd=(40, 25))
+            for i in range(20)
+        ]
+        self.grid = ButtonGrid(cell_size=32)
+        self.grid.add(*self.buttons)
+
+    def naive(self, events, offset=(0, 0)):
+        return [b for b in self.buttons if b.update(events, offset=offset)]
+
+    def test_same_result_as_naive_update(self):
+        for pos in [(20, 20), (70, 50), (5, 5), (520, 20), (1000, 1000)]:
+            events = [click(pos)]
+            self.assertEqual(self.grid.update(events), self.naive(events))
+
+    def test_offset(self):
+        offset = (100, -40)
+        events = [click((170, 10))]
+        clicked = self.grid.update(events, offset=offset)
+        self.assertEqual(clicked, self.naive(events, offset))
+        self.assertEqual(len(clicked), 1)
+
+    def test_one_click_manager(self):
+        ocm = OneClickManager()
+        a = Button(None, "a", 20, (100, 100), fd=(50, 50), ocm=ocm)
+        b = Button(None, "b", 20, (100, 100), fd=(50, 50), ocm=ocm)
+        grid = ButtonGrid()
+        grid.add(a, b)
+        self.assertEqual(grid.update([click((100, 100))]), [a])
+
+    def test_refresh_and_hover(self):
+        b = self.buttons[0]
+        b.highlight = (255, 255, 255)
+        with mock.patch("pygame.mouse.get_pos", return_value=(20, 20)):
+            self.grid.update([])
+        self.assertTrue(b.__is_touching__)
+        b.update_pos((300, 300))
+        self.grid.refresh(b)
+        with mock.patch("pygame.mouse.get_pos", return_value=(20, 20)):
+            self.grid.update([])
+        self.assertFalse(b.__is_touching__)
+        self.assertEqual(self.grid.update([click((300, 300))]), [b])
+
+    def test_entries_are_rejected(self):
+        with self.assertRaises(AssertionError):
+            self.grid.add(Entry(None, "", 20, (0, 0)))
+
+
+if __name__ == "__main__":
+    unittest.main()
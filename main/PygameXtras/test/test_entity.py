@@ -0,0 +1,142 @@
+import functools
+import unittest
+from unittest import mock
+
+import pygame
+
+from ..src.classes.Entity import Entity
+
+
+def create_frames(count: int) -> list[dict]:
+    frames = []
+    for i in range(count):
+        image = pygame.Surface((10, 10))
+        image.fill((i, i, i))
+        frames.append({"left": image, "right": image})
+    return frames
+
+
+class Dummy(Entity):
+    def __init__(self):
+        self.image = pygame.Surface((10, 10))
+        self.rect = self.image.get_rect()
+        super().__init__()
+        self.calls = []
+        self.add_action("idle", create_frames(1), 1)
+        self.set_looping_action("idle")
+        self.set_speed(1)
+        self.set_tile_collision(False)
+
+    def record(self, *args, **kwargs):
+        self.calls.append((args, kwargs))
+
+
+class TestEntityActions(unittest.TestCase):
+    def test_methods_to_execute(self):
+        entity = Dummy()
+        extra = []
+        entity.add_action(
+            "attack",
+            create_frames(3),
+            2,
+            {
+                1: "record(1, (2, 3), key='a')",
+                3: "record(self.get_speed())",
+                4: lambda: extra.append(True),
+            },
+        )
+        entity.set_action("attack")
+        with mock.patch("builtins.exec") as exec_mock:
+            for _ in range(6):
+                entity.internal_update()
+            exec_mock.assert_not_called()
+        self.assertEqual(entity.calls, [((1, (2, 3)), {"key": "a"}), ((1,), {})])
+        self.assertEqual(extra, [True])
+
+    def test_mutable_arguments_are_not_shared(self):
+        entity = Dummy()
+        entity.add_action(
+            "attack",
+            create_frames(1),
+            1,
+            {1: "record([1, 2], key={'a': 1})", 2: "record(-1, (2, 'b'), None)"},
+        )
+        callbacks = entity.__actions__["attack"]["callbacks"]
+        self.assertNotIsInstance(callbacks[1], functools.partial)
+        self.assertIsInstance(callbacks[2], functools.partial)
+        callbacks[1]()
+        entity.calls[0][0][0].append(3)
+        entity.calls[0][1]["key"]["b"] = 2
+        callbacks[1]()
+        self.assertEqual(entity.calls[1], (([1, 2],), {"key": {"a": 1}}))
+        callbacks[2]()
+        self.assertEqual(entity.calls[2], ((-1, (2, "b"), None), {}))
+
+    def test_invalid_methods(self):
+        entity = Dummy()
+        for methods, error in (
+            ({1: "unknown()"}, Exception),
+            ({1: "__init__()"}, Exception),
+            ({"1": "record()"}, ValueError),
+            ({1: "record(key=1, key=2)"}, Exception),
+        ):
+            with self.subTest(methods=methods):
+                with self.assertRaisesRegex(error, "methods_to_execute"):
+                    entity.add_action("attack", create_frames(1), 1, methods)
+
+    def test_errors_name_the_action(self):
+        entity = Dummy()
+        entity.add_action("attack", create_frames(2), 1, {1: "record(*5)"})
+        entity.set_action("attack")
+        with self.assertRaisesRegex(Exception, "attack"):
+            entity.internal_update()
+            entity.internal_update()
+
+
+class TestEntityAnimation(unittest.TestCase):
+    def play(self, entity: Entity, frames: int) -> list:
+        images = []
+        for _ in range(frames):
+            entity.internal_update()
+            images.append(entity.image)
+        return images
+
+    def test_action(self):
+        entity = Dummy()
+        idle = entity.__actions__["idle"]["images"][0]["right"]
+        frames = create_frames(4)
+        a, b, _, d = [frame["right"] for frame in frames]
+        entity.add_action("attack", frames, [2, 1, 0, 3])
+        entity.set_action("attack")
+        self.assertEqual(self.play(entity, 8), [a, a, b, d, d, d, idle, idle])
+        self.assertEqual(entity.__actions__["attack"]["frame_count"], 6)
+
+    def test_looping_action(self):
+        entity = Dummy()
+        frames = create_frames(2)
+        a, b = [frame["right"] for frame in frames]
+        entity.add_action("walk", frames, 2, {1: "record()"})
+        entity.set_looping_action("walk")
+        self.assertEqual(self.play(entity, 6), [a, a, b, b, a, a])
+        self.assertEqual(len(entity.calls), 2)
+
+    def test_action_without_frames(self):
+        entity = Dummy()
+        with self.assertRaisesRegex(AssertionError, "has no frames"):
+            entity.add_action("attack", create_frames(2), 0)
+        with self.assertRaisesRegex(AssertionError, "has no frames"):
+            entity.add_action("attack", [], 1)
+        self.assertNotIn("attack", entity.__actions__)
+
+    def test_long_actions_are_not_expanded(self):
+        entity = Dummy()
+        entity.add_action("wait", create_frames(2), 1000)
+        self.assertEqual(entity.__actions__["wait"]["durations"], [1000, 1000])
+        entity.set_action("wait")
+        self.play(entity, 1500)
+        self.assertEqual(entity.__animation_index__, 1)
+        self.assertEqual(entity.__animation_step__, 500)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,142 @@
+import unittest
+
+import pygame
+
+from ..src.classes.Entity import Entity
+from ..src.classes.EntityWorld import EntityWorld, np
+from ..src.classes.TileMap import TileMap
+
+SIDE = 10
+
+
+class Box(Entity):
+    def __init__(self, index: int):
+        self.image = pygame.Surface((8, 8))
+        self.rect = self.image.get_rect()
+        super().__init__()
+        self.index = index
+        self.add_action("idle", [{"left": self.image, "right": self.image}], 1)
+        self.set_looping_action("idle")
+        self.set_speed(1.5 + index % 3)
+        self.set_tile_collision(index % 2 == 0, SIDE)
+        self.set_knockback_resistance(1.1)
+        if index % 3 == 0:
+            self.set_constant_movement((0, 0.5), (0, 6))
+        self.set_pos((20 + index * 3, 100 - index * 2), "topleft")
+
+    def move(self, frame: int):
+        if (frame + self.index) % 7 < 4:
+            self.move_right()
+        else:
+            self.move_left(2.5)
+        if frame % 11 == self.index % 11:
+            self.add_knockback((13 if self.index % 4 else -13, -9))
+
+
+def create_map() -> TileMap:
+    tiles = [[0] * 30 for _ in range(30)]
+    for i in range(30):
+        tiles[i][15] = pygame.Rect(i * SIDE, 15 * SIDE, SIDE, SIDE)
+        tiles[i][0] = pygame.Rect(i * SIDE, 0, SIDE, SIDE)
+        tiles[1][i] = pygame.Rect(1 * SIDE, i * SIDE, SIDE, SIDE)
+        tiles[20][i] = pygame.Rect(20 * SIDE, i * SIDE, SIDE, SIDE)
+    return TileMap(tiles, SIDE)
+
+
+def get_state(entity: Entity) -> tuple:
+    return (
+        tuple(entity.rect),
+        list(entity.__knockback_vector__),
+        list(entity.get_constant_movement()),
+        entity.get_direction(),
+        entity.__entity_pos__,
+        [
+            entity.get_data(name)
+            for name in (
+                "center",
+                "old_center",
+                "last_movement",
+                "has_moved",
+                "has_moved_left",
+                "has_moved_up",
+                "is_touching_ground",
+            )
+        ],
+    )
+
+
+@unittest.skipIf(np is None, "numpy is not installed")
+class TestEntityWorld(unittest.TestCase):
+    def test_matches_internal_update(self):
+        tile_map = create_map()
+        single = [Box(i) for i in range(40)]
+        batched = [Box(i) for i in range(40)]
+        world = EntityWorld(capacity=4)  # has to grow
+        for entity in single + batched:
+            entity.set_game_map_tiles(tile_map, entity.index % 2 == 0)
+        for entity in batched:
+            world.add(entity)
+
+        removed = []
+        for frame in range(60):
+            for entity in single:
+                entity.move(frame)
+                entity.internal_update()
+            for entity in batched:
+                entity.move(frame)
+            world.update()
+            for entity in removed:
+                entity.internal_update()
+            if frame % 3 == 0 or frame > 28:
+                # the data of the world is only copied into the entities on request
+                for a, b in zip(single, batched):
+                    self.assertEqual(get_state(a), get_state(b))
+
+            if frame == 30:
+                # removed entities keep their state
+                removed = [batched[5], batched[-1], batched[0]]
+                for entity in removed:
+                    world.remove(entity)
+        self.assertEqual(len(world), 37)
+
+    def test_entity_belongs_to_one_world(self):
+        entity = Box(0)
+        world = EntityWorld()
+        world.add(entity)
+        with self.assertRaises(AssertionError):
+            EntityWorld().add(entity)
+        with self.assertRaisesRegex(AssertionError, "EntityWorld"):
+            entity.internal_update()
+        world.remove(entity)
+        self.assertEqual(world.get_entities(), [])
+        self.assertEqual(entity.__movement_vector__, [0, 0])
+
+    def test_getter_types(self):
+        entity = Box(0)
+        entity.set_constant_movement((0, 0.5), (0, 6))
+        world = EntityWorld()
+        world.add(entity)
+        for _ in range(20):
+            world.update()
+        self.assertEqual(entity.get_constant_movement(), [0, 6])
+        self.assertIs(type(entity.get_constant_movement()), list)
+        self.assertIs(type(entity.get_constant_movement()[1]), int)
+        self.assertIs(type(entity.get_data("center")[0]), int)
+        self.assertIs(type(entity.get_data("last_movement")[0]), int)
+
+        world.remove(entity)
+        for vector in (
+            entity.get_constant_movement(),
+            entity.__movement_vector__,
+            entity.__knockback_vector__,
+            entity.__constant_movement_initial_vector__,
+            entity.__constant_movement_max_vector__,
+        ):
+            self.assertIs(type(vector), list)
+        self.assertEqual(entity.get_constant_movement(), [0, 6])
+        self.assertIs(type(entity.get_constant_movement()[1]), int)
+        self.assertEqual(entity.__constant_movement_initial_vector__, [0, 0.5])
+
+
+if __name__ == "__main__":
+    unittest.main()
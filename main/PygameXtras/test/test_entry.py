@@ -0,0 +1,139 @@
+import unittest
+from unittest import mock
+
+import pygame
+
+from ..src.classes.Entry import Entry
+from ..src.classes.GapBuffer import GapBuffer
+
+
+def keys(*keys: int, event_type: int = pygame.KEYDOWN) -> list:
+    return [pygame.event.Event(event_type, key=key) for key in keys]
+
+
+CTRL_V = pygame.event.Event(pygame.KEYDOWN, key=pygame.K_v, mod=pygame.KMOD_LCTRL)
+
+
+@mock.patch("pygame.mouse.get_pos", lambda: (-100, -100))
+class TestEntry(unittest.TestCase):
+    def create(self, text: str = "", **kwargs) -> Entry:
+        kwargs.setdefault("fd", (300, 40))
+        entry = Entry(None, text, 20, (100, 100), **kwargs)
+        entry.set_state(True)
+        entry.update([])
+        return entry
+
+    def test_typing(self):
+        entry = self.create()
+        entry.update(keys(pygame.K_a, pygame.K_b, pygame.K_c))
+        entry.update(keys(pygame.K_LEFT, pygame.K_LEFT, event_type=pygame.KEYUP))
+        entry.update(keys(pygame.K_1))
+        entry.update(keys(pygame.K_BACKSPACE, pygame.K_BACKSPACE))
+        entry.update(keys(pygame.K_2))
+        self.assertEqual(entry.get(), "2bc")
+        self.assertEqual(entry.text, "2bc")
+
+    def test_cursor_does_not_render_text(self):
+        entry = self.create("hello")
+        text_surface = entry.text_surface
+        entry.update(keys(pygame.K_LEFT, event_type=pygame.KEYUP))
+        self.assertIs(entry.text_surface, text_surface)
+        self.assertEqual(entry.__get_cursor_x__(), entry.__font__.size("hell")[0])
+
+    def test_cursor_is_drawn(self):
+        entry = self.create("hello")
+        surface = pygame.Surface((300, 200))
+        surface.fill((100, 100, 100))
+        entry.draw_to(surface)
+        with_cursor = pygame.image.tobytes(surface, "RGB")
+        entry.set_state(False)
+        entry.update([])
+        surface.fill((100, 100, 100))
+        entry.draw_to(surface)
+        self.assertTrue(pygame.image.tobytes(surface, "RGB") != with_cursor)
+
+    def test_strict_input_and_max_chars(self):
+        entry = self.create(si="int", max=3)
+        for key in (pygame.K_1, pygame.K_a, pygame.K_2, pygame.K_3, pygame.K_4):
+            entry.update(keys(key))
+        self.assertEqual(entry.get(), "123")
+
+    def test_bulk_insert_renders_once(self):
+        entry = self.create("ab", fd=None)  # no wrapping
+        entry.update(keys(pygame.K_LEFT, event_type=pygame.KEYUP))
+        with mock.patch.object(entry, "update_text", wraps=entry.update_text) as update:
+            entry.insert("x\ty" * 5000)
+            self.assertEqual(update.call_count, 1)
+        self.assertEqual(entry.get(), "a" + "xy" * 5000 + "b")
+
+    def test_state_toggle_rebuilds_once(self):
+        entry = self.create("", twe="empty", ast=True)
+        entry.set_state(False)
+        with mock.patch.object(entry, "__create__", wraps=entry.__create__) as create:
+            entry.set_state(True)
+            entry.update(keys(pygame.K_a))
+            self.assertEqual(create.call_count, 1)
+            entry.clear()
+            self.assertEqual(create.call_count, 2)
+        self.assertEqual(entry.text, "empty")
+        self.assertTrue(entry.italic)
+
+    def test_bulk_insert_validation(self):
+        entry = self.create("1", si="int", max=5)
+        entry.insert("2a")
+        self.assertEqual(entry.get(), "1")
+        entry.insert("234567")
+        self.assertEqual(entry.get(), "12345")
+
+    @mock.patch("pygame.scrap.get_text", lambda: "abc\r\ndef")
+    def test_paste(self):
+        entry = self.create()
+        entry.update([CTRL_V] + keys(pygame.K_x))
+        self.assertEqual(entry.get(), "abcdefx")
+        entry.paste()
+        self.assertEqual(entry.get(), "abcdefxabcdef")
+
+    @mock.patch("pygame.scrap.get_text", lambda: "abc")
+    def test_paste_keeps_the_typing_order(self):
+        entry = self.create()
+        entry.update(keys(pygame.K_x) + [CTRL_V] + keys(pygame.K_y))
+        self.assertEqual(entry.get(), "xabcy")
+
+    @mock.patch("pygame.scrap.get_text", lambda: "123456")
+    def test_paste_respects_max_chars(self):
+        entry = self.create("ab", max=5)
+        entry.update(keys(pygame.K_LEFT, event_type=pygame.KEYUP))
+        entry.update([CTRL_V])
+        self.assertEqual(entry.get(), "a123b")
+        self.assertEqual(entry.__get_cursor_x__(), entry.__font__.size("a123")[0])
+
+    @mock.patch("pygame.scrap.get_text", lambda: "34x")
+    def test_paste_is_cut_before_validation(self):
+        entry = self.create("12", si="int", max=4)
+        entry.update([CTRL_V])
+        self.assertEqual(entry.get(), "1234")
+
+    def test_text_input(self):
+        entry = self.create(ti=True)
+        entry.update([pygame.event.Event(pygame.TEXTINPUT, text="Grüße")])
+        self.assertEqual(entry.get(), "Grüße")
+
+
+class TestGapBuffer(unittest.TestCase):
+    def test_editing(self):
+        buffer = GapBuffer("hello")
+        buffer.move(0)
+        buffer.insert(">> ")
+        buffer.move(len(buffer))
+        buffer.insert(" world" * 20)
+        buffer.move(8)
+        buffer.delete(2)
+        expected = ">> hello" + " world" * 20
+        expected = expected[:6] + expected[8:]
+        self.assertEqual(str(buffer), expected)
+        self.assertEqual(len(buffer), len(expected))
+        self.assertEqual(buffer.get_cursor(), 6)
+
+
+if __name__ == "__main__":
+    unittest.main()
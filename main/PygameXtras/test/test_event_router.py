@@ -0,0 +1,37 @@
+import unittest
+
+import pygame
+
+from ..src.classes.Button import Button
+from ..src.classes.EventRouter import EventRouter
+
+
+class TestEventRouter(unittest.TestCase):
+    def setUp(self):
+        self.events = [
+            pygame.event.Event(pygame.MOUSEMOTION, pos=(0, 0), rel=(1, 1)),
+            pygame.event.Event(pygame.KEYDOWN, key=pygame.K_a),
+            pygame.event.Event(pygame.MOUSEBUTTONUP, pos=(50, 50), button=1),
+            pygame.event.Event(pygame.KEYUP, key=pygame.K_a),
+            pygame.event.Event(pygame.MOUSEWHEEL, x=0, y=1),
+        ]
+        self.router = EventRouter()
+        self.router.update(self.events)
+
+    def test_buckets(self):
+        self.assertEqual(list(self.router), self.events)
+        self.assertEqual(self.router.mouse_up, [self.events[2]])
+        self.assertEqual(self.router.mouse_wheel, [self.events[4]])
+        self.assertEqual(self.router.key_down, [self.events[1]])
+        self.assertEqual(self.router.key_up, [self.events[3]])
+        self.assertEqual(self.router.keys, [self.events[1], self.events[3]])
+
+    def test_button_accepts_router(self):
+        button = Button(None, "b", 20, (50, 50), fd=(40, 40))
+        self.assertTrue(button.update(self.router))
+        self.router.update([])
+        self.assertFalse(button.update(self.router))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,61 @@
+import unittest
+
+from ..src.classes.FontCache import FontCache
+from ..src.classes.FontRegistry import FontRegistry
+from ..src.classes.Functions import get_fonts
+from ..src.classes.Label import Label
+
+
+class TestFontCache(unittest.TestCase):
+    def setUp(self):
+        FontCache.clear()
+        FontCache.set_max_size(64)
+
+    def test_hit_and_miss(self):
+        f1 = FontCache.get(None, 20)
+        f2 = FontCache.get(None, 20)
+        self.assertIs(f1, f2)
+        self.assertEqual(FontCache.get_stats()["hits"], 1)
+        self.assertEqual(FontCache.get_stats()["misses"], 1)
+
+    def test_style_is_part_of_key(self):
+        regular = FontCache.get(None, 20)
+        bold = FontCache.get(None, 20, bold=True)
+        self.assertIsNot(regular, bold)
+        self.assertTrue(bold.get_bold())
+        self.assertFalse(regular.get_bold())
+
+    def test_lru_eviction(self):
+        FontCache.set_max_size(2)
+        f1 = FontCache.get(None, 10)
+        FontCache.get(None, 11)
+        FontCache.get(None, 10)  # 10 is now the most recently used font
+        FontCache.get(None, 12)  # evicts 11
+        self.assertEqual(FontCache.get_stats()["size"], 2)
+        self.assertIs(FontCache.get(None, 10), f1)
+        misses = FontCache.get_stats()["misses"]
+        FontCache.get(None, 11)
+        self.assertEqual(FontCache.get_stats()["misses"], misses + 1)
+
+    def test_label_uses_cache(self):
+        label = Label(None, "a", 20, (0, 0))
+        misses = FontCache.get_stats()["misses"]
+        label.update_text("b")
+        label.update_text("c")
+        self.assertEqual(FontCache.get_stats()["misses"], misses)
+
+
+class TestFontRegistry(unittest.TestCase):
+    def test_bundled_fonts(self):
+        fonts = get_fonts()
+        self.assertIn("consola", fonts)
+        self.assertNotIn("__init__.py", fonts)
+        self.assertTrue(FontRegistry.resolve("Consola").endswith("consola.ttf"))
+
+    def test_resolve_is_memoized(self):
+        path = FontRegistry.resolve("verdana")
+        self.assertEqual(FontRegistry.resolve("VERDANA"), path)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,56 @@
+import unittest
+
+
+from ..src.classes.FontCache import FontCache
+from ..src.classes.FontRegistry import FontRegistry
+from ..src.classes.GlyphAtlas import GlyphAtlas
+from ..src.classes.Label import Label
+
+
+class TestGlyphAtlas(unittest.TestCase):
+    def setUp(self):
+        GlyphAtlas.clear()
+
+    def test_digits_match_font_render(self):
+        for name in ("consola", "verdana", "arial"):
+            font_key = (FontRegistry.resolve(name), 24, False, False, False, "left")
+            font = FontCache.get(*font_key)
+            atlas = GlyphAtlas.get(font, font_key, (255, 255, 255), True)
+            for text in ("0", "1234567890", "98.6", ""):
+                expected = font.render(text, True, (255, 255, 255))
+                surface = atlas.render(text)
+                self.assertEqual(surface.get_size(), expected.get_size(), name)
+                if name == "consola":
+                    for x in range(surface.get_width()):
+                        for y in range(surface.get_height()):
+                            self.assertEqual(
+                                surface.get_at((x, y)).a, expected.get_at((x, y)).a
+                            )
+
+    def test_buffer_is_reused(self):
+        font_key = (FontRegistry.resolve("consola"), 20, False, False, False, "left")
+        font = FontCache.get(*font_key)
+        atlas = GlyphAtlas.get(font, font_key, (0, 0, 0), True)
+        self.assertIs(GlyphAtlas.get(font, font_key, (0, 0, 0), True), atlas)
+        buffer = atlas.render("100").get_parent()
+        self.assertIs(atlas.render("99", buffer).get_parent(), buffer)
+        self.assertIsNot(atlas.render("1" * 50, buffer).get_parent(), buffer)
+
+    def test_label(self):
+        label = Label(None, "0", 20, (0, 0), font="consola", ga=True)
+        buffer = label.text_surface.get_parent()
+        for i in range(100):
+            label.update_text(i)
+        self.assertIs(label.text_surface.get_parent(), buffer)
+        plain = Label(None, "99", 20, (0, 0), font="consola")
+        self.assertEqual(label.text_rect, plain.text_rect)
+        # multiline texts are rendered regularly
+        label.update_text("a\nb")
+        self.assertEqual(
+            label.text_rect.size,
+            Label(None, "a\nb", 20, (0, 0), font="consola").text_rect.size,
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,47 @@
+import unittest
+
+import pygame
+
+from ..src.classes.EventRouter import EventRouter
+from ..src.classes.Keyboard import Keyboard
+
+
+def text(string: str) -> pygame.event.Event:
+    return pygame.event.Event(pygame.TEXTINPUT, text=string)
+
+
+def key(key: int, mod: int = 0) -> pygame.event.Event:
+    return pygame.event.Event(pygame.KEYDOWN, key=key, mod=mod)
+
+
+class TestKeyboard(unittest.TestCase):
+    def test_text_input(self):
+        keyboard = Keyboard(text_input=True)
+        keyboard.set_forbidden_characters(["\t", "ß"])
+        events = [text("Grüße"), key(pygame.K_a), text("\t日本"), text("@")]
+        self.assertEqual(keyboard.get(events), "Grüe日本@")
+        router = EventRouter()
+        router.update(events)
+        self.assertEqual(keyboard.get(router), "Grüe日本@")
+
+    def test_keys(self):
+        keyboard = Keyboard()
+        keyboard.set_forbidden_characters(["b"])
+        events = [
+            key(pygame.K_a),
+            key(pygame.K_b),
+            key(pygame.K_c, pygame.KMOD_LCTRL),
+            text("x"),
+            key(pygame.K_1),
+        ]
+        self.assertEqual(keyboard.get(events), "a1")
+
+    def test_filter(self):
+        keyboard = Keyboard()
+        keyboard.set_forbidden_characters(list("<>:"))
+        keyboard.set_forbidden_characters([":", "|"])
+        self.assertEqual(keyboard.filter("a<b>c:d|e"), "abcde")
+
+
+if __name__ == "__main__":
+    unittest.main()
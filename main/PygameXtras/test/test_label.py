@@ -0,0 +1,185 @@
+import unittest
+from unittest import mock
+
+import pygame
+
+from ..src.classes.Button import Button
+from ..src.classes.Entry import Entry
+from ..src.classes.Label import Label
+
+
+def render(baked: bool, touching: bool = False, **kwargs) -> bytes:
+    surface = pygame.Surface((300, 200))
+    surface.fill((30, 60, 90))
+    button = Button(surface, "Hello", 24, (150, 100), baked=baked, **kwargs)
+    button.__is_touching__ = touching
+    button.draw()
+    return pygame.image.tobytes(surface, "RGB")
+
+
+class TestBakedLabel(unittest.TestCase):
+    def test_baked_matches_regular_drawing(self):
+        for kwargs in (
+            {},
+            {"bgc": (200, 0, 0), "bw": 3, "br": 10},
+            {"bw": 2, "fd": (40, 20), "to": (5, 5)},
+            {"bgc": "red", "m": 3, "xad": 5, "yad": 5, "bw": 1},
+        ):
+            self.assertEqual(render(False, **kwargs), render(True, **kwargs))
+
+    def test_baked_highlight(self):
+        kwargs = {"bgc": (200, 0, 0), "bw": 3, "br": 10, "hl": True}
+        self.assertEqual(
+            render(False, touching=True, **kwargs),
+            render(True, touching=True, **kwargs),
+        )
+
+    def test_rounded_corners(self):
+        for kwargs in (
+            {"bgc": (200, 0, 0), "br": 6},
+            {"bgc": (200, 0, 0), "bw": 3, "br": 12, "fd": (140, 50)},
+            {
+                "bgc": (0, 0, 90),
+                "bw": 2,
+                "br": (4, 10, 0, 14),
+                "fd": (120, 50),
+                "hl": True,
+            },
+        ):
+            button = Button(None, "Hello", 24, (0, 0), bk=True, **kwargs)
+            self.assertIsNotNone(button.__baked_surface__)
+            if "hl" in kwargs:
+                self.assertIsNotNone(button.__baked_hl_surface__)
+            for touching in (False, True) if "hl" in kwargs else (False,):
+                self.assertEqual(
+                    render(False, touching, **kwargs), render(True, touching, **kwargs)
+                )
+
+    def test_rounded_corners_fall_back(self):
+        # the antialiased text lies on the transparent corners
+        kwargs = {"bgc": (200, 0, 0), "br": 30}
+        button = Button(None, "Hello", 24, (0, 0), bk=True, **kwargs)
+        self.assertIsNone(button.__baked_surface__)
+        self.assertEqual(render(False, **kwargs), render(True, **kwargs))
+
+    def test_translucent_image(self):
+        image = pygame.Surface((120, 40), pygame.SRCALPHA)
+        image.fill((255, 255, 0, 100))
+        for kwargs in (
+            {"img": image, "tc": (250, 250, 250)},
+            {"img": image, "tc": (250, 250, 250), "bgc": (0, 90, 0), "br": 0},
+            {"img": image, "tc": (250, 250, 250), "bgc": (0, 90, 0), "hl": True},
+        ):
+            for touching in (False, True):
+                self.assertEqual(
+                    render(False, touching, **kwargs), render(True, touching, **kwargs)
+                )
+
+    def test_bake_is_refreshed(self):
+        button = Button(None, "Hello", 24, (0, 0), bk=True, bw=1, bgc=(0, 0, 90), br=0)
+        baked = button.__baked_surface__
+        self.assertIsNotNone(baked)
+        button.update_colors(bordercolor=(255, 0, 0))
+        self.assertIsNot(button.__baked_surface__, baked)
+        baked = button.__baked_surface__
+        button.update_pos((50, 50))
+        self.assertIs(button.__baked_surface__, baked)
+
+
+class TestLabelKeywords(unittest.TestCase):
+    def test_long_form_is_preferred(self):
+        label = Label(None, "a", 20, (0, 0), tc=(1, 1, 1), textcolor=(2, 2, 2))
+        self.assertEqual(label.textcolor, (2, 2, 2))
+        label = Label(None, "a", 20, (0, 0), textcolor=None, tc=(1, 1, 1))
+        self.assertEqual(label.textcolor, (1, 1, 1))
+
+    def test_unknown_keyword(self):
+        with self.assertRaises(ValueError):
+            Label(None, "a", 20, (0, 0), unknown=1)
+
+    def test_template(self):
+        template = {"textcolor": (1, 1, 1), "bw": 3, "twe": "ignored"}
+        label = Label(None, "a", 20, (0, 0), t=template, tc=(2, 2, 2))
+        self.assertEqual(label.textcolor, (2, 2, 2))
+        self.assertEqual(label.borderwidth, 3)
+        template["bw"] = 4
+        self.assertEqual(Label(None, "a", 20, (0, 0), t=template).borderwidth, 4)
+
+    def test_entry_keywords(self):
+        entry = Entry(None, "", 20, (0, 0), twe="empty", ast=True, max=3, si="int")
+        self.assertEqual(entry.text, "empty")
+        self.assertEqual(entry.max_chars, 3)
+        with self.assertRaises(ValueError):
+            Button(None, "a", 20, (0, 0), twe="empty")
+
+
+class TestLabelPosition(unittest.TestCase):
+    def test_derived_positions(self):
+        label = Label(None, "a", 20, (10, 10), "topleft", fd=(50, 20), m=2)
+        label.update_pos((100, 100), "center")
+        self.assertIs(label.rect, label.positioning_rect)
+        self.assertEqual(label.center, (100, 100))
+        self.assertEqual(label.topleft, (75, 90))
+        self.assertEqual(label.bottom, 110)
+        self.assertEqual(label.x_range, (77, 123))
+        self.assertEqual(label.y_range, (92, 108))
+
+    def test_assigning_positions_moves_the_widget(self):
+        label = Label(None, "a", 20, (10, 10), "center", fd=(50, 20), to=(2, 1))
+        text_offset = label.text_rect.x - label.background_rect.x
+        label.topleft = (100, 50)
+        self.assertEqual(label.rect.topleft, (100, 50))
+        self.assertEqual(label.center, (125, 60))
+        self.assertEqual(label.text_rect.x - label.background_rect.x, text_offset)
+        label.right = 300
+        self.assertEqual((label.right, label.top), (300, 50))
+        label.bottom = 0
+        self.assertEqual((label.right, label.bottom), (300, 0))
+        label.midbottom = (0, 0)
+        self.assertEqual(label.midbottom, (0, 0))
+        label.rect = pygame.Rect(5, 6, 1, 1)
+        self.assertEqual(label.rect, pygame.Rect(5, 6, 50, 20))
+        self.assertEqual(label.anchor, "center")
+        self.assertEqual(tuple(label.xy), label.center)
+
+    def test_move_matches_update_pos(self):
+        for anchor in ("topleft", "center", "bottomright", "midtop"):
+            moved = Label(None, "ab", 21, (10, 10), anchor, xad=3, to=(2, 1))
+            placed = Label(None, "ab", 21, (10, 10), anchor, xad=3, to=(2, 1))
+            moved.move_by(7.5, -3)
+            moved.move_by(0.25, 0.5)
+            placed.update_pos((17.75, 7.5))
+            for name in ("positioning_rect", "background_rect", "text_rect"):
+                self.assertEqual(getattr(moved, name), getattr(placed, name))
+
+    def test_move_many(self):
+        labels = [Label(None, str(i), 20, (0, 20 * i), "topleft") for i in range(5)]
+        Label.move_many(labels, 0, -10)
+        self.assertEqual([l.top for l in labels], [-10, 10, 30, 50, 70])
+
+
+class TestLabelUpdate(unittest.TestCase):
+    def test_changes_are_batched(self):
+        label = Label(None, "a", 20, (0, 0), "topleft")
+        with mock.patch.object(label, "__create__", wraps=label.__create__) as create:
+            label.begin_update()
+            label.update_text("abc")
+            label.begin_update()
+            label.update_colors(textcolor=(255, 0, 0))
+            label.end_update()
+            label.set_style(bold=True)
+            self.assertEqual(create.call_count, 0)
+            label.end_update()
+            self.assertEqual(create.call_count, 1)
+        self.assertEqual(
+            label.rect, Label(None, "abc", 20, (0, 0), "topleft", bo=True).rect
+        )
+
+    def test_unbalanced_end_update(self):
+        label = Label(None, "a", 20, (0, 0))
+        with self.assertRaises(AssertionError):
+            label.end_update()
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,86 @@
+import unittest
+
+import pygame
+
+from ..src.classes.Paragraph import Paragraph
+
+TEXT = "Hello world\nthe second line is longer\n\nend"
+
+
+def render(
+    composed: bool, text: str = TEXT, xy: tuple = (200, 150), **kwargs
+) -> tuple[bytes, pygame.Rect]:
+    surface = pygame.Surface((400, 300))
+    surface.fill((10, 20, 30))
+    paragraph = Paragraph(surface, text, 20, xy, cp=composed, **kwargs)
+    paragraph.draw()
+    return pygame.image.tobytes(surface, "RGB"), paragraph.rect
+
+
+class TestComposedParagraph(unittest.TestCase):
+    def test_composed_matches_labels(self):
+        for kwargs in (
+            {},
+            {"bgc": (200, 0, 0), "bw": 2, "bc": (0, 255, 0)},
+            {"bgc": (0, 0, 200), "xad": 5, "yad": 3, "m": 2, "tb": "midleft"},
+            {"fw": 120, "bw": 1, "br": 5, "tc": (255, 255, 0), "to": (3, 2)},
+        ):
+            self.assertEqual(render(False, **kwargs), render(True, **kwargs))
+
+    def test_update_colors(self):
+        paragraph = Paragraph(None, TEXT, 20, (0, 0), cp=True, bw=1)
+        surface = paragraph.__surface__
+        paragraph.update_colors(bordercolor=(255, 0, 0))
+        self.assertIsNot(paragraph.__surface__, surface)
+        self.assertEqual(paragraph.__bordercolor__, (255, 0, 0))
+
+
+class TestParagraphRelayout(unittest.TestCase):
+    def assert_same_drawing(self, paragraph: Paragraph, **kwargs):
+        surface = pygame.Surface((400, 300))
+        surface.fill((10, 20, 30))
+        paragraph.surface = surface
+        for label in paragraph.__labels__:
+            label.surface = surface
+        paragraph.draw()
+        expected, rect = render(
+            paragraph.composed, paragraph.text, paragraph.xy, **kwargs
+        )
+        self.assertEqual(paragraph.rect, rect)
+        self.assertEqual(pygame.image.tobytes(surface, "RGB"), expected)
+
+    def test_update_text(self):
+        for composed in (False, True):
+            for kwargs in ({}, {"bgc": (0, 0, 200), "bw": 2, "br": 4, "to": (0, 9)}):
+                paragraph = Paragraph(None, TEXT, 20, (200, 150), cp=composed, **kwargs)
+                for text in (
+                    "Hello world\nthe second line is longer\n\nchanged",
+                    "a\nHello world\nthe second line is longer",
+                    "Hello world\nshort\nthe second line is longer",
+                    "Hello world",
+                ):
+                    paragraph.update_text(text)
+                    self.assert_same_drawing(paragraph, **kwargs)
+                # unchanged lines are not rendered again (if the size is the same)
+                paragraph.update_text(TEXT)
+                items = list(paragraph.__items__)
+                paragraph.update_text(TEXT.replace("end", "the end"))
+                self.assertEqual(paragraph.__items__[:3], items[:3])
+
+    def test_append_line(self):
+        for composed in (False, True):
+            for kwargs in ({}, {"bgc": (0, 0, 200), "bw": 2, "br": 4, "m": 1}):
+                paragraph = Paragraph(
+                    None, "first", 20, (200, 10), cp=composed, **kwargs
+                )
+                for line in ("second", "", "a much longer line", "x", "y\nz"):
+                    paragraph.append_line(line)
+                    self.assert_same_drawing(paragraph, **kwargs)
+                items = list(paragraph.__items__)
+                paragraph.append_line("last")
+                self.assertEqual(paragraph.__items__[:-1], items)
+                self.assertEqual(paragraph.text.split("\n")[-2:], ["z", "last"])
+
+
+if __name__ == "__main__":
+    unittest.main()
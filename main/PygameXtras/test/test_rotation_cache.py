@@ -0,0 +1,60 @@
+import unittest
+
+import pygame
+
+from ..src.classes.RotationCache import RotationCache
+from .test_entity import Dummy, create_frames
+
+
+class TestRotationCache(unittest.TestCase):
+    def setUp(self):
+        RotationCache.clear()
+        RotationCache.set_max_bytes(32 * 1024 * 1024)
+
+    def test_rotate(self):
+        image = pygame.Surface((10, 20))
+        rotated = RotationCache.rotate(image, 90)
+        self.assertEqual(rotated.get_size(), (20, 10))
+        self.assertIs(RotationCache.rotate(image, 450), rotated)
+        self.assertIs(RotationCache.rotate(image, 0), image)
+        stats = RotationCache.get_stats()
+        self.assertEqual((stats["hits"], stats["misses"]), (1, 1))
+
+    def test_byte_limit(self):
+        image = pygame.Surface((10, 10))
+        RotationCache.rotate(image, 45)
+        RotationCache.set_max_bytes(RotationCache.get_stats()["bytes"])
+        RotationCache.rotate(image, 30)
+        stats = RotationCache.get_stats()
+        self.assertLessEqual(stats["bytes"], stats["max_bytes"])
+        self.assertEqual(stats["size"], 1)
+
+    def test_entities_share_rotated_frames(self):
+        frames = create_frames(2)
+        entities = [Dummy() for _ in range(3)]
+        for entity in entities:
+            entity.add_action("spin", frames, 1)
+            entity.set_looping_action("spin")
+            entity.set_rotation_step(15)
+        for angle in range(0, 90, 3):
+            for entity in entities:
+                entity.set_rotation(angle)
+                entity.internal_update()
+        stats = RotationCache.get_stats()
+        # 0, 15, 30, 45, 60, 75 and 90 degrees for both frames, 0 is not cached
+        self.assertLessEqual(stats["misses"], 12)
+        self.assertIs(entities[0].image, entities[1].image)
+
+    def test_direction(self):
+        entity = Dummy()
+        image = entity.__actions__["idle"]["images"][0]["left"]
+        entity.set_rotation(30)
+        entity.set_automatic_direction_control(False)
+        entity.set_direction("left")
+        entity.internal_update()
+        self.assertIs(entity.image, RotationCache.rotate(image, -30))
+        self.assertEqual(entity.image.get_size(), entity.rect.size)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,119 @@
+import unittest
+
+import pygame
+
+from ..src.classes.ScrollableButtonList import ScrollableButtonList
+
+
+def wheel(y: int) -> list:
+    return [pygame.event.Event(pygame.MOUSEWHEEL, x=0, y=y)]
+
+
+def create(count: int, **kwargs) -> ScrollableButtonList:
+    sbl = ScrollableButtonList(pygame.Surface((300, 300)), (50, 50, 200, 200), 7)
+    sbl.set_button_style(20, bgc=(80, 80, 80), bw=2, **kwargs)
+    sbl.set_buttons([f"item {i}" for i in range(count)])
+    sbl.update([])
+    return sbl
+
+
+class TestVirtualizedRows(unittest.TestCase):
+    def assert_rows(self, sbl: ScrollableButtonList):
+        # every button is at the position it would have without virtualization
+        pitch = sbl.__row_height__
+        offset = sbl.get_offset()
+        for button in sbl.get_buttons():
+            row = int(button.text.split()[1])
+            self.assertEqual(
+                button.rect.top + offset[1], 50 + row * pitch - sbl.__get_scroll__()
+            )
+        visible = [
+            b.rect.move(offset).colliderect(sbl.get_rect()) for b in sbl.get_buttons()
+        ]
+        self.assertTrue(any(visible))
+
+    def test_only_visible_rows_are_created(self):
+        sbl = create(5000)
+        created = set(map(id, sbl.get_buttons()))
+        self.assertLess(len(created), 20)
+        for _ in range(200):
+            sbl.update(wheel(-3))
+            self.assert_rows(sbl)
+            created.update(map(id, sbl.get_buttons()))
+        sbl.update(wheel(100))
+        self.assert_rows(sbl)
+        # buttons are reused while scrolling
+        self.assertLess(len(created), 20)
+
+    def test_scroll_extents(self):
+        sbl = create(5000)
+        button = sbl.get_buttons()[0]
+        lowest = 5000 * sbl.__row_height__ + button.borderwidth
+        sbl.update(wheel(-100000))
+        self.assertEqual(sbl.__get_scroll__(), lowest - 200)
+        self.assert_rows(sbl)
+        self.assertEqual(sbl.get_buttons()[-1].text, "item 4999")
+
+        sbl.set_buttons(["a", "b"])
+        sbl.update([])
+        self.assertEqual(sbl.__get_scroll__(), 0)
+        self.assertEqual([b.text for b in sbl.get_buttons()], ["a", "b"])
+
+    def test_set_buttons_reuses_buttons(self):
+        sbl = create(100)
+        sbl.update(wheel(-10))
+        before = {b.text: b for b in sbl.get_buttons()}
+        names = [f"item {i}" for i in range(100) if i != 8]
+        sbl.set_buttons(["new"] + names)
+        sbl.update([])
+        after = {b.text: b for b in sbl.get_buttons()}
+        for name in before.keys() & after.keys():
+            self.assertIs(after[name], before[name])
+        self.assertEqual(
+            [b.text for b in sbl.get_buttons()],
+            (["new"] + names)[sbl.__window__[0] : sbl.__window__[1]],
+        )
+
+
+class TestRetainedSurface(unittest.TestCase):
+    def assert_up_to_date(self, sbl: ScrollableButtonList):
+        sbl.draw()
+        retained = pygame.image.tobytes(sbl.__main_surface__, "RGB")
+        sbl.__painted_window__ = None  # forces a full repaint
+        sbl.draw()
+        self.assertEqual(retained, pygame.image.tobytes(sbl.__main_surface__, "RGB"))
+
+    def test_repaint(self):
+        sbl = create(50, hl=True, br=3)
+        self.assert_up_to_date(sbl)
+        for index in (0, 1, 5, 1):
+            for i, button in enumerate(sbl.get_buttons()):
+                button.__is_touching__ = i == index
+            self.assert_up_to_date(sbl)
+        sbl.update(wheel(-2))
+        self.assert_up_to_date(sbl)
+        sbl.get_buttons()[3].update_text("changed")
+        self.assert_up_to_date(sbl)
+        sbl.set_buttons([f"item {i}" for i in range(50) if i != 4])
+        sbl.update([])
+        self.assert_up_to_date(sbl)
+        sbl.set_buttons(["a"])
+        sbl.update([])
+        self.assert_up_to_date(sbl)
+
+    def test_unchanged_rows_are_not_redrawn(self):
+        sbl = create(50, hl=True)
+        sbl.draw()
+        sbl.get_buttons()[2].__is_touching__ = True
+        drawn = []
+        for button in sbl.get_buttons():
+            button.draw_to = lambda surface, b=button: drawn.append(b.text)
+        sbl.draw()
+        self.assertEqual(drawn, ["item 1", "item 2", "item 3"])
+        drawn.clear()
+        sbl.draw()
+        self.assertEqual(drawn, [])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,42 @@
+import unittest
+
+from ..src.classes.Label import Label
+from ..src.classes.TextCache import TextCache
+
+
+class TestTextCache(unittest.TestCase):
+    def setUp(self):
+        TextCache.clear()
+        TextCache.set_max_bytes(16 * 1024 * 1024)
+
+    def test_toggle_reuses_surface(self):
+        label = Label(None, "Pause", 20, (0, 0), ct=True)
+        pause = label.text_surface
+        label.update_text("Resume")
+        label.update_text("Pause")
+        self.assertIs(label.text_surface, pause)
+        stats = TextCache.get_stats()
+        self.assertEqual(stats["misses"], 2)
+        self.assertEqual(stats["hits"], 1)
+
+    def test_color_is_part_of_key(self):
+        label = Label(None, "a", 20, (0, 0), ct=True)
+        black = label.text_surface
+        label.update_colors(textcolor=(255, 0, 0))
+        self.assertIsNot(label.text_surface, black)
+
+    def test_opt_in(self):
+        Label(None, "a", 20, (0, 0))
+        self.assertEqual(TextCache.get_stats()["size"], 0)
+
+    def test_byte_limit(self):
+        label = Label(None, "a", 20, (0, 0), ct=True)
+        TextCache.set_max_bytes(TextCache.get_stats()["bytes"])
+        label.update_text("b")
+        stats = TextCache.get_stats()
+        self.assertLessEqual(stats["bytes"], stats["max_bytes"])
+        self.assertEqual(stats["size"], 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
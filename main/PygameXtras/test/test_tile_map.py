@@ -0,0 +1,86 @@
+import unittest
+
+import pygame
+
+from ..src.classes.Entity import Entity
+from ..src.classes.TileMap import TileMap
+
+SIDE = 10
+
+
+def create_tiles(solid: list[tuple[int, int]], size: int = 20) -> list[list]:
+    tiles = [[0] * size for _ in range(size)]
+    for x, y in solid:
+        tiles[x][y] = pygame.Rect(x * SIDE, y * SIDE, SIDE, SIDE)
+    return tiles
+
+
+class Box(Entity):
+    def __init__(self, size: tuple = (8, 8)):
+        self.image = pygame.Surface(size)
+        self.rect = self.image.get_rect()
+        super().__init__()
+        self.add_action("idle", [{"left": self.image, "right": self.image}], 1)
+        self.set_looping_action("idle")
+        self.set_speed(1)
+        self.set_tile_collision(True, SIDE)
+
+
+class TestTileMap(unittest.TestCase):
+    def test_get_tiles(self):
+        tile_map = TileMap(create_tiles([(2, 2), (3, 2), (9, 9)]), SIDE)
+        self.assertEqual(
+            tile_map.get_tiles(pygame.Rect(15, 15, 10, 10)),
+            [pygame.Rect(20, 20, 10, 10)],
+        )
+        self.assertEqual(len(tile_map.get_tiles(pygame.Rect(0, 0, 200, 200))), 3)
+        self.assertEqual(tile_map.get_tiles(pygame.Rect(-50, -50, 20, 20)), [])
+        self.assertIsNone(tile_map.get_tile(0, 0))
+        self.assertIsNone(tile_map.get_tile(-1, 50))
+        self.assertEqual(tile_map.get_tile(9, 9), pygame.Rect(90, 90, 10, 10))
+
+
+class TestEntityTileCollision(unittest.TestCase):
+    def test_wall_stops_entity(self):
+        box = Box()
+        box.set_game_map_tiles(create_tiles([(5, y) for y in range(20)]))
+        box.set_pos((20, 21), "topleft")
+        box.move_right(15)
+        box.internal_update()
+        self.assertEqual(box.rect.right, 43)
+        box.move_right(15)
+        box.internal_update()
+        self.assertEqual(box.rect.right, 50)
+
+    def test_fast_entity_does_not_pass_walls(self):
+        box = Box()
+        tile_map = TileMap(create_tiles([(12, 3), (15, 3), (1, 3)]), SIDE)
+        box.set_game_map_tiles(tile_map)
+        box.set_pos((30, 31), "topleft")
+        box.move_right(150)
+        box.internal_update()
+        self.assertEqual(box.rect.right, 120)
+        box.move_left(150)
+        box.internal_update()
+        self.assertEqual(box.rect.left, 20)
+
+    def test_falling(self):
+        box = Box()
+        box.set_game_map_tiles(create_tiles([(x, 15) for x in range(20)]))
+        box.set_pos((41, 0), "topleft")
+        box.move_down(400)
+        box.internal_update()
+        self.assertEqual(box.rect.bottom, 150)
+
+    def test_temp_collision_rects(self):
+        box = Box()
+        box.set_game_map_tiles(create_tiles([]))
+        box.set_pos((0, 0), "topleft")
+        box.add_temp_collision_rects([pygame.Rect(50, 0, 5, 5)])
+        box.move_right(100)
+        box.internal_update()
+        self.assertEqual(box.rect.right, 50)
+
+
+if __name__ == "__main__":
+    unittest.main()
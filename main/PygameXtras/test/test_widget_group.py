@@ -0,0 +1,59 @@
+import unittest
+
+import pygame
+
+from ..src.classes.Bar import Bar
+from ..src.classes.Button import Button
+from ..src.classes.Label import Label
+from ..src.classes.WidgetGroup import WidgetGroup
+
+
+class TestWidgetGroup(unittest.TestCase):
+    def setUp(self):
+        self.screen = pygame.Surface((400, 300))
+        self.group = WidgetGroup(self.screen, (20, 20, 20))
+        self.label = Label(self.screen, "Score: 0", 20, (10, 10), "topleft")
+        self.button = Button(
+            self.screen, "Play", 20, (200, 150), bgc=(0, 0, 200), hl=True
+        )
+        self.bar = Bar(self.screen, (100, 20), (200, 250))
+        self.group.add(self.label, self.button, self.bar)
+
+    def test_first_draw_is_full(self):
+        self.assertEqual(self.group.draw(), [self.screen.get_rect()])
+
+    def test_static_frame_is_clean(self):
+        self.group.draw()
+        self.assertEqual(self.group.draw(), [])
+
+    def test_text_change(self):
+        self.group.draw()
+        self.label.update_text("Score: 100")
+        dirty = self.group.draw()
+        self.assertEqual(len(dirty), 1)
+        self.assertTrue(dirty[0].contains(self.label.rect))
+
+    def test_move_restores_background(self):
+        self.group.draw()
+        old_rect = self.button.background_rect.copy()
+        self.button.update_pos((300, 50))
+        dirty = self.group.draw()
+        self.assertTrue(any(r.contains(old_rect) for r in dirty))
+        self.assertEqual(self.screen.get_at(old_rect.center)[:3], (20, 20, 20))
+
+    def test_hover_and_bar(self):
+        self.group.draw()
+        self.button.__is_touching__ = True
+        self.bar.update(1, 2)
+        self.assertEqual(len(self.group.draw()), 2)
+
+    def test_remove(self):
+        self.group.draw()
+        rect = self.button.background_rect.copy()
+        self.group.remove(self.button)
+        self.assertEqual(self.group.draw(), [rect])
+        self.assertEqual(self.screen.get_at(rect.center)[:3], (20, 20, 20))
+
+
+if __name__ == "__main__":
+    unittest.main()